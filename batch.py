@@ -0,0 +1,277 @@
+"""
+GUI 없이 여러 이미지에 필터/도구 체인을 일괄 적용하는 명령행 도구
+
+사용 예:
+    python batch.py "사진/*.jpg" -o 결과 -c grayscale,sharpen
+    python batch.py 스캔원본 -o 스캔결과 -c scan --workers 4 --resume
+
+Qt를 전혀 불러오지 않으므로 서버 등 화면이 없는 환경에서도 실행할 수 있습니다.
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import cv2
+import numpy as np
+
+from features.filters import (
+    GrayscaleFilter, BlurFilter, SharpenFilter, EdgeFilter, BrightnessFilter, ContrastFilter,
+    SepiaFilter, CartoonFilter, SketchFilter, MorphologyFilter, MosaicFilter, FilterChain,
+    ColorQuantizer
+)
+from features.document_scanner import DocumentScanner
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+class QuantizeOperation:
+    """ColorQuantizer를 필터 체인에서 사용하기 위한 래퍼 (8색)"""
+    halo = None
+
+    def __init__(self, k=8):
+        self.quantizer = ColorQuantizer(k=k)
+
+    def apply(self, image):
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+        return self.quantizer.quantize(image)
+
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.webp')
+
+# 명령행에서 사용할 수 있는 필터/도구 이름
+OPERATIONS = {
+    'grayscale': GrayscaleFilter,
+    'blur': BlurFilter,
+    'sharpen': SharpenFilter,
+    'edge': lambda: EdgeFilter('canny'),
+    'edge-sobel': lambda: EdgeFilter('sobel'),
+    'edge-laplacian': lambda: EdgeFilter('laplacian'),
+    'edge-prewitt': lambda: EdgeFilter('prewitt'),
+    'brightness': BrightnessFilter,
+    'contrast': ContrastFilter,
+    'sepia': SepiaFilter,
+    'cartoon': CartoonFilter,
+    'sketch': SketchFilter,
+    'mosaic': MosaicFilter,
+    'dilate': lambda: MorphologyFilter('dilate'),
+    'erode': lambda: MorphologyFilter('erode'),
+    'opening': lambda: MorphologyFilter('opening'),
+    'closing': lambda: MorphologyFilter('closing'),
+    'quantize': QuantizeOperation,
+    'scan': DocumentScanner,
+}
+
+# 완료된 입력 파일 목록 (중단 후 --resume 으로 이어서 처리할 때 사용)
+# 한 줄에 "체인<TAB>출력 확장자<TAB>입력 절대 경로" - 체인이나 확장자가 다르면 완료로 보지 않음
+JOURNAL_NAME = '.batch_done'
+
+# 작업 프로세스마다 한 번만 만드는 필터 체인
+worker_chain = None
+
+
+def build_chain(names):
+    return FilterChain(OPERATIONS[name]() for name in names)
+
+
+def init_worker(names):
+    global worker_chain
+    # 프로세스 여러 개가 각자 OpenCV 스레드를 늘리지 않도록 제한
+    cv2.setNumThreads(1)
+    worker_chain = build_chain(names)
+    worker_chain.compile()
+
+
+def peak_memory_mb(who='self'):
+    """현재 프로세스('self') 또는 종료된 자식 프로세스('children')의 최대 메모리(MB), 측정할 수 없으면 None"""
+    if resource is None:
+        return None
+    target = resource.RUSAGE_SELF if who == 'self' else resource.RUSAGE_CHILDREN
+    peak = resource.getrusage(target).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def process_file(src_path, dst_path):
+    """작업 프로세스에서 실행: 읽기 → 처리 → 저장 (이미지는 프로세스 사이로 복사하지 않음)"""
+    data = np.fromfile(src_path, dtype=np.uint8)  # 한글 경로 대응
+    image = cv2.imdecode(data, cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError(f"이미지를 읽을 수 없습니다: {src_path}")
+
+    # 편집기와 같은 RGB 순서로 처리
+    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    result = worker_chain.apply(image)
+    if result.ndim == 3:
+        result = cv2.cvtColor(result, cv2.COLOR_RGB2BGR)
+
+    ok, encoded = cv2.imencode(os.path.splitext(dst_path)[1], result)
+    if not ok:
+        raise ValueError(f"이미지를 저장할 수 없습니다: {dst_path}")
+    # 중단되어도 반쯤 쓰인 파일이 남지 않도록 임시 파일에 쓴 뒤 이름 변경
+    tmp_path = dst_path + '.tmp'
+    encoded.tofile(tmp_path)
+    os.replace(tmp_path, dst_path)
+    return src_path, peak_memory_mb('self')
+
+
+def pattern_root(pattern):
+    """glob 패턴에서 와일드카드가 나오기 전까지의 폴더 (예: 사진/*/a*.jpg → 사진)"""
+    parts = []
+    for part in os.path.normpath(pattern).split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    else:
+        # 와일드카드가 없는 파일 경로
+        parts = parts[:-1]
+    return os.sep.join(parts) or '.'
+
+
+def collect_inputs(patterns):
+    """파일, 폴더, glob 패턴을 (입력 경로, 출력용 상대 경로) 목록으로 변환"""
+    inputs = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = glob.glob(os.path.join(pattern, '**', '*'), recursive=True)
+            root = pattern
+        else:
+            candidates = glob.glob(pattern, recursive=True)
+            root = pattern_root(pattern)
+        # 패턴의 고정된 폴더 아래 구조를 그대로 유지 (다른 폴더의 같은 파일 이름이 겹치지 않도록)
+        for path in candidates:
+            if os.path.isfile(path) and path.lower().endswith(IMAGE_EXTENSIONS):
+                inputs.setdefault(path, os.path.relpath(path, root))
+    return sorted(inputs.items())
+
+
+def find_collisions(inputs, ext):
+    """출력 경로가 같은 입력 목록 (서로 다른 패턴의 a/x.jpg, b/x.jpg 등) - 같은 파일을 여러 작업자가 쓰지 않도록 확인"""
+    targets = {}
+    for src, relative_path in inputs:
+        base, src_ext = os.path.splitext(relative_path)
+        key = os.path.normcase(os.path.normpath(base + (ext or src_ext)))
+        targets.setdefault(key, []).append(src)
+    return [sources for sources in targets.values() if len(sources) > 1]
+
+
+def journal_key(chain, ext, src):
+    return f"{chain}\t{ext or ''}\t{os.path.abspath(src)}"
+
+
+def output_path(relative_path, output_dir, ext):
+    base, src_ext = os.path.splitext(relative_path)
+    path = os.path.join(output_dir, base + (ext or src_ext))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def load_journal(path):
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding='utf-8') as f:
+        return {line.rstrip('\n') for line in f if line.strip()}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="이미지 일괄 처리 (GUI 없음)")
+    parser.add_argument('inputs', nargs='+', help="입력 파일, 폴더 또는 glob 패턴")
+    parser.add_argument('-o', '--output', required=True, help="결과 저장 폴더")
+    parser.add_argument('-c', '--chain', required=True,
+                        help="쉼표로 구분한 필터/도구 이름: " + ', '.join(OPERATIONS))
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1,
+                        help="작업 프로세스 수")
+    parser.add_argument('--max-in-flight', type=int, default=None,
+                        help="동시에 처리 중인 최대 이미지 수 (기본: 작업 프로세스 수의 2배)")
+    parser.add_argument('--ext', default=None, help="출력 확장자 (예: .png, 기본은 입력과 같음)")
+    parser.add_argument('--resume', action='store_true', help="이전에 완료한 이미지는 건너뜀")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    names = [name.strip() for name in args.chain.split(',') if name.strip()]
+    unknown = [name for name in names if name not in OPERATIONS]
+    if unknown:
+        print(f"알 수 없는 필터/도구: {', '.join(unknown)}")
+        return 2
+
+    os.makedirs(args.output, exist_ok=True)
+    journal_path = os.path.join(args.output, JOURNAL_NAME)
+    done = load_journal(journal_path) if args.resume else set()
+    if not args.resume and os.path.exists(journal_path):
+        os.remove(journal_path)
+
+    chain = ','.join(names)
+    inputs = collect_inputs(args.inputs)
+    collisions = find_collisions(inputs, args.ext)
+    if collisions:
+        for sources in collisions:
+            print(f"출력 파일 이름이 겹칩니다: {', '.join(sources)}")
+        return 2
+    remaining = [(src, rel) for src, rel in inputs if journal_key(chain, args.ext, src) not in done]
+    skipped = len(inputs) - len(remaining)
+    inputs = remaining
+    print(f"처리할 이미지 {len(inputs)}장" + (f" (완료된 {skipped}장 건너뜀)" if skipped else ""))
+    if not inputs:
+        return 0
+
+    max_in_flight = args.max_in_flight or args.workers * 2
+    processed = failed = 0
+    worker_peak = 0.0
+    start = time.perf_counter()
+
+    with open(journal_path, 'a', encoding='utf-8') as journal, \
+            ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker,
+                                initargs=(names,)) as pool:
+        pending = set()
+        queue = iter(inputs)
+        try:
+            while True:
+                # 메모리가 무한히 늘지 않도록 처리 중인 이미지 수를 제한
+                while len(pending) < max_in_flight:
+                    item = next(queue, None)
+                    if item is None:
+                        break
+                    src, relative_path = item
+                    pending.add(pool.submit(process_file, src, output_path(relative_path, args.output, args.ext)))
+                if not pending:
+                    break
+
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    try:
+                        src, peak = future.result()
+                    except Exception as e:
+                        failed += 1
+                        print(f"실패: {e}")
+                        continue
+                    processed += 1
+                    worker_peak = max(worker_peak, peak or 0.0)
+                    journal.write(journal_key(chain, args.ext, src) + '\n')
+                    journal.flush()
+
+                elapsed = time.perf_counter() - start
+                print(f"\r{processed + failed}/{len(inputs)}  {processed / elapsed:.2f} 장/초", end='', flush=True)
+        except KeyboardInterrupt:
+            print("\n중단되었습니다. --resume 으로 이어서 처리할 수 있습니다.")
+            for future in pending:
+                future.cancel()
+            raise
+
+    elapsed = time.perf_counter() - start
+    print(f"\n완료 {processed}장, 실패 {failed}장, {elapsed:.1f}초, {processed / elapsed:.2f} 장/초")
+    main_peak = peak_memory_mb('self')
+    if main_peak is not None:
+        print(f"최대 메모리: 메인 {main_peak:.0f} MB, 작업 프로세스 {worker_peak:.0f} MB")
+    else:
+        print("최대 메모리: 이 운영체제에서는 측정할 수 없습니다.")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,462 @@
+"""
+필터/도구 전체 벤치마크
+
+테스트 이미지 폴더의 모든 이미지와 합성 4K/8K/24MP 이미지에 대해
+모든 필터(features/filters/, features/filters.py)와 도구(features/*_tool.py)의
+실행 시간, 메모리 할당(tracemalloc 최대값), 최대 RSS 증가량을 측정합니다.
+
+실행:
+    python benchmarks/benchmark_suite.py run --save benchmarks/baselines/기준.json
+    python benchmarks/benchmark_suite.py compare benchmarks/baselines/기준.json
+    python benchmarks/benchmark_suite.py compare 기준.json 최적화후.json --threshold 0.1
+    python benchmarks/benchmark_suite.py list
+
+옵션:
+    -k 문자열      이름에 문자열이 포함된 항목만 실행 (여러 번 지정 가능)
+    --datasets     test,4k,8k,24mp 중 일부만 실행
+    --repeat N     시간 측정 반복 횟수 (중앙값 사용)
+"""
+import os
+import sys
+import json
+import time
+import glob
+import platform
+import argparse
+import threading
+import statistics
+import tracemalloc
+import importlib.util
+from datetime import datetime
+import cv2
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from PyQt5.QtCore import QPoint
+from features import filters as filter_package
+from features.tools import PenTool, EraserTool, RectangleTool, CircleTool, SelectTool, PolygonTool, union_rect
+from features.selection_tools import SelectionTool
+from features.mosaic_tool import MosaicTool
+from features.scan_tool import ScanTool
+from features.panorama_tool import PanoramaTool
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+IMAGE_DIR = os.path.join(ROOT_DIR, '테스트 이미지 파일')
+BASELINE_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'baselines')
+
+# 합성 이미지 크기 (높이, 너비)
+SYNTHETIC_SIZES = {
+    '4k': (2160, 3840),
+    '8k': (4320, 7680),
+    '24mp': (4000, 6000),
+}
+
+# 도구 벤치마크에서 한 번의 드래그에 포함되는 마우스 이동 이벤트 수
+DRAG_STEPS = 60
+
+
+def load_legacy_filters():
+    """features/filters.py 는 같은 이름의 패키지에 가려지므로 파일 경로로 직접 불러옴"""
+    path = os.path.join(ROOT_DIR, 'features', 'filters.py')
+    spec = importlib.util.spec_from_file_location('features.legacy_filters', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+legacy = load_legacy_filters()
+
+
+class FilterCase:
+    """필터 하나를 이미지마다 적용"""
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+
+    def prepare(self):
+        self.filter_obj = self.factory()
+
+    def run(self, image):
+        return self.filter_obj.apply(image)
+
+
+class ToolCase:
+    """
+    도구로 이미지 가운데를 대각선으로 드래그
+    MainWindow처럼 이미지를 한 번만 복사한 뒤 이벤트마다 제자리에서 수정하고,
+    도구가 알려 준 변경 영역을 모아 둠 (last_region)
+    """
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+
+    def prepare(self):
+        self.tool = self.factory()
+
+    def run(self, image):
+        height, width = image.shape[:2]
+        xs = np.linspace(width * 0.2, width * 0.8, DRAG_STEPS + 1).astype(int)
+        ys = np.linspace(height * 0.2, height * 0.8, DRAG_STEPS + 1).astype(int)
+        image = image.copy()
+        self.last_region = None
+        events = [('on_press', xs[0], ys[0])] + [('on_move', x, y) for x, y in zip(xs[1:], ys[1:])]
+        events.append(('on_release', xs[-1], ys[-1]))
+        for method, x, y in events:
+            self.tool.dirty_rect = None
+            result = getattr(self.tool, method)(image, QPoint(int(x), int(y)))
+            region = self.tool.changed_region(result) if result is image else (0, 0, result.shape[1], result.shape[0])
+            self.last_region = union_rect(self.last_region, region)
+            image = result
+        return image
+
+
+class PanoramaCase:
+    """이미지를 겹치는 좌우 두 장으로 나누어 파노라마 합성"""
+    name = 'tools/PanoramaTool'
+
+    def prepare(self):
+        self.tool = PanoramaTool()
+
+    def run(self, image):
+        width = image.shape[1]
+        overlap = width // 5
+        left = image[:, :width // 2 + overlap]
+        right = image[:, width // 2 - overlap:]
+        return self.tool.create_panorama(left, right)
+
+
+def build_cases():
+    cases = []
+    p = filter_package
+    for name, factory in (
+            ('GrayscaleFilter', p.GrayscaleFilter),
+            ('BlurFilter', p.BlurFilter),
+            ('SharpenFilter', p.SharpenFilter),
+            ('EdgeFilter[canny]', lambda: p.EdgeFilter('canny')),
+            ('EdgeFilter[sobel]', lambda: p.EdgeFilter('sobel')),
+            ('EdgeFilter[laplacian]', lambda: p.EdgeFilter('laplacian')),
+            ('EdgeFilter[prewitt]', lambda: p.EdgeFilter('prewitt')),
+            ('BrightnessFilter', p.BrightnessFilter),
+            ('ContrastFilter', p.ContrastFilter),
+            ('SepiaFilter', p.SepiaFilter),
+            ('CartoonFilter', p.CartoonFilter),
+            ('SketchFilter', p.SketchFilter),
+            ('MorphologyFilter[dilate]', lambda: p.MorphologyFilter('dilate')),
+            ('MorphologyFilter[opening]', lambda: p.MorphologyFilter('opening')),
+            ('MosaicFilter', p.MosaicFilter),
+            ('FilterChain[brightness+contrast+sepia]',
+             lambda: p.FilterChain([p.BrightnessFilter(), p.ContrastFilter(), p.SepiaFilter()]))):
+        cases.append(FilterCase('filters/' + name, factory))
+
+    for name, factory in (
+            ('GrayscaleFilter', legacy.GrayscaleFilter),
+            ('BlurFilter', legacy.BlurFilter),
+            ('SharpenFilter', legacy.SharpenFilter),
+            ('EdgeFilter', legacy.EdgeFilter),
+            ('BrightnessFilter', legacy.BrightnessFilter),
+            ('ContrastFilter', legacy.ContrastFilter),
+            ('SepiaFilter', legacy.SepiaFilter),
+            ('CartoonFilter', legacy.CartoonFilter),
+            ('EmbossFilter', legacy.EmbossFilter),
+            ('WaterColorFilter', legacy.WaterColorFilter),
+            ('SketchFilter', legacy.SketchFilter),
+            ('SobelEdgeFilter', legacy.SobelEdgeFilter),
+            ('LaplacianEdgeFilter', legacy.LaplacianEdgeFilter),
+            ('ColorQuantizationFilter', legacy.ColorQuantizationFilter),
+            ('InpaintingFilter', legacy.InpaintingFilter),
+            ('StyleTransferFilter', legacy.StyleTransferFilter),
+            ('HDRFilter', legacy.HDRFilter),
+            ('DenoisingFilter', legacy.DenoisingFilter),
+            ('MorphologyFilter[closing]', lambda: legacy.MorphologyFilter('closing')),
+            ('PencilSketchFilter', legacy.PencilSketchFilter)):
+        cases.append(FilterCase('filters.py/' + name, factory))
+
+    for tool_class in (PenTool, EraserTool, RectangleTool, CircleTool, SelectTool,
+                       PolygonTool, SelectionTool, MosaicTool, ScanTool):
+        cases.append(ToolCase('tools/' + tool_class.__name__, tool_class))
+    cases.append(PanoramaCase())
+    return cases
+
+
+def load_test_images():
+    """테스트 이미지 폴더(하위 폴더 포함)의 이미지를 RGB로 읽습니다. (한글 경로 대응)"""
+    images = []
+    for path in sorted(glob.glob(os.path.join(IMAGE_DIR, '**', '*'), recursive=True)):
+        if not path.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp')):
+            continue
+        image = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if image is not None:
+            images.append(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+    return images
+
+
+def synthetic_image(height, width, seed=0):
+    """사진과 비슷하게 부드러운 그라데이션, 도형, 약한 노이즈가 섞인 합성 이미지"""
+    rng = np.random.default_rng(seed)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    x = np.linspace(0, 255, width, dtype=np.float32)[None, :]
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[..., 0] = x * 0.7 + y * 0.3
+    image[..., 1] = 255 - y
+    image[..., 2] = (x + y) * 0.5
+    # 문서 스캔 등이 찾을 수 있도록 밝은 사각형과 여러 도형 추가
+    cv2.rectangle(image, (width // 8, height // 8), (width * 7 // 8, height * 7 // 8), (235, 235, 235), -1)
+    for _ in range(40):
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        color = tuple(int(c) for c in rng.integers(0, 256, 3))
+        cv2.circle(image, center, int(rng.integers(10, max(11, width // 20))), color, -1)
+    noise = rng.integers(-8, 9, (height, width, 3), dtype=np.int16)
+    return np.clip(image + noise, 0, 255).astype(np.uint8)
+
+
+def load_datasets(names):
+    datasets = {}
+    for name in names:
+        if name == 'test':
+            datasets[name] = load_test_images()
+        else:
+            datasets[name] = [synthetic_image(*SYNTHETIC_SIZES[name])]
+    return datasets
+
+
+def current_rss():
+    """현재 프로세스의 RSS(바이트), 측정할 수 없으면 None"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class RssSampler:
+    """측정 구간 동안 RSS를 주기적으로 읽어 최대 증가량을 기록"""
+    def __init__(self, interval=0.002):
+        self.interval = interval
+        self.start_rss = None
+        self.peak_rss = None
+        self.stop_event = threading.Event()
+
+    def __enter__(self):
+        self.start_rss = self.peak_rss = current_rss()
+        if self.start_rss is not None:
+            self.thread = threading.Thread(target=self.sample, daemon=True)
+            self.thread.start()
+        return self
+
+    def sample(self):
+        while not self.stop_event.wait(self.interval):
+            self.peak_rss = max(self.peak_rss, current_rss())
+
+    def __exit__(self, *exc):
+        if self.start_rss is not None:
+            self.stop_event.set()
+            self.thread.join()
+            self.peak_rss = max(self.peak_rss, current_rss())
+
+    @property
+    def growth(self):
+        if self.start_rss is None:
+            return None
+        return self.peak_rss - self.start_rss
+
+
+def run_once(case, images):
+    for image in images:
+        case.run(image)
+
+
+def measure(case, images, repeat):
+    """
+    한 항목을 측정합니다.
+    1) 계측 없이 repeat 회 실행한 시간의 중앙값/최소값
+    2) tracemalloc과 RSS 샘플러를 켜고 한 번 더 실행하여 메모리 측정
+    """
+    case.prepare()
+    case.run(images[0])  # 워밍업 (모델/커널 초기화 등)
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_once(case, images)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    with RssSampler() as sampler:
+        run_once(case, images)
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rss_growth = sampler.growth
+    return {
+        'wall_ms': statistics.median(times) * 1000,
+        'wall_min_ms': min(times) * 1000,
+        'alloc_peak_mb': alloc_peak / 2**20,
+        'rss_peak_mb': rss_growth / 2**20 if rss_growth is not None else None,
+        'images': len(images),
+        'megapixels': sum(image.shape[0] * image.shape[1] for image in images) / 1e6,
+    }
+
+
+def environment():
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'opencv': cv2.__version__,
+        'opencv_threads': cv2.getNumThreads(),
+        'numpy': np.__version__,
+    }
+
+
+def select_cases(patterns):
+    cases = build_cases()
+    if patterns:
+        cases = [case for case in cases if any(p in case.name for p in patterns)]
+    return cases
+
+
+def run_suite(args):
+    cases = select_cases(args.keyword)
+    datasets = load_datasets(args.datasets)
+    results = {}
+    for dataset_name, images in datasets.items():
+        if not images:
+            print(f"[{dataset_name}] 이미지가 없어 건너뜁니다.")
+            continue
+        megapixels = sum(image.shape[0] * image.shape[1] for image in images) / 1e6
+        print(f"\n[{dataset_name}] 이미지 {len(images)}장, {megapixels:.1f} MP")
+        print(f"{'항목':<48}{'시간(ms)':>12}{'할당(MB)':>11}{'RSS(MB)':>10}")
+        for case in cases:
+            key = f"{case.name}@{dataset_name}"
+            try:
+                result = measure(case, images, args.repeat)
+            except Exception as e:
+                print(f"{case.name:<48} 실패: {e}")
+                continue
+            results[key] = result
+            rss = result['rss_peak_mb']
+            rss_text = f"{rss:>10.1f}" if rss is not None else f"{'-':>10}"
+            print(f"{case.name:<48}{result['wall_ms']:>12.2f}{result['alloc_peak_mb']:>11.1f}{rss_text}")
+
+    report = {'environment': environment(), 'repeat': args.repeat, 'results': results}
+    if args.save:
+        save_report(report, args.save)
+    return report
+
+
+def save_report(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {path}")
+
+
+def load_report(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_reports(baseline, current, threshold, min_ms=1.0):
+    """
+    기준 결과와 비교하여 시간 또는 할당량이 threshold 비율 이상 늘어난 항목을 표시합니다.
+    min_ms 보다 짧은 항목은 측정 오차가 커서 시간 회귀로 보지 않습니다.
+    """
+    regressions = []
+    print(f"\n{'항목':<56}{'기준(ms)':>11}{'현재(ms)':>11}{'비율':>8}{'할당 비율':>10}")
+    for key, old in baseline['results'].items():
+        new = current['results'].get(key)
+        if new is None:
+            continue
+        time_ratio = new['wall_ms'] / old['wall_ms'] if old['wall_ms'] else float('inf')
+        alloc_ratio = (new['alloc_peak_mb'] / old['alloc_peak_mb']
+                       if old['alloc_peak_mb'] > 0.01 else 1.0)
+
+        flags = []
+        if time_ratio > 1 + threshold and new['wall_ms'] >= min_ms:
+            flags.append('시간')
+        if alloc_ratio > 1 + threshold:
+            flags.append('메모리')
+        mark = f"  <- 회귀({', '.join(flags)})" if flags else ''
+        print(f"{key:<56}{old['wall_ms']:>11.2f}{new['wall_ms']:>11.2f}"
+              f"{time_ratio:>7.2f}x{alloc_ratio:>9.2f}x{mark}")
+        if flags:
+            regressions.append(key)
+
+    missing = set(baseline['results']) - set(current['results'])
+    if missing:
+        print(f"\n현재 결과에 없는 항목 {len(missing)}개 (선택 옵션 또는 실패)")
+    if baseline.get('environment', {}).get('platform') != current.get('environment', {}).get('platform'):
+        print("\n주의: 기준 결과와 측정 환경이 다릅니다.")
+
+    if regressions:
+        print(f"\n회귀 {len(regressions)}건 (기준 대비 {threshold:.0%} 초과)")
+    else:
+        print(f"\n회귀 없음 (기준 대비 {threshold:.0%} 이내)")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="필터/도구 벤치마크")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-k', '--keyword', action='append', default=[],
+                        help="이름에 이 문자열이 포함된 항목만 실행")
+    common.add_argument('--datasets', default='test,4k,8k,24mp',
+                        type=lambda text: [name.strip() for name in text.split(',') if name.strip()],
+                        help="test,4k,8k,24mp 중 실행할 입력")
+    common.add_argument('--repeat', type=int, default=3, help="시간 측정 반복 횟수")
+
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', parents=[common], help="벤치마크 실행")
+    run_parser.add_argument('--save', help="결과를 저장할 JSON 경로")
+
+    compare_parser = commands.add_parser('compare', parents=[common],
+                                         help="기준 결과와 비교 (현재 결과를 생략하면 지금 실행)")
+    compare_parser.add_argument('baseline', help="기준 JSON")
+    compare_parser.add_argument('current', nargs='?', help="비교할 JSON")
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="회귀로 판단할 증가 비율 (기본 0.10 = 10%%)")
+    compare_parser.add_argument('--save', help="지금 실행한 결과를 저장할 JSON 경로")
+
+    commands.add_parser('list', parents=[common], help="측정 항목 목록")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.datasets if name != 'test' and name not in SYNTHETIC_SIZES]
+    if unknown:
+        parser.error(f"알 수 없는 입력: {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'list':
+        for case in select_cases(args.keyword):
+            print(case.name)
+        return 0
+
+    if args.command == 'run':
+        run_suite(args)
+        return 0
+
+    baseline = load_report(args.baseline)
+    if args.current:
+        current = load_report(args.current)
+    else:
+        # 기준 결과에 있는 입력만 다시 측정
+        datasets = {key.rsplit('@', 1)[1] for key in baseline['results']}
+        args.datasets = [name for name in args.datasets if name in datasets]
+        args.repeat = baseline.get('repeat', args.repeat)
+        current = run_suite(args)
+    return 1 if compare_reports(baseline, current, args.threshold) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+캔버스 다시 그리기 시간: 이미지 전체 리사이즈(변경 전) vs 보이는 영역만 그리기(CanvasView)
+이미지 크기가 커져도 보이는 영역만 그리는 방식은 창 크기에만 비례하는지 확인합니다.
+
+실행: python benchmarks/canvas_render_benchmark.py [--viewport 1200x800] [--repeat 10]
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+import numpy as np
+import cv2
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+from gui.canvas_view import CanvasView
+
+SIZES = {
+    '1080p': (1080, 1920),
+    '4k': (2160, 3840),
+    '24mp': (4000, 6000),
+}
+ZOOMS = (0.25, 0.5, 1.0, 2.0, 4.0)
+
+
+def measure(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캔버스 다시 그리기 시간 측정")
+    parser.add_argument('--viewport', default='1200x800')
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+    view_w, view_h = map(int, args.viewport.split('x'))
+
+    app = QApplication(sys.argv[:1])
+    view = CanvasView()
+    rng = np.random.default_rng(0)
+
+    print(f"\n{'이미지':<8}{'배율':>6}{'전체 리사이즈(ms)':>20}{'보이는 영역(ms)':>18}")
+    for name, (height, width) in SIZES.items():
+        image = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        for zoom in ZOOMS:
+            size = (max(1, int(width * zoom)), max(1, int(height * zoom)))
+            full = measure(lambda: cv2.resize(image, size), args.repeat)
+
+            # 스크롤 위치는 이미지 가운데, 피라미드는 한 번 만든 뒤 재사용
+            view.set_image(image, zoom)
+            w, h = min(view_w, size[0]), min(view_h, size[1])
+            x, y = (size[0] - w) // 2, (size[1] - h) // 2
+            view.render(x, y, w, h)
+            viewport = measure(lambda: view.render(x, y, w, h), args.repeat)
+            print(f"{name:<8}{zoom:>6.2f}{full:>20.1f}{viewport:>18.1f}")
+    del app
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+YOLO 출력 후처리 속도 비교 (yolov3-tiny 416x416 출력 크기: 507 + 2028 행, 85 열)
+- 기존: 행마다 파이썬 반복문으로 argmax/좌표 변환 후 NMS
+- 현재: ObjectDetector.decode (일괄 마스크/argmax/좌표 변환, 클래스별 NMS 한 번)
+모델 가중치 없이 임의로 만든 출력으로 측정합니다.
+
+실행: python benchmarks/detection_postprocess_benchmark.py
+"""
+import os
+import sys
+import time
+import numpy as np
+import cv2
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from features.video.object_detector import ObjectDetector
+
+REPEAT = 20
+
+
+def make_outputs(seed, hit_ratio):
+    """hit_ratio 비율의 행만 신뢰도가 0.5를 넘는 가짜 YOLO 출력"""
+    rng = np.random.default_rng(seed)
+    outs = []
+    for rows in (507, 2028):
+        out = rng.random((rows, 85), dtype=np.float32)
+        out[:, 2:4] = out[:, 2:4] * 0.3 + 0.02
+        out[:, 5:] *= 0.4
+        hits = rng.random(rows) < hit_ratio
+        out[hits, 5 + rng.integers(0, 80, hits.sum())] = rng.uniform(0.5, 1.0, hits.sum())
+        outs.append(out)
+    return outs
+
+
+def legacy_decode(outs, width, height):
+    """변경 전 detect_objects의 후처리"""
+    class_ids = []
+    confidences = []
+    boxes = []
+    for out in outs:
+        for detection in out:
+            scores = detection[5:]
+            class_id = np.argmax(scores)
+            confidence = scores[class_id]
+            if confidence > 0.5:
+                center_x = int(detection[0] * width)
+                center_y = int(detection[1] * height)
+                w = int(detection[2] * width)
+                h = int(detection[3] * height)
+                x = int(center_x - w / 2)
+                y = int(center_y - h / 2)
+                boxes.append([x, y, w, h])
+                confidences.append(float(confidence))
+                class_ids.append(class_id)
+    return cv2.dnn.NMSBoxes(boxes, confidences, 0.5, 0.4)
+
+
+def measure(func, *args):
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)) * 1000
+
+
+def main():
+    detector = ObjectDetector()
+    width, height = 1280, 720
+    print(f"\n{'감지된 행 비율':<16}{'기존(ms)':>12}{'현재(ms)':>12}{'속도 향상':>10}")
+    for hit_ratio in (0.01, 0.05, 0.2):
+        outs = make_outputs(0, hit_ratio)
+        legacy = measure(legacy_decode, outs, width, height)
+        current = measure(detector.decode, outs, width, height)
+        print(f"{hit_ratio:<16.0%}{legacy:>12.2f}{current:>12.2f}{legacy / current:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+드래그 지연 시간: 이벤트마다 이미지 전체 복사/표시/기록(변경 전) vs 도구가 알려 준 변경 영역만 처리(MainWindow)
+마우스 이동 한 번과 버튼을 뗄 때(기록 포함) 걸리는 시간을 도구별로 측정합니다.
+
+실행: python benchmarks/drag_latency_benchmark.py [--size 6000x4000] [--zoom 0.25] [--steps 30]
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+import numpy as np
+import cv2
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QPoint
+from PyQt5.QtGui import QImage, QPixmap
+from features.tools import PenTool, EraserTool, RectangleTool, CircleTool
+from features.selection_tools import SelectionTool
+from features.mosaic_tool import MosaicTool
+from features.history_manager import HistoryManager
+
+TOOLS = (
+    ('PenTool', PenTool),
+    ('EraserTool', EraserTool),
+    ('RectangleTool', RectangleTool),
+    ('CircleTool', CircleTool),
+    ('SelectionTool', SelectionTool),
+    ('MosaicTool', MosaicTool),
+)
+
+
+def drag_points(width, height, steps):
+    """이미지 가운데 부분을 가로지르는 짧은 드래그 (한 이동에 수십 픽셀)"""
+    xs = np.linspace(width * 0.4, width * 0.6, steps + 1).astype(int)
+    ys = np.linspace(height * 0.4, height * 0.6, steps + 1).astype(int)
+    return [QPoint(int(x), int(y)) for x, y in zip(xs, ys)]
+
+
+def percentile(samples, q):
+    return float(np.percentile(samples, q))
+
+
+class LegacyDrag:
+    """변경 전 MainWindow 동작: 이벤트마다 복사본을 넘기고 화면 전체를 리사이즈해서 다시 만듦"""
+    def __init__(self, image, zoom):
+        self.image = image.copy()
+        self.history = []
+        height, width = image.shape[:2]
+        self.size = (int(width * zoom), int(height * zoom))
+
+    def display(self):
+        if self.image.shape[1] == self.size[0] and self.image.shape[0] == self.size[1]:
+            resized = np.ascontiguousarray(self.image)
+        else:
+            resized = cv2.resize(self.image, self.size)
+        q_img = QImage(resized.data, self.size[0], self.size[1], 3 * self.size[0], QImage.Format_RGB888)
+        self.pixmap = QPixmap.fromImage(q_img)
+
+    def event(self, tool, method, pos):
+        self.image = getattr(tool, method)(self.image.copy(), pos)
+        if method == 'on_release':
+            self.history.append(self.image.copy())
+        self.display()
+
+
+class RegionDrag:
+    """현재 MainWindow 동작: apply_tool + 변경 영역만 다시 그리기 + 영역 기록"""
+    def __init__(self, window, image, zoom):
+        self.window = window
+        window.current_image = image.copy()
+        window.zoom_level = zoom
+        window.history_manager = HistoryManager()
+        window.update_image_display()
+        QApplication.processEvents()
+
+    def event(self, tool, method, pos):
+        window = self.window
+        if method == 'on_press':
+            window.history_manager.begin(window.current_image)
+            window.stroke_rect = None
+        window.apply_tool(method, pos)
+        if method == 'on_release' and window.stroke_rect is not None:
+            window.history_manager.add(window.current_image, window.stroke_rect)
+        # 이벤트 루프처럼 쌓인 update() 영역을 그림
+        QApplication.processEvents()
+
+
+def measure(drag, factory, points):
+    """(이동 이벤트 시간 목록, 버튼 뗄 때 시간) ms"""
+    tool = factory()
+    drag.event(tool, 'on_press', points[0])
+    moves = []
+    for pos in points[1:]:
+        start = time.perf_counter()
+        drag.event(tool, 'on_move', pos)
+        moves.append((time.perf_counter() - start) * 1000)
+    start = time.perf_counter()
+    drag.event(tool, 'on_release', points[-1])
+    return moves, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="드래그 지연 시간 측정")
+    parser.add_argument('--size', default='6000x4000')
+    parser.add_argument('--zoom', type=float, default=0.25)
+    parser.add_argument('--steps', type=int, default=30)
+    parser.add_argument('--viewport', default='1200x800')
+    args = parser.parse_args()
+    width, height = map(int, args.size.split('x'))
+    view_w, view_h = map(int, args.viewport.split('x'))
+
+    app = QApplication(sys.argv[:1])
+    from gui.main_window import MainWindow
+    window = MainWindow()
+    window.resize(view_w, view_h)
+    window.show()
+    # 창이 화면에 나타나야 repaint()가 실제로 그려짐
+    app.processEvents()
+
+    image = np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+    points = drag_points(width, height, args.steps)
+
+    print(f"\n캔버스 {width}x{height}, 배율 {args.zoom}, 이동 {args.steps}회")
+    print(f"{'도구':<16}{'방식':<8}{'이동 중앙(ms)':>14}{'이동 p95(ms)':>14}{'놓기(ms)':>10}")
+    for name, factory in TOOLS:
+        for label, drag in (('전체', LegacyDrag(image, args.zoom)),
+                            ('영역', RegionDrag(window, image, args.zoom))):
+            moves, release = measure(drag, factory, points)
+            print(f"{name:<16}{label:<8}{statistics.median(moves):>14.1f}"
+                  f"{percentile(moves, 95):>14.1f}{release:>10.1f}")
+    window.close()
+    del app
+
+
+if __name__ == '__main__':
+    main()
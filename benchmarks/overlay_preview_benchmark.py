@@ -0,0 +1,96 @@
+"""
+고무줄 미리보기 비용: 이미지 크기별로 도구를 누르고(on_press) 움직일 때(on_move + 화면 갱신) 걸리는 시간
+미리보기를 overlay에 그리므로 이미지 크기가 커져도 시간이 거의 같아야 합니다.
+비교용으로 변경 전처럼 이동마다 이미지 전체를 복사하는 시간(전체 복사)도 함께 출력합니다.
+
+실행: python benchmarks/overlay_preview_benchmark.py [--steps 30] [--viewport 1200x800]
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QPoint
+from features.tools import RectangleTool, CircleTool, PolygonTool, SelectTool
+from features.selection_tools import SelectionTool
+from features.mosaic_tool import MosaicTool
+from features.history_manager import HistoryManager
+
+SIZES = {
+    '1080p': (1080, 1920),
+    '4k': (2160, 3840),
+    '24mp': (4000, 6000),
+}
+TOOLS = (
+    ('RectangleTool', RectangleTool),
+    ('CircleTool', CircleTool),
+    ('PolygonTool', PolygonTool),
+    ('SelectTool', SelectTool),
+    ('SelectionTool', SelectionTool),
+    ('MosaicTool', MosaicTool),
+)
+
+
+def elapsed_ms(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="고무줄 미리보기 비용 측정")
+    parser.add_argument('--steps', type=int, default=30)
+    parser.add_argument('--viewport', default='1200x800')
+    args = parser.parse_args()
+    view_w, view_h = map(int, args.viewport.split('x'))
+
+    app = QApplication(sys.argv[:1])
+    from gui.main_window import MainWindow
+    window = MainWindow()
+    window.resize(view_w, view_h)
+    window.show()
+    # 창이 화면에 나타나야 다시 그리기가 실제로 일어남
+    app.processEvents()
+
+    print(f"\n{'이미지':<8}{'도구':<16}{'누름(ms)':>10}{'이동 중앙(ms)':>14}{'이동 p95(ms)':>14}{'전체 복사(ms)':>14}")
+    for name, (height, width) in SIZES.items():
+        image = np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+        window.current_image = image
+        window.zoom_level = 1.0
+        window.history_manager = HistoryManager()
+        window.update_image_display()
+        app.processEvents()
+        copy_ms = statistics.median(elapsed_ms(image.copy) for _ in range(5))
+
+        # 화면에 보이는 영역 안에서 드래그
+        xs = np.linspace(50, view_w * 0.6, args.steps + 1).astype(int)
+        ys = np.linspace(50, view_h * 0.6, args.steps + 1).astype(int)
+        for tool_name, factory in TOOLS:
+            window.current_tool = factory()
+            window.canvas_view.set_overlay(window.current_tool.overlay)
+            app.processEvents()
+
+            press = elapsed_ms(lambda: window.apply_tool('on_press', QPoint(int(xs[0]), int(ys[0]))))
+            moves = []
+            for x, y in zip(xs[1:], ys[1:]):
+                def move():
+                    window.apply_tool('on_move', QPoint(int(x), int(y)))
+                    app.processEvents()
+                moves.append(elapsed_ms(move))
+            # 놓아서 미리보기를 정리 (이미지 내용은 시간에 영향을 주지 않으므로 되돌리지 않음)
+            window.apply_tool('on_release', QPoint(int(xs[-1]), int(ys[-1])))
+            print(f"{name:<8}{tool_name:<16}{press:>10.2f}{statistics.median(moves):>14.2f}"
+                  f"{float(np.percentile(moves, 95)):>14.2f}{copy_ms:>14.1f}")
+    window.close()
+    del app
+
+
+if __name__ == '__main__':
+    main()
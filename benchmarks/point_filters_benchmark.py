@@ -0,0 +1,100 @@
+"""
+밝기/대비/세피아 필터의 기존 구현, 현재 구현, LUT 적용 속도 비교
+(LUT는 FilterChain에서 여러 필터를 합칠 때 사용됨)
+
+실행: python benchmarks/point_filters_benchmark.py [반복 횟수]
+"""
+import os
+import sys
+import time
+import glob
+import cv2
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from features.filters import BrightnessFilter, ContrastFilter, SepiaFilter, GrayscaleFilter, FilterChain
+from features.filters.point_ops import apply_lut
+
+IMAGE_DIR = os.path.join(ROOT_DIR, '테스트 이미지 파일')
+
+SEPIA_KERNEL = np.array([[0.272, 0.534, 0.131],
+                         [0.349, 0.686, 0.168],
+                         [0.393, 0.769, 0.189]])
+
+# 변경 전 구현 (비교 기준)
+LEGACY = {
+    '밝기': lambda image: cv2.add(image, np.ones(image.shape, dtype='uint8') * 50),
+    '대비': lambda image: cv2.convertScaleAbs(image, alpha=1.5, beta=0),
+    '세피아': lambda image: cv2.transform(image, SEPIA_KERNEL),
+}
+
+CURRENT = {
+    '밝기': BrightnessFilter().apply,
+    '대비': ContrastFilter().apply,
+    '세피아': SepiaFilter().apply,
+}
+
+LUT = {
+    '밝기': lambda image: apply_lut(image, BrightnessFilter().lut()),
+    '대비': lambda image: apply_lut(image, ContrastFilter().lut()),
+}
+
+CHAIN = [BrightnessFilter(), ContrastFilter(), GrayscaleFilter(), SepiaFilter()]
+
+
+def run_sequential(image):
+    for filter_obj in CHAIN:
+        image = filter_obj.apply(image)
+    return image
+
+
+def load_images():
+    """테스트 이미지 폴더의 컬러 이미지를 읽습니다. (한글 경로 대응)"""
+    images = []
+    for path in sorted(glob.glob(os.path.join(IMAGE_DIR, '*'))):
+        if not path.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp')):
+            continue
+        image = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if image is not None:
+            images.append(image)
+    return images
+
+
+def measure(func, images, repeat):
+    """모든 이미지에 대해 repeat 회 실행한 총 시간(초)"""
+    for image in images:
+        func(image)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for image in images:
+            func(image)
+    return time.perf_counter() - start
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    images = load_images()
+    # 큰 이미지(24MP)에서의 차이도 함께 확인
+    large = [np.random.randint(0, 256, (4000, 6000, 3), dtype=np.uint8)]
+    total_pixels = sum(image.shape[0] * image.shape[1] for image in images)
+    print(f"테스트 이미지 {len(images)}장 ({total_pixels / 1e6:.1f} MP), 반복 {repeat}회")
+
+    for label, dataset, count in (('테스트 이미지', images, repeat), ('24MP', large, 1)):
+        print(f"\n[{label}]")
+        print(f"{'필터':<6}{'기존(ms)':>12}{'현재(ms)':>12}{'LUT(ms)':>12}{'속도 향상':>10}")
+        for name in LEGACY:
+            legacy = measure(LEGACY[name], dataset, count) * 1000 / count
+            current = measure(CURRENT[name], dataset, count) * 1000 / count
+            lut = measure(LUT[name], dataset, count) * 1000 / count if name in LUT else float('nan')
+            print(f"{name:<6}{legacy:>12.2f}{current:>12.2f}{lut:>12.2f}{legacy / current:>9.2f}x")
+
+        # 밝기+대비+흑백+세피아 4단계 체인: 순차 적용 vs 합쳐서 적용
+        sequential = measure(run_sequential, dataset, count) * 1000 / count
+        fused = measure(FilterChain(CHAIN).apply, dataset, count) * 1000 / count
+        print(f"{'체인':<6}{sequential:>12.2f}{fused:>12.2f}{'':>12}{sequential / fused:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
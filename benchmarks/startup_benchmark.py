@@ -0,0 +1,93 @@
+"""
+프로그램 시작부터 첫 화면 그리기(paint)까지 걸리는 시간
+- 지연 로딩: 현재 방식 (모델/SIFT는 처음 사용할 때 또는 창을 띄운 뒤 백그라운드에서 불러옴)
+- 즉시 로딩: 변경 전처럼 창을 띄우기 전에 감지 모델과 SIFT 검출기를 만듦
+매번 새 프로세스로 실행하여 import 시간까지 포함해서 측정합니다.
+
+실행: python benchmarks/startup_benchmark.py [--repeat 5]
+      (화면이 없는 환경에서는 QT_QPA_PLATFORM=offscreen)
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import statistics
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child(eager):
+    """새 프로세스에서 실행: 창을 띄우고 첫 paint 이벤트까지의 시간을 JSON으로 출력"""
+    start = time.perf_counter()
+    sys.path.insert(0, ROOT_DIR)
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QObject, QEvent, QTimer
+    from gui.main_window import MainWindow
+
+    app = QApplication(sys.argv[:1])
+    imported = time.perf_counter()
+    window = MainWindow()
+    window.warm_up_models = False
+    if eager:
+        window.video_processor.object_detector.load()
+        window.panorama_tool.load()
+    constructed = time.perf_counter()
+
+    result = {}
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and 'paint' not in result:
+                result['paint'] = time.perf_counter()
+                QTimer.singleShot(0, app.quit)
+            return False
+
+    watcher = PaintWatcher()
+    window.installEventFilter(watcher)
+    window.show()
+    # paint 이벤트가 오지 않는 환경 대비
+    QTimer.singleShot(5000, app.quit)
+    app.exec_()
+
+    paint = result.get('paint', time.perf_counter())
+    print(json.dumps({
+        'import_ms': (imported - start) * 1000,
+        'construct_ms': (constructed - imported) * 1000,
+        'first_paint_ms': (paint - start) * 1000,
+    }))
+
+
+def run(eager, repeat):
+    samples = []
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    for _ in range(repeat):
+        args = [sys.executable, os.path.abspath(__file__), '--child']
+        if eager:
+            args.append('--eager')
+        output = subprocess.run(args, capture_output=True, text=True, env=env, cwd=ROOT_DIR).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 측정")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--eager', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.eager)
+        return
+
+    print(f"\n{'방식':<12}{'import(ms)':>12}{'창 생성(ms)':>14}{'첫 화면(ms)':>14}")
+    for name, eager in (('즉시 로딩', True), ('지연 로딩', False)):
+        stats = run(eager, args.repeat)
+        print(f"{name:<12}{stats['import_ms']:>12.0f}{stats['construct_ms']:>14.0f}{stats['first_paint_ms']:>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
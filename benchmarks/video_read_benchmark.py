@@ -0,0 +1,82 @@
+"""
+VideoProcessor.get_frame 프레임 읽기 속도 비교 (highway.mp4)
+- 기존: 매 프레임마다 CAP_PROP_POS_FRAMES로 탐색 후 read()
+- 현재: 다음 프레임이거나 조금 앞이면 탐색 없이 read()/grab(),
+        역방향/탐색은 키프레임 색인과 GOP 단위 디코딩 캐시 사용
+
+실행: python benchmarks/video_read_benchmark.py [비디오 경로]
+"""
+import os
+import sys
+import time
+import random
+import cv2
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from features.video.video_processor import VideoProcessor
+
+VIDEO_PATH = os.path.join(ROOT_DIR, '테스트 이미지 파일', 'highway.mp4')
+
+
+class LegacyReader:
+    """변경 전 get_frame의 읽기 방식 (비교 기준)"""
+    def __init__(self, path):
+        self.cap = cv2.VideoCapture(path)
+
+    def read_frame(self, frame_idx):
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+        ret, frame = self.cap.read()
+        return frame if ret else None
+
+
+def measure(reader, indices):
+    """프레임 번호 목록을 순서대로 읽는 데 걸린 시간으로 계산한 초당 프레임 수"""
+    start = time.perf_counter()
+    for frame_idx in indices:
+        reader.read_frame(frame_idx)
+    return len(indices) / (time.perf_counter() - start)
+
+
+def scrub_pattern(count, seed=0):
+    """한 위치 주변을 앞뒤로 조금씩 오가는 슬라이더 조작"""
+    rng = random.Random(seed)
+    position = count // 2
+    indices = []
+    for _ in range(200):
+        position = min(count - 1, max(0, position + rng.randint(-5, 5)))
+        indices.append(position)
+    return indices
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else VIDEO_PATH
+    processor = VideoProcessor()
+    if not processor.load_video(path):
+        print(f"비디오를 열 수 없습니다: {path}")
+        return
+    count = processor.get_frame_count()
+    print(f"{os.path.basename(path)}: {count} 프레임, {processor.fps:.1f} fps")
+
+    patterns = {
+        '순방향 재생': list(range(count)),
+        '2배속 (1프레임씩 건너뜀)': list(range(0, count, 2)),
+        '4배속 (3프레임씩 건너뜀)': list(range(0, count, 4)),
+        '같은 프레임 다시 표시': [i // 2 for i in range(min(count * 2, 400))],
+        '역방향 한 프레임씩': list(range(count - 1, -1, -1)),
+        '슬라이더 앞뒤 이동': scrub_pattern(count),
+    }
+
+    print(f"\n{'읽기 방식':<28}{'기존(fps)':>12}{'현재(fps)':>12}{'속도 향상':>10}")
+    for name, indices in patterns.items():
+        legacy = measure(LegacyReader(path), indices)
+        processor.load_video(path)
+        if processor.keyframe_index is not None:
+            processor.keyframe_index.ready.wait()
+        current = measure(processor, indices)
+        print(f"{name:<28}{legacy:>12.1f}{current:>12.1f}{current / legacy:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,20 @@
 import cv2
 import numpy as np
-from PyQt5.QtWidgets import QDialog, QPushButton, QVBoxLayout, QHBoxLayout, QLabel
+from PyQt5.QtWidgets import QDialog, QPushButton, QVBoxLayout, QHBoxLayout, QLabel, QMenu
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QImage, QPixmap
+from .camera_capture import CameraCapture
+from .live_filter import LiveFilter
 
 class CameraDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, source=0):
         super().__init__(parent)
         self.parent = parent
+        # 카메라 번호 또는 카메라 대신 사용할 비디오 파일 경로
+        self.source = source
+        # 미리보기에 실시간으로 적용할 필터 (비어 있으면 원본 표시)
+        self.live_filter = LiveFilter()
+        self.live_filters = []
         self.setup_ui()
         self.setup_camera()
         
@@ -32,52 +39,100 @@ class CameraDialog(QDialog):
         self.close_button = QPushButton("닫기")
         self.close_button.clicked.connect(self.close_camera)
         
+        # 실시간 필터 선택 (메인 창의 필터를 선택한 순서대로 적용)
+        self.filter_button = QPushButton("🎨 실시간 필터")
+        self.filter_menu = QMenu(self)
+        filters = getattr(self.parent, 'filters', None) or {}
+        for name, filter_obj in filters.items():
+            action = self.filter_menu.addAction(name)
+            action.setCheckable(True)
+            action.toggled.connect(lambda checked, f=filter_obj: self.toggle_live_filter(f, checked))
+        self.filter_button.clicked.connect(
+            lambda: self.filter_menu.exec_(self.filter_button.mapToGlobal(self.filter_button.rect().bottomLeft())))
+        self.filter_button.setEnabled(bool(filters))
+
         button_layout.addWidget(self.capture_button)
+        button_layout.addWidget(self.filter_button)
         button_layout.addWidget(self.close_button)
         
         layout.addLayout(button_layout)
         self.setLayout(layout)
         
     def setup_camera(self):
-        self.camera = cv2.VideoCapture(0)  # 기본 카메라 사용
-        if not self.camera.isOpened():
+        # 읽기는 별도 스레드에서 하고 화면 쪽은 최신 프레임만 표시
+        self.camera = CameraCapture(self.source)
+        # 미리보기 크기로 줄인 프레임과 RGB 변환 결과를 담아 둘 버퍼 (크기가 바뀔 때만 새로 만듦)
+        self.resized_buffer = None
+        self.preview_buffer = None
+        self.shown_frame_id = 0
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.update_frame)
+        if not self.camera.open():
             print("카메라를 열 수 없습니다.")
             self.close()
             return
-            
-        # 타이머 설정 (30fps)
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_frame)
-        self.timer.start(33)
+
+        # 새 프레임이 있을 때만 그리므로 카메라보다 자주 확인해서 지연을 줄임
+        self.timer.start(15)
+
+    def toggle_live_filter(self, filter_obj, enabled):
+        if enabled:
+            self.live_filters.append(filter_obj)
+        elif filter_obj in self.live_filters:
+            self.live_filters.remove(filter_obj)
+        self.live_filter.set_filters(self.live_filters)
         
     def update_frame(self):
-        ret, frame = self.camera.read()
-        if ret:
-            # OpenCV BGR -> RGB 변환
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # 미리보기 크기에 맞게 조정
+        frame, frame_id = self.camera.acquire()
+        if frame is None or frame_id == self.shown_frame_id:
+            self.camera.release()
+            return
+        try:
+            # 미리보기 크기에 맞게 조정 (비율 유지)
             height, width = frame.shape[:2]
             preview_size = self.preview_label.size()
-            
-            # 비율 유지하면서 크기 조정
             scale = min(preview_size.width() / width, preview_size.height() / height)
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            
-            frame = cv2.resize(frame, (new_width, new_height))
-            
-            # QImage로 변환
-            image = QImage(frame.data, new_width, new_height, 
-                         new_width * 3, QImage.Format_RGB888)
-            
-            self.preview_label.setPixmap(QPixmap.fromImage(image))
+            new_width = max(1, int(width * scale))
+            new_height = max(1, int(height * scale))
+
+            if self.live_filters:
+                # 필터는 시간 예산에 맞춘 해상도로 처리한 뒤 표시 크기로 늘림
+                self.preview_buffer = self.live_filter.process(frame, (new_width, new_height))
+                cv2.putText(self.preview_buffer, self.live_filter.summary(), (10, 25),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+                self.shown_frame_id = frame_id
+                self.show_preview(new_width, new_height)
+                return
+
+            if self.resized_buffer is None or self.resized_buffer.shape[:2] != (new_height, new_width):
+                self.resized_buffer = np.empty((new_height, new_width, 3), np.uint8)
+                self.preview_buffer = np.empty((new_height, new_width, 3), np.uint8)
+
+            # 캡처 버퍼에서 바로 줄인 뒤 작은 프레임만 BGR -> RGB 변환
+            cv2.resize(frame, (new_width, new_height), dst=self.resized_buffer, interpolation=cv2.INTER_AREA)
+        finally:
+            self.camera.release()
+        cv2.cvtColor(self.resized_buffer, cv2.COLOR_BGR2RGB, dst=self.preview_buffer)
+        self.shown_frame_id = frame_id
+        self.show_preview(new_width, new_height)
+
+    def show_preview(self, new_width, new_height):
+        # QImage는 버퍼를 그대로 사용하고 QPixmap을 만들 때 한 번만 복사됨
+        image = QImage(self.preview_buffer.data, new_width, new_height,
+                       new_width * 3, QImage.Format_RGB888)
+        self.preview_label.setPixmap(QPixmap.fromImage(image))
             
     def capture_image(self):
-        ret, frame = self.camera.read()
-        if ret:
+        # 이미 읽어 둔 최신 프레임을 사용 (다시 읽으며 기다리지 않음)
+        frame = self.camera.snapshot()
+        if frame is not None:
             # BGR -> RGB 변환
             frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # 실시간 필터를 켠 상태면 원본 해상도로 같은 필터를 적용
+            if self.live_filter.chain is not None:
+                frame = self.live_filter.chain.apply(frame)
+                if frame.ndim == 2:
+                    frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
             
             # 메인 윈도우에 이미지 전달
             if self.parent:
@@ -88,5 +143,11 @@ class CameraDialog(QDialog):
             
     def close_camera(self):
         self.timer.stop()
-        self.camera.release()
-        self.close() 
\ No newline at end of file
+        self.camera.close()
+        self.close()
+
+    def closeEvent(self, event):
+        # 창 닫기 버튼으로 닫아도 읽기 스레드를 멈춤
+        self.timer.stop()
+        self.camera.close()
+        super().closeEvent(event)
@@ -0,0 +1,147 @@
+import time
+import atexit
+import weakref
+import threading
+import cv2
+import numpy as np
+
+"""카메라(또는 대신 쓰는 비디오 파일)를 별도 스레드에서 계속 읽는 캡처 작업자"""
+
+
+class CameraCapture:
+    """
+    카메라 캡처 작업자
+    - 스레드가 미리 만들어 둔 버퍼 몇 개(buffer_count)를 돌려 쓰며 계속 읽음 (프레임마다 새 배열을 만들지 않음)
+    - 화면 쪽은 acquire()로 가장 최근 프레임을 빌려 쓰고 release()로 돌려줌
+      빌려 간 버퍼와 최신 버퍼에는 쓰지 않으므로 복사 없이 바로 읽어도 됨
+    - snapshot()은 이미 읽어 둔 최신 프레임의 복사본을 바로 반환 (촬영할 때 다시 읽지 않음)
+    source가 카메라 번호가 아니라 비디오 파일 경로면 파일의 fps에 맞춰 읽고 끝나면 처음부터 다시 읽습니다.
+    """
+    def __init__(self, source=0, buffer_count=3):
+        self.source = source
+        self.buffer_count = max(3, buffer_count)
+        self.capture = None
+        self.buffers = None
+        self.lock = threading.Lock()
+        self.running = False
+        self.thread = None
+        self.latest_slot = None
+        self.held_slot = None
+        # 새 프레임을 읽을 때마다 증가 (화면 쪽에서 같은 프레임을 다시 그리지 않도록)
+        self.frame_id = 0
+        self.captured_at = None
+        self.error = None
+        _captures.add(self)
+
+    def is_file(self):
+        return isinstance(self.source, str)
+
+    def open(self):
+        """캡처 장치를 열고 읽기 스레드를 시작합니다. 열지 못하면 False"""
+        if self.running:
+            return True
+        self.capture = cv2.VideoCapture(self.source)
+        if not self.capture.isOpened():
+            self.capture.release()
+            self.capture = None
+            return False
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return True
+
+    def close(self):
+        self.running = False
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2.0)
+        self.thread = None
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+
+    def free_slot(self):
+        """최신 프레임도, 화면 쪽이 빌려 간 프레임도 아닌 버퍼 번호"""
+        with self.lock:
+            busy = (self.latest_slot, self.held_slot)
+        for slot in range(len(self.buffers)):
+            if slot not in busy:
+                return slot
+
+    def run(self):
+        # 파일은 실제 카메라처럼 원래 속도로 읽음
+        interval = 0.0
+        if self.is_file():
+            fps = self.capture.get(cv2.CAP_PROP_FPS)
+            interval = 1.0 / fps if fps > 0 else 1.0 / 30
+        next_time = time.perf_counter()
+
+        while self.running:
+            if not self.capture.grab():
+                if self.is_file():
+                    self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    continue
+                self.error = "카메라에서 프레임을 읽을 수 없습니다."
+                print(self.error)
+                break
+
+            if self.buffers is None:
+                ok, frame = self.capture.retrieve()
+                if not ok:
+                    continue
+                self.buffers = [np.empty_like(frame) for _ in range(self.buffer_count)]
+                slot = 0
+                self.buffers[slot][...] = frame
+            else:
+                slot = self.free_slot()
+                ok, frame = self.capture.retrieve(self.buffers[slot])
+                if not ok:
+                    continue
+                if frame is not self.buffers[slot]:
+                    # 해상도가 바뀌면 OpenCV가 새 배열을 만들어 주므로 그 배열을 버퍼로 사용
+                    self.buffers[slot] = frame
+
+            with self.lock:
+                self.latest_slot = slot
+                self.frame_id += 1
+                self.captured_at = time.perf_counter()
+
+            if interval:
+                next_time += interval
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_time = time.perf_counter()
+
+    def acquire(self):
+        """
+        가장 최근 프레임 (BGR, 읽기 전용으로 사용)과 프레임 번호
+        다 쓰면 release()를 호출해야 합니다. 아직 프레임이 없으면 (None, 0)
+        """
+        with self.lock:
+            if self.latest_slot is None:
+                return None, 0
+            self.held_slot = self.latest_slot
+            return self.buffers[self.held_slot], self.frame_id
+
+    def release(self):
+        with self.lock:
+            self.held_slot = None
+
+    def snapshot(self):
+        """가장 최근 프레임의 복사본 (BGR, 없으면 None)"""
+        frame, _ = self.acquire()
+        try:
+            return frame.copy() if frame is not None else None
+        finally:
+            self.release()
+
+
+# 프로그램 종료 시 읽기 스레드를 정리
+_captures = weakref.WeakSet()
+
+
+@atexit.register
+def _close_captures():
+    for capture in list(_captures):
+        capture.close()
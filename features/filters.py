@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
 import cv2
 import numpy as np
+from features.filters.point_ops import PointOp, affine_lut
+from features.filters.color_quantizer import ColorQuantizer
+from features.filters.gradient_engine import GradientEngine
+from features.profiler import profiler
 
 class ImageFilter(ABC):
+    # 타일 분할 실행 시 위아래로 겹쳐야 하는 픽셀 수(커널 반경)
+    # None 이면 전체 이미지를 한 번에 처리해야 하는 필터
+    halo = None
+
     def __init__(self):
         self.is_applied = False  # 필터 적용 상태
         self.original_image = None  # 원본 이미지 저장
@@ -10,11 +18,16 @@ class ImageFilter(ABC):
     @abstractmethod
     def apply(self, image: np.ndarray) -> np.ndarray:
         pass
+
+    def point_op(self):
+        """픽셀 단위 필터는 PointOp를 반환 (FilterChain에서 합쳐서 적용)"""
+        return None
     
     def toggle(self, image: np.ndarray) -> np.ndarray:
         """필터 켜고 끄기"""
         if not self.is_applied:
-            self.original_image = image.copy()
+            # apply()는 입력을 바꾸지 않으므로 복사본 대신 참조만 보관
+            self.original_image = image
             result = self.apply(image)
             self.is_applied = True
         else:
@@ -23,22 +36,36 @@ class ImageFilter(ABC):
             self.original_image = None
         return result
 
+# 성능 측정을 켜면 모든 필터의 apply 실행 시간을 기록
+profiler.register(ImageFilter, ['apply'], 'filter', subclasses=True)
+
 class GrayscaleFilter(ImageFilter):
+    halo = 0
+
     def __init__(self):
         super().__init__()
     
     def apply(self, image: np.ndarray) -> np.ndarray:
         return cv2.cvtColor(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY), cv2.COLOR_GRAY2BGR)
 
+    def point_op(self):
+        return PointOp.from_matrix(np.tile([[0.114, 0.587, 0.299]], (3, 1)))
+
 class BlurFilter(ImageFilter):
     def __init__(self, kernel_size=(5,5)):
         super().__init__()
         self.kernel_size = kernel_size
+
+    @property
+    def halo(self):
+        return max(self.kernel_size) // 2
         
     def apply(self, image: np.ndarray) -> np.ndarray:
         return cv2.GaussianBlur(image, self.kernel_size, 0)
 
 class SharpenFilter(ImageFilter):
+    halo = 1
+
     def __init__(self):
         super().__init__()
     
@@ -47,53 +74,76 @@ class SharpenFilter(ImageFilter):
         return cv2.filter2D(image, -1, kernel)
 
 class EdgeFilter(ImageFilter):
+    # Canny의 히스테리시스 연결은 이미지 전체에 걸쳐 이어지므로 나눌 수 없음
+    halo = None
+
     def __init__(self):
         super().__init__()
         self.threshold1 = 100  # 최소 임계값
         self.threshold2 = 200  # 최대 임계값
         
     def apply(self, image: np.ndarray) -> np.ndarray:
-        # 그레이스케일로 변환
-        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
-        
-        # 노이즈 제거를 위한 가우시안 블러
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-        
-        # Canny 엣지 검출
-        edges = cv2.Canny(blurred, 
-                         self.threshold1, 
-                         self.threshold2)
+        # 그레이스케일 변환 후 노이즈 제거를 위한 가우시안 블러, Canny 엣지 검출
+        engine = GradientEngine(image, cv2.COLOR_RGB2GRAY)
+        edges = engine.canny(self.threshold1, self.threshold2, blur_ksize=5)
         
         # 3채널로 변환 (메인 이미지와 호환되도록)
         return cv2.cvtColor(edges, cv2.COLOR_GRAY2RGB)
 
 class BrightnessFilter(ImageFilter):
+    halo = 0
+
     def __init__(self, beta=30):
         super().__init__()
         self.beta = beta
         
+    def lut(self):
+        """밝기 값별로 캐시되는 LUT"""
+        return affine_lut(1.0, self.beta, absolute=True)
+
     def apply(self, image: np.ndarray) -> np.ndarray:
         return cv2.convertScaleAbs(image, alpha=1.0, beta=self.beta)
 
+    def point_op(self):
+        return PointOp.from_lut(self.lut())
+
 class ContrastFilter(ImageFilter):
+    halo = 0
+
     def __init__(self, alpha=1.5):
         super().__init__()
         self.alpha = alpha
         
+    def lut(self):
+        """대비 값별로 캐시되는 LUT"""
+        return affine_lut(self.alpha, 0, absolute=True)
+
     def apply(self, image: np.ndarray) -> np.ndarray:
         return cv2.convertScaleAbs(image, alpha=self.alpha, beta=0)
 
+    def point_op(self):
+        return PointOp.from_lut(self.lut())
+
 class SepiaFilter(ImageFilter):
+    halo = 0
+
+    kernel = np.array([[0.272, 0.534, 0.131],
+                       [0.349, 0.686, 0.168],
+                       [0.393, 0.769, 0.189]], dtype=np.float32)
+
     def __init__(self):
         super().__init__()
     
     def apply(self, image: np.ndarray) -> np.ndarray:
-        kernel = np.array([[0.272, 0.534, 0.131],
-                          [0.349, 0.686, 0.168],
-                          [0.393, 0.769, 0.189]])
-        return cv2.transform(image, kernel)
+        return cv2.transform(image, self.kernel)
+
+    def point_op(self):
+        return PointOp.from_matrix(self.kernel)
 
 class CartoonFilter(ImageFilter):
+    # medianBlur(5) 뒤의 adaptiveThreshold(9): 반경 2 + 4
+    halo = 6
+
     def __init__(self):
         super().__init__()
     
@@ -106,6 +156,8 @@ class CartoonFilter(ImageFilter):
         return cv2.bitwise_and(color, color, mask=edges)
 
 class EmbossFilter(ImageFilter):
+    halo = 1
+
     def __init__(self):
         super().__init__()
     
@@ -114,6 +166,9 @@ class EmbossFilter(ImageFilter):
         return cv2.filter2D(image, -1, kernel) + 128
 
 class WaterColorFilter(ImageFilter):
+    # 반경 4인 bilateralFilter 세 번
+    halo = 12
+
     def __init__(self):
         super().__init__()
     
@@ -123,6 +178,8 @@ class WaterColorFilter(ImageFilter):
         return cv2.bilateralFilter(temp, 9, 75, 75)
 
 class SketchFilter(ImageFilter):
+    halo = 10
+
     def __init__(self):
         super().__init__()
     
@@ -133,48 +190,53 @@ class SketchFilter(ImageFilter):
         return cv2.divide(gray, 255 - blur, scale=256.0)
 
 class SobelEdgeFilter(ImageFilter):
-    def __init__(self):
+    halo = 1
+
+    def __init__(self, l1=False):
+        """l1=True 이면 sqrt 대신 |gx| + |gy| 근사 사용"""
         super().__init__()
+        self.l1 = l1
         
     def apply(self, image: np.ndarray) -> np.ndarray:
-        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
-        
-        # Sobel 엣지 검출 (X방향과 Y방향)
-        sobelx = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-        sobely = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
-        
-        # 절대값 변환
-        abs_sobelx = np.absolute(sobelx)
-        abs_sobely = np.absolute(sobely)
-        
-        # X와 Y방향 엣지 합치기
-        edges = np.uint8(np.sqrt(sobelx**2 + sobely**2))
+        # Sobel 엣지 검출 (X방향과 Y방향, CV_16S) 후 기울기 크기를 제자리 계산
+        engine = GradientEngine(image, cv2.COLOR_RGB2GRAY)
+        edges = engine.sobel_magnitude(l1=self.l1)
         
         return cv2.cvtColor(edges, cv2.COLOR_GRAY2RGB)
 
 class LaplacianEdgeFilter(ImageFilter):
+    halo = 2
+
     def __init__(self):
         super().__init__()
         
     def apply(self, image: np.ndarray) -> np.ndarray:
-        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
-        blurred = cv2.GaussianBlur(gray, (3, 3), 0)
-        
-        # Laplacian 엣지 검출
-        laplacian = cv2.Laplacian(blurred, cv2.CV_64F)
-        
-        # 절대값 변환 및 스케일링
-        edges = np.uint8(np.absolute(laplacian))
+        # 3x3 블러 후 Laplacian 엣지 검출 (CV_16S), 절대값을 uint8로 변환
+        engine = GradientEngine(image, cv2.COLOR_RGB2GRAY)
+        edges = engine.laplacian(blur_ksize=3)
         
         return cv2.cvtColor(edges, cv2.COLOR_GRAY2RGB) 
 
 class ColorQuantizationFilter(ImageFilter):
-    def __init__(self, k=8):
+    # 전체 픽셀로 군집을 학습하므로 나눌 수 없음
+    halo = None
+
+    def __init__(self, k=8, fast=True, warm_start=False):
+        """
+        fast=True: 샘플 픽셀로 학습하고 3D 팔레트 LUT로 변환 (큰 사진에서 수십 배 빠름)
+        warm_start=True: 이전 팔레트를 이어서 사용 (연속된 비디오 프레임용)
+        """
         super().__init__()
         self.k = k
+        self.fast = fast
+        self.quantizer = ColorQuantizer(k=k, warm_start=warm_start)
         
     def apply(self, image: np.ndarray) -> np.ndarray:
-        # K-means 색상 양자화
+        if self.fast:
+            self.quantizer.k = self.k
+            return self.quantizer.quantize(image)
+
+        # K-means 색상 양자화 (전체 픽셀)
         data = image.reshape((-1, 3))
         data = np.float32(data)
         criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 10, 1.0)
@@ -184,6 +246,8 @@ class ColorQuantizationFilter(ImageFilter):
         return res.reshape(image.shape)
 
 class InpaintingFilter(ImageFilter):
+    halo = None
+
     def __init__(self):
         super().__init__()
         
@@ -193,6 +257,9 @@ class InpaintingFilter(ImageFilter):
         return cv2.inpaint(image, mask, 3, cv2.INPAINT_TELEA)
 
 class StyleTransferFilter(ImageFilter):
+    # stylization은 재귀 필터라 영향 범위가 무한하지만 sigma_s의 3배 밖은 무시할 수 있음
+    halo = 180
+
     def __init__(self):
         super().__init__()
         
@@ -204,6 +271,9 @@ class StyleTransferFilter(ImageFilter):
         return cv2.bitwise_and(color, color, mask=edges)
 
 class HDRFilter(ImageFilter):
+    # detailEnhance(sigma_s=12)의 실질적인 영향 범위
+    halo = 36
+
     def __init__(self):
         super().__init__()
         
@@ -213,6 +283,9 @@ class HDRFilter(ImageFilter):
         return cv2.convertScaleAbs(hdr, alpha=1.3, beta=30)
 
 class DenoisingFilter(ImageFilter):
+    # templateWindowSize 7, searchWindowSize 21 → 3 + 10
+    halo = 13
+
     def __init__(self):
         super().__init__()
         
@@ -224,6 +297,12 @@ class MorphologyFilter(ImageFilter):
     def __init__(self, operation='dilate'):
         super().__init__()
         self.operation = operation
+
+    @property
+    def halo(self):
+        if self.operation in ('opening', 'closing'):
+            return 4
+        return 2
         
     def apply(self, image: np.ndarray) -> np.ndarray:
         kernel = np.ones((5,5), np.uint8)
@@ -238,6 +317,8 @@ class MorphologyFilter(ImageFilter):
         return image
 
 class PencilSketchFilter(ImageFilter):
+    halo = 10
+
     def __init__(self):
         super().__init__()
         
@@ -10,6 +10,12 @@ from .cartoon_filter import CartoonFilter
 from .sketch_filter import SketchFilter
 from .morphology_filter import MorphologyFilter
 from .mosaic_filter import MosaicFilter
+from .point_ops import PointOp
+from .filter_chain import FilterChain
+from .tiled_executor import TiledExecutor
+from .result_cache import FilterResultCache
+from .color_quantizer import ColorQuantizer
+from .gradient_engine import GradientEngine
 
 __all__ = [
     'Filter',
@@ -23,5 +29,11 @@ __all__ = [
     'CartoonFilter',
     'SketchFilter',
     'MorphologyFilter',
-    'MosaicFilter'
+    'MosaicFilter',
+    'PointOp',
+    'FilterChain',
+    'TiledExecutor',
+    'FilterResultCache',
+    'ColorQuantizer',
+    'GradientEngine'
 ]
\ No newline at end of file
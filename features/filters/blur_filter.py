@@ -4,5 +4,7 @@ from .filter import Filter
 
 """블러 필터"""
 class BlurFilter(Filter):
+    halo = 2
+
     def apply(self, image):
         return cv2.GaussianBlur(image, (5, 5), 0) 
\ No newline at end of file
@@ -1,9 +1,20 @@
 import cv2
-import numpy as np
 from .filter import Filter
+from .point_ops import PointOp, affine_lut
 
 class BrightnessFilter(Filter):
+    halo = 0
+
+    # 밝기 증가량 (조절 가능한 값)
+    brightness = 50
+
+    def lut(self):
+        """현재 밝기 값에 대한 LUT (값별로 캐시됨)"""
+        return affine_lut(1.0, self.brightness)
+
     def apply(self, image):
-        # 밝기 증가 (50은 조절 가능한 값)
-        brightness = 50
-        return cv2.add(image, np.ones(image.shape, dtype='uint8') * brightness) 
\ No newline at end of file
+        # 전체 크기의 임시 배열 없이 스칼라 덧셈 한 번으로 밝기 증가 (포화 연산)
+        return cv2.add(image, (self.brightness,) * 3 + (0,))
+
+    def point_op(self):
+        return PointOp.from_lut(self.lut())
@@ -4,6 +4,9 @@ from .filter import Filter
 
 """카툰 필터"""
 class CartoonFilter(Filter):
+    # medianBlur(5) 뒤의 adaptiveThreshold(9): 반경 2 + 4
+    halo = 6
+
     def apply(self, image):
         # 카툰 효과
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
@@ -0,0 +1,98 @@
+import cv2
+import numpy as np
+
+class ColorQuantizer:
+    """
+    빠른 K-means 색상 양자화
+    - 전체 픽셀 대신 무작위로 뽑은 일부 픽셀로 군집 중심(팔레트)을 학습
+    - 32x32x32 색상 격자마다 가장 가까운 팔레트 색을 미리 계산한 3D LUT로 전체 픽셀을 한 번에 변환
+    - warm_start=True 이면 이전 팔레트에서 학습을 시작하여 연속된 비디오 프레임에서도
+      색이 튀지 않고 빠르게 수렴함
+    """
+    # 채널당 LUT 격자 비트 수 (5비트 = 32단계)
+    LUT_BITS = 5
+
+    def __init__(self, k=8, sample_size=50000, attempts=3, warm_start=False, seed=0):
+        self.k = k
+        self.sample_size = sample_size
+        self.attempts = attempts
+        self.warm_start = warm_start
+        self.rng = np.random.default_rng(seed)
+        self.centers = None
+        self.palette_lut = None
+
+    def sample_pixels(self, pixels):
+        """학습에 사용할 픽셀 샘플 (float32)"""
+        if len(pixels) <= self.sample_size:
+            return np.float32(pixels)
+        index = self.rng.choice(len(pixels), self.sample_size, replace=False)
+        return np.float32(pixels[index])
+
+    def fit(self, image):
+        """샘플 픽셀로 팔레트를 학습합니다. 팔레트가 바뀌었으면 True"""
+        pixels = image.reshape(-1, 3)
+        sample = self.sample_pixels(pixels)
+        k = min(self.k, len(sample))
+
+        if self.warm_start and self.centers is not None and len(self.centers) == k:
+            # 이전 팔레트 기준으로 초기 레이블을 정하고 한 번만 학습
+            labels = self.nearest_center(sample, self.centers).astype(np.int32).reshape(-1, 1)
+            criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 5, 1.0)
+            _, _, centers = cv2.kmeans(sample, k, labels, criteria, 1, cv2.KMEANS_USE_INITIAL_LABELS)
+        else:
+            criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 10, 1.0)
+            _, _, centers = cv2.kmeans(sample, k, None, criteria, self.attempts, cv2.KMEANS_PP_CENTERS)
+
+        # 중심이 거의 움직이지 않았으면 기존 LUT를 그대로 사용
+        if (self.palette_lut is not None and self.centers is not None
+                and self.centers.shape == centers.shape
+                and np.abs(self.centers - centers).max() < 1.0):
+            return False
+        self.centers = centers
+        self.palette_lut = self.build_palette_lut(centers)
+        return True
+
+    @staticmethod
+    def nearest_center(pixels, centers):
+        """각 픽셀에서 가장 가까운 중심의 인덱스 (벡터화)"""
+        # |p - c|^2 = |p|^2 - 2 p·c + |c|^2 에서 |p|^2는 비교에 필요 없음
+        distances = (centers ** 2).sum(axis=1) - 2.0 * (pixels @ centers.T)
+        return distances.argmin(axis=1)
+
+    def build_palette_lut(self, centers):
+        """격자 칸 중심마다 가장 가까운 팔레트 색을 담은 (32^3, 3) LUT"""
+        levels = 1 << self.LUT_BITS
+        step = 256 // levels
+        axis = np.arange(levels, dtype=np.float32) * step + step / 2
+        grid = np.stack(np.meshgrid(axis, axis, axis, indexing='ij'), axis=-1).reshape(-1, 3)
+        labels = self.nearest_center(grid, centers)
+        return np.clip(np.rint(centers), 0, 255).astype(np.uint8)[labels]
+
+    def lut_index(self, image):
+        """픽셀을 3D LUT 인덱스로 변환"""
+        shift = 8 - self.LUT_BITS
+        q = image >> shift
+        index = q[..., 0].astype(np.uint16) << (2 * self.LUT_BITS)
+        index |= q[..., 1].astype(np.uint16) << self.LUT_BITS
+        index |= q[..., 2]
+        return index
+
+    def quantize(self, image, exact=False):
+        """
+        이미지를 팔레트 색으로 양자화합니다. (샘플로 팔레트를 학습한 뒤 전체 픽셀 변환)
+        exact=True 이면 LUT 대신 각 픽셀의 가장 가까운 중심을 직접 계산합니다.
+        """
+        self.fit(image)
+
+        if exact:
+            palette = np.clip(np.rint(self.centers), 0, 255).astype(np.uint8)
+            pixels = image.reshape(-1, 3)
+            labels = np.empty(len(pixels), dtype=np.intp)
+            # 거리 행렬이 너무 커지지 않도록 나누어 계산
+            chunk = 1 << 18
+            for start in range(0, len(pixels), chunk):
+                labels[start:start + chunk] = self.nearest_center(
+                    np.float32(pixels[start:start + chunk]), self.centers)
+            return palette[labels].reshape(image.shape)
+
+        return self.palette_lut[self.lut_index(image)]
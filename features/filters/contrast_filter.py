@@ -1,9 +1,20 @@
 import cv2
 import numpy as np
 from .filter import Filter
+from .point_ops import PointOp, affine_lut
 
 class ContrastFilter(Filter):
+    halo = 0
+
+    # 대비 강도
+    alpha = 1.5
+
+    def lut(self):
+        """convertScaleAbs(alpha)와 같은 결과를 내는 LUT (값별로 캐시됨)"""
+        return affine_lut(self.alpha, 0, absolute=True)
+
     def apply(self, image):
-        # 대비 증가 (alpha는 대비 강도)
-        alpha = 1.5
-        return cv2.convertScaleAbs(image, alpha=alpha, beta=0) 
\ No newline at end of file
+        return cv2.convertScaleAbs(image, alpha=self.alpha, beta=0)
+
+    def point_op(self):
+        return PointOp.from_lut(self.lut())
@@ -1,12 +1,21 @@
 import numpy as np
+from features.profiler import profiler
 
 class Filter:
+    # 타일 분할 실행 시 위아래로 겹쳐야 하는 픽셀 수(커널 반경)
+    # None 이면 전체 이미지를 한 번에 처리해야 하는 필터
+    halo = None
+
     def __init__(self):
         self.is_applied = False
     
     def apply(self, image):
         # 기본 필터 클래스의 추상 메서드
         raise NotImplementedError("필터의 apply 메서드를 구현해야 합니다")
+
+    def point_op(self):
+        """픽셀 단위 필터는 PointOp를 반환합니다. (FilterChain에서 합쳐서 적용)"""
+        return None
         
     def toggle(self, image):
         """필터 적용/해제를 토글합니다."""
@@ -16,4 +25,7 @@ class Filter:
             return result
         else:
             self.is_applied = False
-            return image
\ No newline at end of file
+            return image
+
+# 성능 측정을 켜면 모든 필터의 apply 실행 시간을 기록
+profiler.register(Filter, ['apply'], 'filter', subclasses=True)
@@ -0,0 +1,66 @@
+from .filter import Filter
+from .point_ops import FusedStage
+
+class FilterChain(Filter):
+    """
+    여러 필터를 순서대로 적용하는 필터 체인
+    밝기/대비/흑백/세피아처럼 픽셀 단위로 동작하는 필터는 하나의 3x4 색상 행렬과
+    채널별 LUT로 합쳐서 한 번에 적용하고, 합칠 수 없는 필터는 순서대로 적용합니다.
+    필터 설정을 바꾼 뒤에는 compile()을 다시 호출해야 합니다.
+    """
+    def __init__(self, filters=None):
+        super().__init__()
+        self.filters = list(filters) if filters else []
+        self._stages = None
+
+    @property
+    def halo(self):
+        """각 필터의 겹침 크기를 합한 값 (하나라도 나눌 수 없으면 None)"""
+        total = 0
+        for filter_obj in self.filters:
+            halo = getattr(filter_obj, 'halo', None)
+            if halo is None:
+                return None
+            total += halo
+        return total
+
+    def add(self, filter_obj):
+        """체인 끝에 필터 추가"""
+        self.filters.append(filter_obj)
+        self._stages = None
+
+    def clear(self):
+        self.filters = []
+        self._stages = None
+
+    def compile(self):
+        """필터 목록을 실행 단계 목록으로 변환합니다."""
+        stages = []
+        fused = None
+        for filter_obj in self.filters:
+            op = filter_obj.point_op() if hasattr(filter_obj, 'point_op') else None
+            if op is None:
+                # 픽셀 단위 필터가 아니면 지금까지의 구간을 닫고 그대로 실행
+                if fused is not None:
+                    stages.append(fused)
+                    fused = None
+                stages.append(filter_obj)
+                continue
+
+            if fused is None or not fused.add(filter_obj, op):
+                if fused is not None:
+                    stages.append(fused)
+                fused = FusedStage()
+                fused.add(filter_obj, op)
+
+        if fused is not None:
+            stages.append(fused)
+        self._stages = stages
+        return stages
+
+    def apply(self, image):
+        if self._stages is None:
+            self.compile()
+        for stage in self._stages:
+            image = stage.apply(image)
+        return image
@@ -0,0 +1,84 @@
+import cv2
+import numpy as np
+
+class GradientEngine:
+    """
+    엣지 검출용 기울기 계산 엔진
+    - 한 이미지의 그레이스케일을 한 번만 만들어 Sobel/Laplacian/Prewitt/Canny가 함께 사용
+    - CV_64F 대신 CV_16S(정수)/CV_32F(단정밀도)로 계산하여 임시 배열 크기를 줄임
+    - 기울기 크기는 제자리(in-place) 계산하거나 L1 근사(|gx| + |gy|)를 사용
+    - 최종 결과는 convertScaleAbs로 바로 uint8 변환 (0~255로 포화)
+    """
+    PREWITT_X = np.array([[1, 1, 1], [0, 0, 0], [-1, -1, -1]], dtype=np.float32)
+    PREWITT_Y = np.array([[-1, 0, 1], [-1, 0, 1], [-1, 0, 1]], dtype=np.float32)
+
+    def __init__(self, image, code=cv2.COLOR_BGR2GRAY):
+        if image.ndim == 2:
+            self.gray = image
+        else:
+            self.gray = cv2.cvtColor(image, code)
+        self.sobel_cache = None
+
+    def sobel(self):
+        """x, y 방향 Sobel 미분 (CV_16S, 한 번만 계산)"""
+        if self.sobel_cache is None:
+            gx = cv2.Sobel(self.gray, cv2.CV_16S, 1, 0, ksize=3)
+            gy = cv2.Sobel(self.gray, cv2.CV_16S, 0, 1, ksize=3)
+            self.sobel_cache = (gx, gy)
+        return self.sobel_cache
+
+    def sobel_magnitude(self, l1=False, normalize=False):
+        """
+        Sobel 기울기 크기 (uint8)
+        l1=True: |gx| + |gy| 근사 (정수 연산만 사용)
+        normalize=True: 최소~최대 값을 0~255로 늘림
+        """
+        gx, gy = self.sobel()
+        if l1 and not normalize:
+            return cv2.add(cv2.convertScaleAbs(gx), cv2.convertScaleAbs(gy))
+
+        fx = gx.astype(np.float32)
+        fy = gy.astype(np.float32)
+        if l1:
+            np.abs(fx, out=fx)
+            np.abs(fy, out=fy)
+            cv2.add(fx, fy, dst=fx)
+        else:
+            # sqrt(gx^2 + gy^2) 를 fx 버퍼에 바로 저장
+            cv2.magnitude(fx, fy, fx)
+        if normalize:
+            return cv2.normalize(fx, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
+        return cv2.convertScaleAbs(fx)
+
+    def laplacian(self, blur_ksize=0):
+        """Laplacian 절대값 (uint8), blur_ksize > 0 이면 먼저 가우시안 블러"""
+        gray = self.gray
+        if blur_ksize:
+            gray = cv2.GaussianBlur(gray, (blur_ksize, blur_ksize), 0)
+        return cv2.convertScaleAbs(cv2.Laplacian(gray, cv2.CV_16S))
+
+    def prewitt(self):
+        """Prewitt x, y 응답의 평균 (기존 구현처럼 음수는 0으로 포화)"""
+        gx = cv2.filter2D(self.gray, -1, self.PREWITT_X)
+        gy = cv2.filter2D(self.gray, -1, self.PREWITT_Y)
+        return cv2.addWeighted(gx, 0.5, gy, 0.5, 0)
+
+    def canny(self, threshold1=100, threshold2=200, blur_ksize=0):
+        gray = self.gray
+        if blur_ksize:
+            gray = cv2.GaussianBlur(gray, (blur_ksize, blur_ksize), 0)
+        return cv2.Canny(gray, threshold1, threshold2)
+
+    def edges(self, methods=('canny', 'sobel', 'laplacian', 'prewitt')):
+        """여러 엣지 맵을 같은 그레이스케일에서 한 번에 계산"""
+        results = {}
+        for method in methods:
+            if method == 'sobel':
+                results[method] = self.sobel_magnitude(normalize=True)
+            elif method == 'laplacian':
+                results[method] = self.laplacian()
+            elif method == 'prewitt':
+                results[method] = self.prewitt()
+            else:
+                results[method] = self.canny()
+        return results
@@ -1,9 +1,16 @@
 import cv2
 import numpy as np
 from .filter import Filter
+from .point_ops import PointOp
 
 """흑백 필터"""
 class GrayscaleFilter(Filter):
+    halo = 0
+
     def apply(self, image):
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR) 
\ No newline at end of file
+        return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+
+    def point_op(self):
+        # BGR2GRAY 가중치를 세 채널에 동일하게 적용
+        return PointOp.from_matrix(np.tile([[0.114, 0.587, 0.299]], (3, 1)))
@@ -9,6 +9,13 @@ class MorphologyFilter(Filter):
         self.operation = operation
         # 5x5 크기의 정방형 커널 생성
         self.kernel = np.ones((5,5), np.uint8)
+
+    @property
+    def halo(self):
+        # 열림/닫힘은 5x5 커널을 두 번 적용하므로 반경이 두 배
+        if self.operation in ('opening', 'closing'):
+            return 4
+        return 2
         
     def apply(self, image):
         if self.operation == 'dilate':
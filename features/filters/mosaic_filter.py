@@ -3,6 +3,9 @@ import numpy as np
 from .filter import Filter
 
 class MosaicFilter(Filter):
+    # 블록 위치가 전체 이미지 크기에 따라 정해지므로 나누어 처리할 수 없음
+    halo = None
+
     def apply(self, image):
         height, width = image.shape[:2]
         rate = 30
@@ -0,0 +1,120 @@
+from functools import lru_cache
+import cv2
+import numpy as np
+
+"""픽셀 단위(point-wise) 연산 표현"""
+
+
+def identity_lut():
+    """채널별 항등 LUT (256 x 3)"""
+    return np.repeat(np.arange(256, dtype=np.uint8)[:, None], 3, axis=1)
+
+
+@lru_cache(maxsize=64)
+def affine_lut(alpha=1.0, beta=0.0, absolute=False):
+    """
+    clip(alpha * x + beta) 를 채널별 LUT로 만듭니다.
+    파라미터 값별로 캐시되므로 반환된 LUT는 읽기 전용입니다.
+    """
+    values = np.arange(256, dtype=np.float64) * alpha + beta
+    if absolute:
+        # convertScaleAbs 와 동일하게 절대값을 취함
+        values = np.abs(values)
+    lut = np.clip(np.rint(values), 0, 255).astype(np.uint8)
+    lut = np.repeat(lut[:, None], 3, axis=1)
+    lut.setflags(write=False)
+    return lut
+
+
+class PointOp:
+    """
+    픽셀 단위 연산 하나를 나타내는 클래스
+    - 'lut': 채널별 256 항목 LUT (256 x 3, uint8)
+    - 'matrix': 3x4 색상 행렬 (마지막 열은 오프셋)
+    """
+    def __init__(self, kind, data):
+        self.kind = kind
+        self.data = data
+
+    @classmethod
+    def from_lut(cls, lut):
+        lut = np.asarray(lut, dtype=np.uint8)
+        if lut.ndim == 1:
+            lut = np.repeat(lut[:, None], 3, axis=1)
+        return cls('lut', lut)
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if matrix.shape == (3, 3):
+            matrix = np.hstack([matrix, np.zeros((3, 1), np.float32)])
+        return cls('matrix', matrix)
+
+
+def compose_luts(first, second):
+    """first 를 적용한 뒤 second 를 적용하는 LUT를 하나로 합칩니다."""
+    if first is None:
+        return second
+    return np.stack([second[first[:, c], c] for c in range(3)], axis=1)
+
+
+def compose_matrices(first, second):
+    """first 다음 second 를 적용하는 3x4 행렬"""
+    first_h = np.vstack([first, [0, 0, 0, 1]]).astype(np.float32)
+    return (second @ first_h).astype(np.float32)
+
+
+def matrix_stays_in_range(matrix):
+    """행렬 출력이 0~255 범위를 벗어나지 않으면 (중간 포화가 없으므로) 다음 행렬과 합칠 수 있음"""
+    coeffs, offset = matrix[:, :3], matrix[:, 3]
+    upper = offset + 255 * np.clip(coeffs, 0, None).sum(axis=1)
+    lower = offset + 255 * np.clip(coeffs, None, 0).sum(axis=1)
+    return bool((lower >= -0.5).all() and (upper <= 255.5).all())
+
+
+def apply_lut(image, lut):
+    """채널별 LUT 적용 (세 채널이 같으면 단일 채널 LUT로 더 빠르게 처리)"""
+    if (lut == lut[:, :1]).all():
+        return cv2.LUT(image, np.ascontiguousarray(lut[:, 0]))
+    return cv2.LUT(image, lut.reshape(256, 1, 3))
+
+
+class FusedStage:
+    """pre LUT -> 3x4 행렬 -> post LUT 형태로 합쳐진 구간"""
+    def __init__(self):
+        self.filters = []
+        self.pre_lut = None
+        self.matrix = None
+        self.post_lut = None
+
+    def add(self, filter_obj, op):
+        """연산을 구간에 합칩니다. 합칠 수 없으면 False"""
+        if op.kind == 'lut':
+            if self.matrix is None:
+                self.pre_lut = compose_luts(self.pre_lut, op.data)
+            else:
+                self.post_lut = compose_luts(self.post_lut, op.data)
+        elif self.matrix is None:
+            self.matrix = op.data
+        elif self.post_lut is None and matrix_stays_in_range(self.matrix):
+            self.matrix = compose_matrices(self.matrix, op.data)
+        else:
+            return False
+        self.filters.append(filter_obj)
+        return True
+
+    def apply(self, image):
+        if image.dtype != np.uint8 or image.ndim != 3 or image.shape[2] != 3:
+            # 3채널 8비트가 아니면 원래 필터를 순서대로 적용
+            for filter_obj in self.filters:
+                image = filter_obj.apply(image)
+            return image
+
+        result = image
+        if self.pre_lut is not None:
+            result = apply_lut(result, self.pre_lut)
+        if self.matrix is not None:
+            result = cv2.transform(result, self.matrix)
+        if self.post_lut is not None:
+            result = apply_lut(result, self.post_lut)
+        return result
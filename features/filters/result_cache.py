@@ -0,0 +1,183 @@
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+
+"""필터 결과 캐시 (메모리 LRU + 선택적 디스크 저장)"""
+
+
+def image_key(image):
+    """이미지 내용으로 만든 키 (모양, 자료형, 픽셀 데이터 해시)"""
+    data = np.ascontiguousarray(image)
+    digest = hashlib.sha1(memoryview(data).cast('B'), usedforsecurity=False).hexdigest()
+    return f"{'x'.join(map(str, data.shape))}-{data.dtype}-{digest}"
+
+
+def filter_key(filter_obj):
+    """필터 클래스와 파라미터로 만든 키 (적용 상태 등 런타임 값은 제외)"""
+    params = {}
+    # 클래스 속성으로 정의된 파라미터 (예: brightness = 50) 도 포함
+    for cls in reversed(type(filter_obj).__mro__):
+        for name, value in vars(cls).items():
+            if not name.startswith('_') and not callable(value) and not isinstance(value, (property, classmethod, staticmethod)):
+                params[name] = value
+    params.update((name, value) for name, value in vars(filter_obj).items() if not name.startswith('_'))
+    for name in ('is_applied', 'original_image', 'halo'):
+        params.pop(name, None)
+
+    parts = [type(filter_obj).__module__ + '.' + type(filter_obj).__qualname__]
+    for name in sorted(params):
+        value = params[name]
+        if isinstance(value, np.ndarray):
+            value = hashlib.sha1(np.ascontiguousarray(value).tobytes(), usedforsecurity=False).hexdigest()
+        elif isinstance(value, (list, tuple)) and any(hasattr(v, 'apply') for v in value):
+            # FilterChain 처럼 다른 필터를 담고 있는 경우
+            value = [filter_key(v) for v in value]
+        parts.append(f"{name}={value!r}")
+    return hashlib.sha1('|'.join(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+class FilterResultCache:
+    """
+    필터 결과를 (입력 이미지 내용, 필터 클래스/파라미터) 키로 저장하는 캐시
+    - 메모리: max_bytes 예산 안에서 LRU 방식으로 제거
+    - 디스크(선택): 계산에 disk_min_seconds 이상 걸린 결과(노이즈 제거, 스타일화 등)만 저장
+    여러 스레드에서 동시에 사용할 수 있습니다.
+    """
+    def __init__(self, max_bytes=512 * 1024 * 1024, disk_dir=None,
+                 disk_max_bytes=2 * 1024 * 1024 * 1024, disk_min_seconds=0.5):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_min_seconds = disk_min_seconds
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+        self.entries = OrderedDict()
+        self.current_bytes = 0
+        self.lock = threading.Lock()
+
+        # 예산 조정을 위한 통계
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def apply(self, filter_obj, image, executor=None, key=None):
+        """
+        캐시된 결과가 있으면 돌려주고, 없으면 필터를 적용한 뒤 저장합니다.
+        key를 주면(예: 이미지 세대 번호) 내용 해시 계산을 생략합니다.
+        """
+        cache_key = (key if key is not None else image_key(image)) + ':' + filter_key(filter_obj)
+
+        result = self.get(cache_key)
+        if result is not None:
+            return result
+
+        start = time.perf_counter()
+        if executor is not None:
+            result = executor.run(filter_obj, image)
+        else:
+            result = filter_obj.apply(image)
+        elapsed = time.perf_counter() - start
+
+        self.put(cache_key, result)
+        if self.disk_dir and elapsed >= self.disk_min_seconds:
+            self.save_to_disk(cache_key, result)
+        return result
+
+    def get(self, cache_key):
+        with self.lock:
+            entry = self.entries.get(cache_key)
+            if entry is not None:
+                self.entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry.copy()
+
+        entry = self.load_from_disk(cache_key)
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self.put(cache_key, entry)
+        return entry.copy()
+
+    def put(self, cache_key, result):
+        if result.nbytes > self.max_bytes:
+            return
+        stored = result.copy()
+        stored.setflags(write=False)
+        with self.lock:
+            old = self.entries.pop(cache_key, None)
+            if old is not None:
+                self.current_bytes -= old.nbytes
+            self.entries[cache_key] = stored
+            self.current_bytes += stored.nbytes
+            # 예산을 넘으면 가장 오래 사용하지 않은 결과부터 제거
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+                self.evictions += 1
+
+    def disk_path(self, cache_key):
+        name = hashlib.sha1(cache_key.encode(), usedforsecurity=False).hexdigest()
+        return os.path.join(self.disk_dir, name + '.npy')
+
+    def save_to_disk(self, cache_key, result):
+        try:
+            np.save(self.disk_path(cache_key), result)
+            self.trim_disk()
+        except OSError as e:
+            print(f"디스크 캐시 저장 실패: {e}")
+
+    def load_from_disk(self, cache_key):
+        if not self.disk_dir:
+            return None
+        path = self.disk_path(cache_key)
+        if not os.path.exists(path):
+            return None
+        try:
+            result = np.load(path)
+            os.utime(path)  # LRU 정리를 위해 사용 시각 갱신
+            return result
+        except (OSError, ValueError) as e:
+            print(f"디스크 캐시 읽기 실패: {e}")
+            return None
+
+    def trim_disk(self):
+        """디스크 예산을 넘으면 가장 오래 사용하지 않은 파일부터 삭제"""
+        files = []
+        for name in os.listdir(self.disk_dir):
+            if name.endswith('.npy'):
+                path = os.path.join(self.disk_dir, name)
+                stat = os.stat(path)
+                files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.disk_max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """적중/실패 횟수와 메모리 사용량"""
+        with self.lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                'entries': len(self.entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+            }
@@ -1,10 +1,19 @@
 import cv2
 import numpy as np
 from .filter import Filter
+from .point_ops import PointOp
 
 class SepiaFilter(Filter):
+    halo = 0
+
+    # 매 호출마다 float64 커널을 만들지 않도록 float32로 한 번만 준비
+    # (8비트 입력에 대해 cv2.transform은 고정소수점 정수 연산 경로를 사용)
+    kernel = np.array([[0.272, 0.534, 0.131],
+                       [0.349, 0.686, 0.168],
+                       [0.393, 0.769, 0.189]], dtype=np.float32)
+
     def apply(self, image: np.ndarray) -> np.ndarray:
-        kernel = np.array([[0.272, 0.534, 0.131],
-                          [0.349, 0.686, 0.168],
-                          [0.393, 0.769, 0.189]])
-        return cv2.transform(image, kernel) 
\ No newline at end of file
+        return cv2.transform(image, self.kernel)
+
+    def point_op(self):
+        return PointOp.from_matrix(self.kernel)
@@ -4,6 +4,8 @@ from .filter import Filter
 
 """샤프닝필터"""
 class SharpenFilter(Filter):
+    halo = 1
+
     def apply(self, image):
         # 샤프닝 커널
         kernel = np.array([[-1,-1,-1],
@@ -4,6 +4,9 @@ from .filter import Filter
 
 """스케치 필터"""
 class SketchFilter(Filter):
+    # 21x21 가우시안 블러 반경
+    halo = 10
+
     def apply(self, image):
         # 스케치 효과
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
@@ -0,0 +1,63 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+class TiledExecutor:
+    """
+    이웃 픽셀을 참조하는 필터를 가로 띠(strip) 단위로 나누어 스레드 풀에서 실행합니다.
+    각 띠는 필터의 halo(커널 반경)만큼 위아래로 겹치게 잘라 처리한 뒤,
+    겹친 부분을 버리고 이어 붙이므로 경계 없이 전체 이미지와 같은 결과가 나옵니다.
+    (OpenCV 함수는 GIL을 해제하므로 스레드로도 병렬 실행됩니다.)
+    """
+    def __init__(self, max_workers=None, min_tile_pixels=512 * 512):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # 이보다 작은 띠는 스레드 오버헤드가 더 크므로 나누지 않음
+        self.min_tile_pixels = min_tile_pixels
+        self._pool = None
+
+    def tile_count(self, image, halo):
+        """코어 수와 이미지 크기로 띠 개수 결정"""
+        if halo is None or self.max_workers <= 1:
+            return 1
+        height, width = image.shape[:2]
+        by_size = (height * width) // self.min_tile_pixels
+        # 띠 높이가 halo보다 너무 작으면 겹치는 영역 계산이 낭비됨
+        by_halo = height // max(4 * halo, 16)
+        return max(1, min(self.max_workers, by_size, by_halo))
+
+    def run(self, filter_obj, image):
+        """필터를 타일 단위로 병렬 적용합니다."""
+        halo = getattr(filter_obj, 'halo', None)
+        count = self.tile_count(image, halo)
+        if count <= 1:
+            return filter_obj.apply(image)
+
+        height = image.shape[0]
+        bounds = np.linspace(0, height, count + 1).astype(int)
+        tiles = []
+        for top, bottom in zip(bounds[:-1], bounds[1:]):
+            src_top = max(0, top - halo)
+            src_bottom = min(height, bottom + halo)
+            tiles.append((top, bottom, src_top, src_bottom))
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        futures = [
+            self._pool.submit(filter_obj.apply, image[src_top:src_bottom])
+            for _, _, src_top, src_bottom in tiles
+        ]
+
+        result = None
+        for (top, bottom, src_top, _), future in zip(tiles, futures):
+            tile = future.result()
+            if result is None:
+                # 출력 채널/자료형은 필터마다 다를 수 있으므로 첫 결과를 기준으로 할당
+                result = np.empty((height,) + tile.shape[1:], dtype=tile.dtype)
+            result[top:bottom] = tile[top - src_top:bottom - src_top]
+        return result
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
@@ -1,23 +1,100 @@
 class HistoryManager:
+    """
+    실행 취소/다시 실행 기록
+    - 마지막으로 기록한 상태(snapshot)를 한 장 보관하고, 기록마다 바뀌기 전 내용만 저장
+    - add(image, rect)로 바뀐 영역 (x, y, w, h)을 알려 주면 그 영역만 복사 (이미지 전체를 복사하지 않음)
+    - 영역 기록은 이미지가 제자리에서 바뀐 경우(마지막으로 기록한 배열과 같은 배열)에만 사용하고,
+      배열이 바뀌었으면 이미지 전체를 기록
+    add()는 변경이 끝난 뒤의 상태로 호출합니다.
+    """
     def __init__(self, max_history=10):
-        self.history = []
+        self.history = []      # (영역 또는 None, 바뀌기 전 내용) - None이면 이미지 전체
         self.redo_stack = []
         self.max_history = max_history
-    
-    def add(self, image):
-        self.history.append(image.copy())
+        self.snapshot = None
+        # snapshot과 내용이 같은 현재 이미지 배열
+        self.source = None
+        # 마지막 undo/redo가 바꾼 영역 (None이면 이미지 전체)
+        self.last_rect = None
+
+    @staticmethod
+    def clip(rect, image):
+        height, width = image.shape[:2]
+        x, y, w, h = rect
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(width, x + w), min(height, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return (x0, y0, x1 - x0, y1 - y0)
+
+    def begin(self, image):
+        """
+        이미지를 제자리에서 바꾸기 전에 호출
+        기록하지 않은 변경(다른 배열로 교체)이 있었다면 그 변경도 한 단계로 기록
+        """
+        if image is self.source:
+            return
+        if self.snapshot is not None:
+            self.push((None, self.snapshot))
+            self.redo_stack.clear()
+        self.snapshot = image.copy()
+        self.source = image
+
+    def add(self, image, rect=None):
+        if rect is not None:
+            rect = self.clip(rect, image)
+            if rect is None:
+                return
+        if (rect is not None and image is self.source and self.snapshot is not None
+                and self.snapshot.shape == image.shape):
+            x, y, w, h = rect
+            entry = (rect, self.snapshot[y:y+h, x:x+w].copy())
+            self.snapshot[y:y+h, x:x+w] = image[y:y+h, x:x+w]
+        else:
+            entry = (None, self.snapshot)
+            self.snapshot = image.copy()
+        self.source = image
+        if entry[1] is not None:
+            self.push(entry)
         self.redo_stack.clear()
+
+    def push(self, entry):
+        self.history.append(entry)
         if len(self.history) > self.max_history:
             self.history.pop(0)
-    
+
+    def restore(self, current_image, entry):
+        """entry의 내용으로 되돌리고 (현재 이미지, 반대 방향 기록)을 반환"""
+        rect, content = entry
+        if rect is None:
+            reverse = (None, self.snapshot if current_image is self.source else current_image.copy())
+            self.snapshot = content
+            image = content.copy()
+            self.last_rect = None
+        else:
+            image = current_image
+            self.last_rect = rect
+            if image is not self.source or image.shape != self.snapshot.shape:
+                # 기록하지 않은 변경은 버리고 마지막 기록 상태에서 되돌림
+                image = self.snapshot.copy()
+                self.last_rect = None
+            x, y, w, h = rect
+            reverse = (rect, self.snapshot[y:y+h, x:x+w].copy())
+            self.snapshot[y:y+h, x:x+w] = content
+            image[y:y+h, x:x+w] = content
+        self.source = image
+        return image, reverse
+
     def undo(self, current_image):
         if len(self.history) > 0:
-            self.redo_stack.append(current_image.copy())
-            return self.history.pop()
+            image, reverse = self.restore(current_image, self.history.pop())
+            self.redo_stack.append(reverse)
+            return image
         return current_image
-    
+
     def redo(self, current_image):
         if len(self.redo_stack) > 0:
-            self.history.append(current_image.copy())
-            return self.redo_stack.pop()
-        return current_image 
\ No newline at end of file
+            image, reverse = self.restore(current_image, self.redo_stack.pop())
+            self.history.append(reverse)
+            return image
+        return current_image
@@ -0,0 +1,92 @@
+import time
+from collections import deque
+import cv2
+import numpy as np
+from features.filters import FilterChain
+
+"""카메라 미리보기에 필터 체인을 실시간으로 적용 (시간 예산에 맞춰 처리 해상도를 자동 조절)"""
+
+
+class LiveFilter:
+    """
+    실시간 필터 미리보기
+    - 프레임을 표시 크기 × scale 로 줄여서 필터를 적용하고 표시 크기로 다시 늘림
+    - 처리 시간의 이동 평균이 budget_ms를 넘으면 scale을 한 단계 낮추고,
+      한 단계 올려도 (넓이에 비례한다고 보고) 예산의 headroom 비율 안에 들면 다시 올림
+    UI 스레드에서 프레임마다 process()를 호출합니다.
+    """
+    SCALES = (1.0, 0.75, 0.5, 0.35, 0.25)
+
+    def __init__(self, budget_ms=33.0, headroom=0.7, window=30):
+        self.budget_ms = budget_ms
+        self.headroom = headroom
+        self.chain = None
+        self.level = 0
+        # 처리 한 번에 걸린 시간의 이동 평균 (ms)
+        self.cost_ms = None
+        self.shown_times = deque(maxlen=window)
+
+    @property
+    def scale(self):
+        return self.SCALES[self.level]
+
+    def set_filters(self, filters):
+        """적용할 필터 목록 (비어 있으면 필터 없이 표시)"""
+        filters = list(filters)
+        self.chain = None
+        if filters:
+            self.chain = FilterChain(filters)
+            self.chain.compile()
+        self.level = 0
+        self.cost_ms = None
+
+    def process(self, frame, size):
+        """BGR 프레임을 size (너비, 높이) 크기의 필터 적용된 RGB 프레임으로 변환"""
+        start = time.perf_counter()
+        width, height = size
+        scale = self.scale if self.chain is not None else 1.0
+        small = (max(1, int(width * scale)), max(1, int(height * scale)))
+
+        image = cv2.resize(frame, small, interpolation=cv2.INTER_AREA)
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        if self.chain is not None:
+            image = self.chain.apply(image)
+            if image.ndim == 2:
+                image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+            if image.dtype != np.uint8:
+                image = np.clip(image, 0, 255).astype(np.uint8)
+        if small != (width, height):
+            image = cv2.resize(image, (width, height), interpolation=cv2.INTER_LINEAR)
+
+        if self.chain is not None:
+            self.update_scale((time.perf_counter() - start) * 1000)
+        self.shown_times.append(time.perf_counter())
+        return image
+
+    def update_scale(self, cost_ms):
+        self.cost_ms = cost_ms if self.cost_ms is None else self.cost_ms + 0.2 * (cost_ms - self.cost_ms)
+        if self.cost_ms > self.budget_ms and self.level < len(self.SCALES) - 1:
+            self.change_level(self.level + 1)
+        elif self.level > 0:
+            # 한 단계 올렸을 때 예상 비용 (처리 시간은 픽셀 수에 비례한다고 봄)
+            ratio = (self.SCALES[self.level - 1] / self.scale) ** 2
+            if self.cost_ms * ratio < self.budget_ms * self.headroom:
+                self.change_level(self.level - 1)
+
+    def change_level(self, level):
+        # 바뀐 해상도 기준으로 평균을 옮겨서 바로 다시 바뀌지 않도록 함
+        self.cost_ms *= (self.SCALES[level] / self.scale) ** 2
+        self.level = level
+
+    def fps(self):
+        times = self.shown_times
+        if len(times) >= 2 and times[-1] > times[0]:
+            return (len(times) - 1) / (times[-1] - times[0])
+        return 0.0
+
+    def summary(self):
+        """미리보기에 표시할 한 줄 요약"""
+        if self.chain is None:
+            return f"{self.fps():.1f} fps"
+        cost = f"{self.cost_ms:.0f}" if self.cost_ms is not None else "-"
+        return f"{self.fps():.1f} fps | scale {self.scale:.2f} | {cost}/{self.budget_ms:.0f} ms"
@@ -3,14 +3,23 @@ import numpy as np
 
 class PanoramaTool:
     def __init__(self):
-        # SIFT 특징점 검출기 생성
-        self.descriptor = cv2.SIFT_create()
-        # BF 매칭기 생성
-        self.matcher = cv2.DescriptorMatcher_create("BruteForce")
+        # 검출기/매칭기는 처음 파노라마를 만들 때 생성 (load 참고)
+        self.descriptor = None
+        self.matcher = None
+
+    def load(self):
+        """SIFT 검출기와 매칭기를 생성합니다. (이미 있으면 그대로 사용)"""
+        if self.descriptor is None:
+            # SIFT 특징점 검출기 생성
+            self.descriptor = cv2.SIFT_create()
+            # BF 매칭기 생성
+            self.matcher = cv2.DescriptorMatcher_create("BruteForce")
     
     def create_panorama(self, img_left, img_right):
         """두 이미지를 받아서 파노라마 이미지를 생성합니다."""
         try:
+            self.load()
+
             # 이미지 크기 가져오기
             hl, wl = img_left.shape[:2]
             hr, wr = img_right.shape[:2]
@@ -0,0 +1,158 @@
+import json
+import time
+import functools
+import threading
+from collections import deque
+import numpy as np
+
+"""작업별 실행 시간 측정 (링 버퍼 기록, 백분위 통계, Chrome 트레이스 내보내기)"""
+
+
+class Profiler:
+    """
+    등록한 클래스의 메서드 실행 시간을 기록하는 프로파일러
+    - enable() 할 때만 메서드를 감싸고 disable() 하면 원래 메서드로 되돌리므로
+      꺼져 있을 때는 추가 비용이 전혀 없음
+    - 최근 capacity 개의 기록만 링 버퍼에 보관
+    - 여러 스레드(타일 실행기, 미리보기 렌더링 등)에서 동시에 기록할 수 있음
+    """
+    def __init__(self, capacity=20000):
+        self.records = deque(maxlen=capacity)
+        self.targets = []
+        self.patched = []
+        self.enabled = False
+        self.origin_ns = time.perf_counter_ns()
+
+    def register(self, cls, methods, category, subclasses=False):
+        """측정할 클래스와 메서드 등록 (subclasses=True 이면 enable 시점의 모든 하위 클래스 포함)"""
+        self.targets.append((cls, tuple(methods), category, subclasses))
+        if self.enabled:
+            self.patch_target(cls, methods, category, subclasses)
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        for cls, methods, category, subclasses in self.targets:
+            self.patch_target(cls, methods, category, subclasses)
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        # 원래 메서드로 복원
+        for cls, name, original in reversed(self.patched):
+            setattr(cls, name, original)
+        self.patched = []
+
+    def patch_target(self, cls, methods, category, subclasses):
+        classes = [cls]
+        if subclasses:
+            pending = list(cls.__subclasses__())
+            while pending:
+                sub = pending.pop()
+                if sub not in classes:
+                    classes.append(sub)
+                    pending.extend(sub.__subclasses__())
+
+        for target in classes:
+            for name in methods:
+                # 해당 클래스에서 직접 정의한 메서드만 감쌈 (상속받은 메서드는 부모에서 측정)
+                original = target.__dict__.get(name)
+                if original is None or not callable(original) or getattr(original, '__profiled__', False):
+                    continue
+                setattr(target, name, self.wrap(original, name, category))
+                self.patched.append((target, name, original))
+
+    def wrap(self, func, name, category):
+        record = self.record
+
+        @functools.wraps(func)
+        def wrapper(obj, *args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return func(obj, *args, **kwargs)
+            finally:
+                record(f"{type(obj).__name__}.{name}", category, start, time.perf_counter_ns() - start)
+
+        wrapper.__profiled__ = True
+        return wrapper
+
+    def record(self, name, category, start_ns, duration_ns):
+        # deque.append는 스레드 안전
+        self.records.append((name, category, start_ns, duration_ns, threading.get_ident()))
+
+    def measure(self, name, category='custom'):
+        """with 문으로 임의 구간을 측정 (꺼져 있으면 아무것도 기록하지 않음)"""
+        return _Span(self, name, category)
+
+    def clear(self):
+        self.records.clear()
+
+    def last(self):
+        """가장 최근에 끝난 작업 (이름, 분류, 시작, 소요 시간ns, 스레드) 또는 None"""
+        try:
+            return self.records[-1]
+        except IndexError:
+            return None
+
+    def stats(self, name=None, window=500):
+        """최근 window 개 기록의 소요 시간 통계 (ms), name을 주면 해당 작업만"""
+        durations = []
+        for record in reversed(list(self.records)):
+            if name is None or record[0] == name:
+                durations.append(record[3])
+                if len(durations) >= window:
+                    break
+        if not durations:
+            return None
+        values = np.array(durations, dtype=np.float64) / 1e6
+        p50, p95, p99 = np.percentile(values, [50, 95, 99]).tolist()
+        return {'count': len(values), 'p50': p50, 'p95': p95, 'p99': p99, 'max': float(values.max())}
+
+    def summary(self):
+        """상태 표시줄용 요약: 마지막 작업 시간과 같은 작업의 최근 백분위"""
+        last = self.last()
+        if last is None:
+            return "측정 기록 없음"
+        name, _, _, duration, _ = last
+        stats = self.stats(name)
+        return (f"{name} {duration / 1e6:.1f} ms | "
+                f"p50 {stats['p50']:.1f} / p95 {stats['p95']:.1f} / p99 {stats['p99']:.1f} ms "
+                f"(n={stats['count']})")
+
+    def export_chrome_trace(self, path):
+        """chrome://tracing 또는 Perfetto에서 열 수 있는 JSON으로 저장"""
+        events = []
+        for name, category, start, duration, thread_id in list(self.records):
+            events.append({
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': (start - self.origin_ns) / 1000,
+                'dur': duration / 1000,
+                'pid': 0,
+                'tid': thread_id,
+            })
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return len(events)
+
+
+class _Span:
+    def __init__(self, profiler, name, category):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        if self.profiler.enabled:
+            self.profiler.record(self.name, self.category, self.start, time.perf_counter_ns() - self.start)
+
+
+# 애플리케이션 전체에서 사용하는 프로파일러
+profiler = Profiler()
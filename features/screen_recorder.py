@@ -1,54 +1,251 @@
+import time
+import atexit
+import weakref
+import threading
+from collections import deque
 import cv2
 import numpy as np
 from datetime import datetime
 
+# 큐가 가득 찼을 때의 처리 방식
+BLOCK = 'block'              # 자리가 날 때까지 캡처 쪽이 기다림 (프레임을 버리지 않음)
+DROP_OLDEST = 'drop_oldest'  # 가장 오래된 프레임을 버리고 새 프레임을 넣음
+DROP_NEWEST = 'drop_newest'  # 새 프레임을 버림
+POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+
+class FrameEncoder:
+    """
+    별도 스레드에서 프레임을 인코딩하여 파일에 쓰는 작업자
+    - submit()은 (캡처 시각, 프레임)을 크기가 정해진 큐에 넣고 바로 반환 (policy가 block이면 자리가 날 때까지 대기)
+    - 처음 probe_frames 프레임의 캡처 시각으로 실제 fps를 구한 뒤 파일을 엶
+    - 이후 프레임은 캡처 시각에 해당하는 위치에 기록하고, 빠진 자리는 앞 프레임을 반복해서 채움
+      (큐에서 버려지거나 캡처가 늦어져도 파일의 재생 시간이 실제 녹화 시간과 같음)
+    """
+    def __init__(self, filename, fourcc='mp4v', max_queue=32, policy=DROP_OLDEST, probe_frames=30):
+        if policy not in POLICIES:
+            raise ValueError(f"지원하지 않는 큐 처리 방식: {policy}")
+        self.filename = filename
+        self.fourcc = fourcc
+        self.max_queue = max_queue
+        self.policy = policy
+        self.probe_frames = probe_frames
+
+        self.condition = threading.Condition()
+        self.queue = deque()
+        self.running = False
+        self.thread = None
+        self.writer = None
+        self.fps = None
+        self.error = None
+
+        self.submitted = 0
+        self.dropped = 0
+        self.encoded = 0
+        self.duplicated = 0
+        # 기록 위치 계산용
+        self.first_time = None
+        self.next_slot = 0
+        self.last_frame = None
+        self.probe = []
+        _encoders.add(self)
+
+    def start(self):
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """큐에 남은 프레임을 모두 기록한 뒤 파일을 닫음"""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+    def submit(self, frame, timestamp=None):
+        """BGR 프레임을 넘깁니다. 넘긴 뒤에는 프레임을 수정하면 안 됩니다. 큐에 넣었으면 True"""
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        with self.condition:
+            if not self.running:
+                return False
+            self.submitted += 1
+            if len(self.queue) >= self.max_queue:
+                if self.policy == BLOCK:
+                    while self.running and len(self.queue) >= self.max_queue:
+                        self.condition.wait()
+                    if not self.running:
+                        self.dropped += 1
+                        return False
+                elif self.policy == DROP_OLDEST:
+                    self.queue.popleft()
+                    self.dropped += 1
+                else:
+                    self.dropped += 1
+                    return False
+            self.queue.append((timestamp, frame))
+            self.condition.notify_all()
+            return True
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.running and not self.queue:
+                    self.condition.wait()
+                if not self.queue:
+                    break
+                timestamp, frame = self.queue.popleft()
+                # block 방식에서 기다리는 캡처 쪽을 깨움
+                self.condition.notify_all()
+
+            try:
+                self.write(timestamp, frame)
+            except Exception as e:
+                print(f"녹화 프레임 저장 실패: {e}")
+                self.error = str(e)
+
+        try:
+            # fps를 구하기 전에 녹화가 끝났으면 모인 프레임만으로 파일을 만듦
+            if self.writer is None and self.probe:
+                self.open_writer()
+        except Exception as e:
+            print(f"녹화 프레임 저장 실패: {e}")
+            self.error = str(e)
+        if self.writer is not None:
+            self.writer.release()
+            self.writer = None
+
+    def write(self, timestamp, frame):
+        if self.error is not None:
+            return
+        if self.writer is None:
+            self.probe.append((timestamp, frame))
+            if len(self.probe) >= self.probe_frames:
+                self.open_writer()
+            return
+        self.write_at(timestamp, frame)
+
+    def open_writer(self):
+        """모아 둔 프레임의 캡처 간격으로 fps를 정하고 파일을 연 뒤 모아 둔 프레임을 기록"""
+        times = np.array([timestamp for timestamp, _ in self.probe])
+        fps = 30.0
+        if len(times) >= 2 and times[-1] > times[0]:
+            fps = (len(times) - 1) / (times[-1] - times[0])
+        self.fps = float(np.clip(fps, 1.0, 120.0))
+        height, width = self.probe[0][1].shape[:2]
+        self.writer = cv2.VideoWriter(self.filename, cv2.VideoWriter_fourcc(*self.fourcc),
+                                      self.fps, (width, height))
+        if not self.writer.isOpened():
+            self.writer = None
+            raise OSError(f"녹화 파일을 만들 수 없습니다: {self.filename}")
+        probe, self.probe = self.probe, []
+        for timestamp, frame in probe:
+            self.write_at(timestamp, frame)
+
+    def write_at(self, timestamp, frame):
+        if self.first_time is None:
+            self.first_time = timestamp
+        slot = int(round((timestamp - self.first_time) * self.fps))
+        if slot < self.next_slot:
+            # 같은 자리에 이미 기록한 프레임이 있으면 (캡처가 fps보다 빠름) 건너뜀
+            return
+        # 큐에서 버려졌거나 캡처가 늦어 빈 자리는 앞 프레임으로 채움
+        while self.next_slot < slot and self.last_frame is not None:
+            self.writer.write(self.last_frame)
+            self.next_slot += 1
+            self.duplicated += 1
+        self.writer.write(frame)
+        self.next_slot = slot + 1
+        self.last_frame = frame
+        self.encoded += 1
+
+    def stats(self):
+        with self.condition:
+            return {
+                'queued': len(self.queue),
+                'submitted': self.submitted,
+                'dropped': self.dropped,
+                'encoded': self.encoded,
+                'duplicated': self.duplicated,
+                'fps': self.fps,
+            }
+
+
 class ScreenRecorder:
     def __init__(self, parent=None):
         self.recording = False
-        self.writer = None
+        self.encoder = None
         self.parent = parent
         self.cap = None
-        
+        # 인코딩이 캡처를 따라가지 못할 때의 처리 방식 (POLICIES 중 하나)
+        self.policy = DROP_OLDEST
+        self.max_queue = 32
+
     def start_camera_recording(self):
         """웹캠 녹화 시작"""
         if not self.recording:
             self.cap = cv2.VideoCapture(0)  # 기본 웹캠
             if not self.cap.isOpened():
                 return False
-                
-            width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            
+
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"camera_recording_{timestamp}.mp4"
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            self.writer = cv2.VideoWriter(filename, fourcc, 30.0, (width, height))
+            # 파일 크기와 fps는 첫 프레임들을 받은 뒤 인코딩 스레드에서 정함
+            self.encoder = FrameEncoder(filename, 'mp4v', self.max_queue, self.policy)
+            self.encoder.start()
             self.recording = True
             return True
-            
+
     def stop_camera_recording(self):
         """웹캠 녹화 중지"""
         if self.recording:
             self.recording = False
-            if self.writer:
-                self.writer.release()
-                self.writer = None
             if self.cap:
                 self.cap.release()
                 self.cap = None
-                
+            if self.encoder:
+                self.encoder.stop()
+                self.encoder = None
+
     def capture_camera_frame(self):
         """웹캠 프레임 캡처 및 녹화"""
         if self.cap and self.cap.isOpened():
             ret, frame = self.cap.read()
             if ret:
+                captured_at = time.perf_counter()
+                # 녹화 중이면 인코딩 스레드로 넘김 (BGR 형식으로 저장)
+                if self.recording and self.encoder:
+                    self.encoder.submit(frame, captured_at)
+
                 # BGR을 RGB로 변환하여 화면에 표시
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # 녹화 중이면 프레임 저장
-                if self.recording and self.writer:
-                    self.writer.write(frame)  # BGR 형식으로 저장
-                    
-                return frame_rgb
+                return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         return None
-            
\ No newline at end of file
+
+    def stats(self):
+        """녹화 큐/인코딩 상태 (녹화 중이 아니면 None)"""
+        encoder = self.encoder
+        return encoder.stats() if encoder is not None else None
+
+    def summary(self):
+        """상태 표시줄용 한 줄 요약"""
+        stats = self.stats()
+        if stats is None:
+            return ""
+        fps = f"{stats['fps']:.1f} fps" if stats['fps'] is not None else "fps 측정 중"
+        return (f"녹화 {fps} | 대기 {stats['queued']} | 인코딩 {stats['encoded']} | "
+                f"버림 {stats['dropped']} | 채움 {stats['duplicated']}")
+
+
+# 프로그램 종료 시 남은 프레임을 기록하고 파일을 닫음
+_encoders = weakref.WeakSet()
+
+
+@atexit.register
+def _stop_encoders():
+    for encoder in list(_encoders):
+        encoder.stop()
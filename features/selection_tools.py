@@ -1,4 +1,3 @@
-import cv2
 import numpy as np
 from PyQt5.QtCore import QPoint
 from PyQt5.QtWidgets import QShortcut
@@ -6,15 +5,17 @@ from PyQt5.QtGui import QKeySequence
 from features.tools import DrawingTool
 
 class SelectionTool(DrawingTool):
+    reports_dirty = True
+
     def __init__(self, parent=None):
         super().__init__()
         self.parent = parent
         self.start_pos = None
-        self.temp_image = None
         self.selected_area = None
         self.selected_content = None
         self.is_moving = False
         self.drag_start = None
+        self.move_origin = None
         self.current_tool = 'rectangle'
         
         if self.parent:
@@ -55,21 +56,21 @@ class SelectionTool(DrawingTool):
             if (x <= pos.x() <= x + w and y <= pos.y() <= y + h):
                 self.is_moving = True
                 self.drag_start = pos
-                self.temp_image = image.copy()
+                # 이동을 시작한 위치 (놓을 때 흰색으로 채움)
+                self.move_origin = self.selected_area
                 return self.draw_selection_border(image)
         
         # 새로운 선택 시작
         self.start_pos = pos
-        self.temp_image = image.copy()
         self.selected_area = None
         self.selected_content = None
         self.is_moving = False
+        self.overlay.clear()
         return image
         
     def on_move(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
         if self.is_moving and self.selected_content is not None:
-            # 선택 영역 이동
-            image = self.temp_image.copy()
+            # 선택 영역 이동 (놓을 때까지 이미지는 그대로 두고 overlay로만 표시)
             dx = pos.x() - self.drag_start.x()
             dy = pos.y() - self.drag_start.y()
             
@@ -77,11 +78,10 @@ class SelectionTool(DrawingTool):
             new_x = max(0, min(x + dx, image.shape[1] - w))
             new_y = max(0, min(y + dy, image.shape[0] - h))
             
-            # 이전 위치를 흰색으로 채우기
-            image[y:y+h, x:x+w] = 255
-            
-            # 새 위치에 선택된 내용 표시
-            image[new_y:new_y+h, new_x:new_x+w] = self.selected_content
+            # 이전 위치는 흰색, 새 위치에 선택된 내용 표시
+            self.overlay.clear()
+            self.overlay.fill(*self.move_origin, (255, 255, 255))
+            self.overlay.image(new_x, new_y, self.selected_content)
             
             # 선택 영역 업데이트
             self.selected_area = (new_x, new_y, w, h)
@@ -90,34 +90,26 @@ class SelectionTool(DrawingTool):
             return self.draw_selection_border(image)
             
         elif self.start_pos:
-            # 새로운 선택 영역 표시
-            image = self.temp_image.copy()
+            # 새로운 선택 영역을 점선 테두리로 표시
             x1, y1 = self.start_pos.x(), self.start_pos.y()
             x2, y2 = pos.x(), pos.y()
-            
-            # 점선 테두리로 선택 영역 표시
-            x = min(x1, x2)
-            y = min(y1, y2)
-            w = abs(x2 - x1)
-            h = abs(y2 - y1)
-            
-            # 점선 테두리 그리기
-            for i in range(0, w, 4):
-                cv2.line(image, (x+i, y), (min(x+i+2, x+w), y), (0,0,0), 1)
-                cv2.line(image, (x+i, y+h), (min(x+i+2, x+w), y+h), (0,0,0), 1)
-            for i in range(0, h, 4):
-                cv2.line(image, (x, y+i), (x, min(y+i+2, y+h)), (0,0,0), 1)
-                cv2.line(image, (x+w, y+i), (x+w, min(y+i+2, y+h)), (0,0,0), 1)
+            self.overlay.clear()
+            self.overlay.ants(min(x1, x2), min(y1, y2), abs(x2 - x1), abs(y2 - y1))
             
         return image
         
     def on_release(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
         if self.is_moving:
-            # 이동 완료
-            x, y, w, h = self.selected_area
-            # 원래 위치는 이미 흰색으로 채워져 있음
-            image[y:y+h, x:x+w] = self.selected_content
+            # 이동 완료: 원래 위치를 흰색으로 채우고 새 위치에 내용을 씀
             self.is_moving = False
+            if self.selected_area != self.move_origin:
+                x, y, w, h = self.move_origin
+                image[y:y+h, x:x+w] = 255
+                self.mark_dirty(x, y, x + w - 1, y + h - 1)
+                x, y, w, h = self.selected_area
+                image[y:y+h, x:x+w] = self.selected_content
+                self.mark_dirty(x, y, x + w - 1, y + h - 1)
+            self.overlay.clear()
             return self.draw_selection_border(image)
             
         elif self.start_pos:
@@ -131,6 +123,7 @@ class SelectionTool(DrawingTool):
                 abs(x2 - x1),
                 abs(y2 - y1)
             )
+            self.start_pos = None
             
             # 선택된 영역의 내용 저장
             x, y, w, h = self.selected_area
@@ -141,16 +134,10 @@ class SelectionTool(DrawingTool):
         return image
 
     def draw_selection_border(self, image: np.ndarray) -> np.ndarray:
-        """선택 영역 테두리 그리기"""
+        """선택 영역 테두리 표시 (이미지에는 그리지 않고 overlay에 움직이는 점선으로 표시)"""
+        self.overlay.remove('ants')
         if self.selected_area:
-            x, y, w, h = self.selected_area
-            # 점선 테두리 그리기
-            for i in range(0, w, 4):
-                cv2.line(image, (x+i, y), (min(x+i+2, x+w), y), (0,0,0), 1)
-                cv2.line(image, (x+i, y+h), (min(x+i+2, x+w), y+h), (0,0,0), 1)
-            for i in range(0, h, 4):
-                cv2.line(image, (x, y+i), (x, min(y+i+2, y+h)), (0,0,0), 1)
-                cv2.line(image, (x+w, y+i), (x+w, min(y+i+2, y+h)), (0,0,0), 1)
+            self.overlay.ants(*self.selected_area)
         return image
 
     def copy_selection(self, image: np.ndarray) -> np.ndarray:
@@ -169,6 +156,8 @@ class SelectionTool(DrawingTool):
             # 새로운 위치에 붙여넣기
             image[y:y+h, x:x+w] = self.selected_content.copy()
             
+            self.mark_dirty(x, y, x + w - 1, y + h - 1)
+            
             # 붙여넣은 영역을 새로운 선택 영역으로 설정
             self.selected_area = (x, y, w, h)
             return self.draw_selection_border(image)
@@ -179,6 +168,8 @@ class SelectionTool(DrawingTool):
         if self.selected_area:
             x, y, w, h = self.selected_area
             image[y:y+h, x:x+w] = 255  # 흰색으로 채우기
+            self.mark_dirty(x, y, x + w - 1, y + h - 1)
             self.selected_area = None
             self.selected_content = None
+            self.overlay.clear()
         return image
\ No newline at end of file
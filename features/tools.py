@@ -4,13 +4,115 @@ import numpy as np
 from PyQt5.QtCore import QPoint
 from PyQt5.QtWidgets import QInputDialog, QFontDialog, QDialog, QVBoxLayout, QComboBox, QPushButton, QLabel, QSpinBox
 from PIL import Image, ImageDraw, ImageFont
+from features.profiler import profiler
+
+def union_rect(a, b):
+    """두 영역 (x, y, w, h)을 감싸는 영역 (한쪽이 None이면 다른 쪽)"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    x0, y0 = min(a[0], b[0]), min(a[1], b[1])
+    x1, y1 = max(a[0] + a[2], b[0] + b[2]), max(a[1] + a[3], b[1] + b[3])
+    return (x0, y0, x1 - x0, y1 - y0)
+
+class Overlay:
+    """
+    도구가 화면에만 잠깐 보여 주는 그래픽 목록 (고무줄 도형, 선택 영역 점선, 크기 조절 핸들)
+    - 좌표는 모두 이미지 좌표이고, 색상은 이미지에 그릴 때와 같은 순서의 튜플
+    - 이미지에는 그리지 않고 CanvasView가 이미지 위에 QPainter로 그리므로 비용이 이미지 크기와 무관
+    - changed: 화면에 아직 반영하지 않은 영역 (지운 도형 + 새 도형을 감싸는 영역)
+    항목은 (종류, 영역 (x, y, w, h), 인자) 튜플입니다.
+    """
+    def __init__(self):
+        self.items = []
+        self.changed = None
+
+    @staticmethod
+    def bounds(x0, y0, x1, y1, margin=0):
+        """(x0, y0) ~ (x1, y1) (양 끝 포함)에 margin을 더한 영역"""
+        left, top = min(x0, x1) - margin, min(y0, y1) - margin
+        return (left, top, max(x0, x1) + margin + 1 - left, max(y0, y1) + margin + 1 - top)
+
+    def add(self, kind, bounds, *args):
+        self.items.append((kind, bounds, args))
+        self.changed = union_rect(self.changed, bounds)
+
+    def clear(self):
+        for _, bounds, _ in self.items:
+            self.changed = union_rect(self.changed, bounds)
+        self.items = []
+
+    def remove(self, kind):
+        """kind 종류의 항목만 지움"""
+        kept = []
+        for item in self.items:
+            if item[0] == kind:
+                self.changed = union_rect(self.changed, item[1])
+            else:
+                kept.append(item)
+        self.items = kept
+
+    def take_changed(self):
+        """다시 그려야 할 영역을 돌려주고 비움"""
+        changed, self.changed = self.changed, None
+        return changed
+
+    def has_ants(self):
+        return any(kind == 'ants' for kind, _, _ in self.items)
+
+    def rect(self, x0, y0, x1, y1, color, thickness):
+        """cv2.rectangle과 같은 사각형 테두리"""
+        self.add('rect', self.bounds(x0, y0, x1, y1, abs(thickness) // 2 + 2), (x0, y0, x1, y1), color, thickness)
+
+    def circle(self, center_x, center_y, radius, color, thickness):
+        self.add('circle', self.bounds(center_x - radius, center_y - radius, center_x + radius, center_y + radius,
+                                       abs(thickness) // 2 + 2),
+                 center_x, center_y, radius, color, thickness)
+
+    def polygon(self, points, color, thickness):
+        """닫힌 다각형 테두리 (points: N x 2 배열)"""
+        points = np.asarray(points).reshape(-1, 2)
+        low, high = points.min(axis=0), points.max(axis=0)
+        self.add('polygon', self.bounds(int(low[0]), int(low[1]), int(high[0]), int(high[1]), abs(thickness) // 2 + 2),
+                 points, color, thickness)
+
+    def ants(self, x, y, w, h):
+        """(x, y) ~ (x + w, y + h)를 잇는 움직이는 점선 (선택 영역 표시)"""
+        self.add('ants', self.bounds(x, y, x + w, y + h, 1), x, y, w, h)
+
+    def handles(self, points):
+        """크기 조절 핸들 (화면에서 일정한 크기의 작은 사각형)"""
+        points = np.asarray(points).reshape(-1, 2)
+        low, high = points.min(axis=0), points.max(axis=0)
+        self.add('handles', self.bounds(int(low[0]), int(low[1]), int(high[0]), int(high[1])), points)
+
+    def fill(self, x, y, w, h, color):
+        self.add('fill', (x, y, w, h), x, y, w, h, color)
+
+    def image(self, x, y, content):
+        """content 이미지를 (x, y)에 표시 (복사하지 않으므로 표시하는 동안 바꾸지 않아야 함)"""
+        height, width = content.shape[:2]
+        self.add('image', (x, y, width, height), x, y, np.ascontiguousarray(content))
 
 class DrawingTool(ABC):
-    """그리기 도구의 추상 기본 클래스"""
+    """
+    그리기 도구의 추상 기본 클래스
+    마우스 이벤트 메서드는 넘겨받은 이미지를 제자리에서 수정하고 그 이미지를 반환합니다.
+    reports_dirty가 True인 도구는 이벤트마다 바꾼 영역을 dirty_rect (x, y, w, h)에 남기며,
+    호출하는 쪽은 이벤트 전에 dirty_rect를 None으로 비우고 changed_region()으로 결과를 읽습니다.
+    드래그 중의 미리보기는 이미지 대신 overlay에 그리고, 이미지는 버튼을 놓을 때만 수정합니다.
+    """
+    # 바꾼 영역을 알려 주는 도구인지 (False면 호출하는 쪽은 이미지 전체가 바뀌었다고 봄)
+    reports_dirty = False
+
     def __init__(self):
         """초기화 메서드"""
         self.color = (0, 0, 0)
         self.thickness = 2
+        self.dirty_rect = None
+        # 드래그 중 미리보기 (이미지 위에 따로 표시)
+        self.overlay = Overlay()
         
     @abstractmethod
     def on_press(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
@@ -35,8 +137,33 @@ class DrawingTool(ABC):
         """선 두께 설정 메서드"""
         self.thickness = thickness
 
+    def mark_dirty(self, x0, y0, x1, y1, margin=0):
+        """(x0, y0) ~ (x1, y1) (양 끝 포함)에 margin을 더한 영역을 바뀐 영역에 추가"""
+        left, right = min(x0, x1) - margin, max(x0, x1) + margin
+        top, bottom = min(y0, y1) - margin, max(y0, y1) + margin
+        self.dirty_rect = union_rect(self.dirty_rect, (left, top, right - left + 1, bottom - top + 1))
+
+    def changed_region(self, image):
+        """마지막 이벤트에서 바뀐 영역 (이미지 범위로 자른 x, y, w, h). 바뀐 곳이 없으면 None"""
+        height, width = image.shape[:2]
+        if not self.reports_dirty:
+            return (0, 0, width, height)
+        if self.dirty_rect is None:
+            return None
+        x, y, w, h = self.dirty_rect
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(width, x + w), min(height, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return (x0, y0, x1 - x0, y1 - y0)
+
+# 성능 측정을 켜면 모든 도구의 마우스 이벤트 처리 시간을 기록
+profiler.register(DrawingTool, ['on_press', 'on_move', 'on_release'], 'tool', subclasses=True)
+
 class PenTool(DrawingTool):
     """펜 도구 클래스"""
+    reports_dirty = True
+
     def __init__(self):
         super().__init__()
         self.last_point = None  # 마지막 점의 위치를 저장하는 변수
@@ -54,6 +181,9 @@ class PenTool(DrawingTool):
                     (pos.x(), pos.y()),
                     self.color[::-1],  # BGR -> RGB 색상 변환
                     self.thickness)
+            # 선 두께의 절반만큼 바깥까지 칠해짐
+            self.mark_dirty(self.last_point.x(), self.last_point.y(), pos.x(), pos.y(),
+                            self.thickness // 2 + 2)
         self.last_point = pos
         return image
         
@@ -62,6 +192,8 @@ class PenTool(DrawingTool):
         self.last_point = None
         return image
 class EraserTool(DrawingTool):
+    reports_dirty = True
+
     def __init__(self):
         super().__init__()
         self.last_point = None
@@ -77,6 +209,8 @@ class EraserTool(DrawingTool):
                     (pos.x(), pos.y()),
                     (255, 255, 255),
                     self.thickness * 2)
+            self.mark_dirty(self.last_point.x(), self.last_point.y(), pos.x(), pos.y(),
+                            self.thickness + 2)
         self.last_point = pos
         return image
         
@@ -85,57 +219,73 @@ class EraserTool(DrawingTool):
         return image
 
 class RectangleTool(DrawingTool):
+    reports_dirty = True
+
     def __init__(self):
         super().__init__()
         self.start_pos = None
-        self.temp_image = None
         
     def on_press(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
         self.start_pos = pos
-        self.temp_image = image.copy()
         return image
         
     def on_move(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
         if self.start_pos:
-            image = self.temp_image.copy()
+            # 이미지는 그대로 두고 미리보기 도형만 바꿈
+            self.overlay.clear()
+            self.overlay.rect(self.start_pos.x(), self.start_pos.y(), pos.x(), pos.y(),
+                              self.color[::-1], self.thickness)
+        return image
+        
+    def on_release(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
+        # 드래그한 경우에만 (미리보기가 있을 때) 이미지에 그림
+        if self.start_pos and self.overlay.items:
+            self.overlay.clear()
             cv2.rectangle(image,
                         (self.start_pos.x(), self.start_pos.y()),
                         (pos.x(), pos.y()),
                         self.color[::-1],
                         self.thickness)
-        return image
-        
-    def on_release(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
+            self.mark_dirty(self.start_pos.x(), self.start_pos.y(), pos.x(), pos.y(),
+                            self.thickness // 2 + 2)
         self.start_pos = None
-        self.temp_image = None
         return image
 
 class CircleTool(DrawingTool):
+    reports_dirty = True
+
     def __init__(self):
         super().__init__()
         self.start_pos = None
-        self.temp_image = None
         
     def on_press(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
         self.start_pos = pos
-        self.temp_image = image.copy()
         return image
+
+    def radius(self, pos):
+        return int(((pos.x() - self.start_pos.x())**2 + 
+                    (pos.y() - self.start_pos.y())**2)**0.5)
         
     def on_move(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
         if self.start_pos:
-            image = self.temp_image.copy()
-            radius = int(((pos.x() - self.start_pos.x())**2 + 
-                         (pos.y() - self.start_pos.y())**2)**0.5)
+            self.overlay.clear()
+            self.overlay.circle(self.start_pos.x(), self.start_pos.y(), self.radius(pos),
+                                self.color[::-1], self.thickness)
+        return image
+        
+    def on_release(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
+        if self.start_pos and self.overlay.items:
+            self.overlay.clear()
+            radius = self.radius(pos)
             cv2.circle(image,
                       (self.start_pos.x(), self.start_pos.y()),
                       radius,
                       self.color[::-1],
                       self.thickness)
-        return image
-        
-    def on_release(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
+            center_x, center_y = self.start_pos.x(), self.start_pos.y()
+            self.mark_dirty(center_x - radius, center_y - radius, center_x + radius, center_y + radius,
+                            self.thickness // 2 + 2)
         self.start_pos = None
-        self.temp_image = None
         return image
 
 class FontDialog(QDialog):
@@ -257,25 +407,22 @@ class TextTool(DrawingTool):
         self.font_size = thickness / 2  # 두께를 폰트 크기로 변환
 
 class SelectTool(DrawingTool):
+    reports_dirty = True
+
     def __init__(self):
         super().__init__()
         self.start_pos = None
-        self.temp_image = None
         self.selected_area = None
         
     def on_press(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
         self.start_pos = pos
-        self.temp_image = image.copy()
+        self.overlay.clear()
         return image
         
     def on_move(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
         if self.start_pos:
-            image = self.temp_image.copy()
-            cv2.rectangle(image,
-                        (self.start_pos.x(), self.start_pos.y()),
-                        (pos.x(), pos.y()),
-                        (0, 0, 255),
-                        2)
+            self.overlay.clear()
+            self.overlay.rect(self.start_pos.x(), self.start_pos.y(), pos.x(), pos.y(), (0, 0, 255), 2)
         return image
         
     def on_release(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
@@ -286,15 +433,18 @@ class SelectTool(DrawingTool):
                 abs(pos.x() - self.start_pos.x()),
                 abs(pos.y() - self.start_pos.y())
             )
+            # 선택 영역 표시는 이미지에 그리지 않고 overlay에 남겨 둠
+            self.overlay.clear()
+            self.overlay.rect(self.start_pos.x(), self.start_pos.y(), pos.x(), pos.y(), (0, 0, 255), 2)
         self.start_pos = None
-        self.temp_image = None
         return image
 
 class PolygonTool(DrawingTool):
+    reports_dirty = True
+
     def __init__(self):
         super().__init__()
         self.start_pos = None
-        self.temp_image = None
         self.sides = 4  # 기본값은 사각형
         
     def set_sides(self):
@@ -308,37 +458,40 @@ class PolygonTool(DrawingTool):
         
     def on_press(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
         self.start_pos = pos
-        self.temp_image = image.copy()
         return image
+
+    def polygon_points(self, pos):
+        """start_pos가 중심이고 pos를 지나는 원에 내접하는 정다각형 꼭지점 (N x 1 x 2)"""
+        # 중심점과 반지름 계산
+        center_x = self.start_pos.x()
+        center_y = self.start_pos.y()
+        radius = int(np.sqrt((pos.x() - center_x)**2 + 
+                           (pos.y() - center_y)**2))
+        
+        # 다각형 꼭지점 계산
+        points = []
+        for i in range(self.sides):
+            angle = 2 * np.pi * i / self.sides - np.pi / 2
+            x = center_x + int(radius * np.cos(angle))
+            y = center_y + int(radius * np.sin(angle))
+            points.append([x, y])
+        points = np.array(points, np.int32)
+        return points.reshape((-1, 1, 2))
         
     def on_move(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
         if self.start_pos:
-            image = self.temp_image.copy()
-            
-            # 중심점과 반지름 계산
-            center_x = self.start_pos.x()
-            center_y = self.start_pos.y()
-            radius = int(np.sqrt((pos.x() - center_x)**2 + 
-                               (pos.y() - center_y)**2))
-            
-            # 다각형 꼭지점 계산
-            points = []
-            for i in range(self.sides):
-                angle = 2 * np.pi * i / self.sides - np.pi / 2
-                x = center_x + int(radius * np.cos(angle))
-                y = center_y + int(radius * np.sin(angle))
-                points.append([x, y])
-            
-            # 다형 그리기
-            points = np.array(points, np.int32)
-            points = points.reshape((-1, 1, 2))
-            cv2.polylines(image, [points], True, self.color[::-1], self.thickness)
-            
+            self.overlay.clear()
+            self.overlay.polygon(self.polygon_points(pos), self.color[::-1], self.thickness)
         return image
         
     def on_release(self, image: np.ndarray, pos: QPoint) -> np.ndarray:
         if self.start_pos:
-            image = self.on_move(image, pos)
+            self.overlay.clear()
+            # 다각형 그리기
+            points = self.polygon_points(pos)
+            cv2.polylines(image, [points], True, self.color[::-1], self.thickness)
+            low, high = points.reshape(-1, 2).min(axis=0), points.reshape(-1, 2).max(axis=0)
+            self.mark_dirty(int(low[0]), int(low[1]), int(high[0]), int(high[1]),
+                            self.thickness // 2 + 2)
             self.start_pos = None
-            self.temp_image = None
         return image
\ No newline at end of file
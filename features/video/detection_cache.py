@@ -0,0 +1,160 @@
+import os
+import hashlib
+import threading
+import numpy as np
+from numpy.lib.format import open_memmap
+from .object_detector import DETECTION_DTYPE
+
+"""프레임별 물체 감지 결과 캐시 (메모리 + 메모리 맵 NumPy 파일)"""
+
+# 기본 저장 위치 (비디오 내용 해시로 구분하므로 파일 이름이 바뀌어도 다시 사용)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'opencv_editor', 'detections')
+
+# 프레임 번호 → 감지 결과 위치 (count = -1 이면 아직 감지하지 않은 프레임)
+INDEX_DTYPE = np.dtype([('offset', np.int64), ('count', np.int32)])
+
+
+def video_hash(path, chunk=1024 * 1024):
+    """비디오 파일 크기와 앞/뒤 chunk 바이트로 만든 해시 (큰 파일도 바로 계산)"""
+    size = os.path.getsize(path)
+    digest = hashlib.sha1(str(size).encode(), usedforsecurity=False)
+    with open(path, 'rb') as f:
+        digest.update(f.read(chunk))
+        if size > chunk:
+            f.seek(max(chunk, size - chunk))
+            digest.update(f.read(chunk))
+    return digest.hexdigest()[:16]
+
+
+class DetectionCache:
+    """
+    (비디오 해시, 프레임 번호, 모델, 임계값) 별 감지 결과 캐시
+    - 메모리: 프레임 번호 → DETECTION_DTYPE 배열
+    - 디스크: 비디오/모델 조합마다 파일 두 개를 메모리 맵으로 열어 둠
+        <비디오>-<모델>-index.npy : 프레임마다 (offset, count)
+        <비디오>-<모델>-boxes.npy : 모든 프레임의 감지 결과를 이어 붙인 구조 배열
+      결과를 먼저 쓰고 색인을 나중에 쓰므로 중간에 종료되어도 색인이 가리키는 결과는 항상 완전함
+    감지 작업자 스레드와 UI/분석 스레드에서 동시에 사용할 수 있습니다.
+    """
+    def __init__(self, video_path, frame_count, model_key, cache_dir=DEFAULT_CACHE_DIR):
+        self.frame_count = max(0, int(frame_count))
+        self.memory = {}
+        self.lock = threading.Lock()
+        self.index = None
+        self.boxes = None
+        self.used = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.index_path = None
+        self.boxes_path = None
+        if cache_dir and self.frame_count > 0:
+            try:
+                prefix = os.path.join(cache_dir, f"{video_hash(video_path)}-{model_key}")
+                self.index_path = prefix + '-index.npy'
+                self.boxes_path = prefix + '-boxes.npy'
+                os.makedirs(cache_dir, exist_ok=True)
+                self.open_files()
+            except (OSError, ValueError) as e:
+                print(f"감지 캐시 파일 열기 실패: {e}")
+                self.index = None
+                self.boxes = None
+
+    def open_files(self):
+        index = None
+        if os.path.exists(self.index_path) and os.path.exists(self.boxes_path):
+            index = np.load(self.index_path, mmap_mode='r+')
+            if index.dtype != INDEX_DTYPE or index.shape != (self.frame_count,):
+                # 프레임 수가 다르면 다른 파일로 보고 새로 만듦
+                del index
+                index = None
+        if index is None:
+            index = open_memmap(self.index_path, mode='w+', dtype=INDEX_DTYPE, shape=(self.frame_count,))
+            index['offset'] = 0
+            index['count'] = -1
+            boxes = open_memmap(self.boxes_path, mode='w+', dtype=DETECTION_DTYPE,
+                                shape=(max(1024, self.frame_count * 8),))
+        else:
+            boxes = np.load(self.boxes_path, mmap_mode='r+')
+        done = index['count'] >= 0
+        self.used = int((index['offset'][done] + index['count'][done]).max()) if done.any() else 0
+        self.index = index
+        self.boxes = boxes
+
+    def get(self, frame_idx):
+        """저장된 감지 결과 (없으면 None)"""
+        with self.lock:
+            detections = self.memory.get(frame_idx)
+            if detections is not None:
+                self.hits += 1
+                return detections
+            if self.index is not None and 0 <= frame_idx < self.frame_count:
+                offset, count = self.index[frame_idx].tolist()
+                if count >= 0:
+                    detections = np.array(self.boxes[offset:offset + count])
+                    detections.setflags(write=False)
+                    self.memory[frame_idx] = detections
+                    self.disk_hits += 1
+                    return detections
+            self.misses += 1
+            return None
+
+    def put(self, frame_idx, detections):
+        stored = np.array(detections, dtype=DETECTION_DTYPE)
+        stored.setflags(write=False)
+        with self.lock:
+            if frame_idx in self.memory:
+                return
+            self.memory[frame_idx] = stored
+            if self.index is None or not 0 <= frame_idx < self.frame_count or self.index[frame_idx]['count'] >= 0:
+                return
+            try:
+                if self.used + len(stored) > len(self.boxes):
+                    self.grow(self.used + len(stored))
+                self.boxes[self.used:self.used + len(stored)] = stored
+                self.index[frame_idx] = (self.used, len(stored))
+                self.used += len(stored)
+            except OSError as e:
+                # 디스크가 가득 찼거나 파일에 문제가 있으면 메모리에만 보관
+                print(f"감지 캐시 저장 실패: {e}")
+                self.index = None
+                self.boxes = None
+
+    def grow(self, required):
+        """결과 파일을 두 배씩 늘림 (새 파일에 복사한 뒤 교체)"""
+        capacity = len(self.boxes)
+        while capacity < required:
+            capacity *= 2
+        temp_path = self.boxes_path + '.tmp.npy'
+        boxes = open_memmap(temp_path, mode='w+', dtype=DETECTION_DTYPE, shape=(capacity,))
+        boxes[:self.used] = self.boxes[:self.used]
+        boxes.flush()
+        # Windows 에서는 열려 있는 메모리 맵 파일을 교체할 수 없으므로 먼저 닫음
+        del boxes
+        self.boxes = None
+        os.replace(temp_path, self.boxes_path)
+        self.boxes = np.load(self.boxes_path, mmap_mode='r+')
+
+    def flush(self):
+        with self.lock:
+            if self.index is not None:
+                self.boxes.flush()
+                self.index.flush()
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            self.index = None
+            self.boxes = None
+            self.memory.clear()
+
+    def stats(self):
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'frames': len(self.memory),
+                'stored_frames': int((self.index['count'] >= 0).sum()) if self.index is not None else 0,
+            }
@@ -0,0 +1,179 @@
+import time
+import atexit
+import weakref
+import threading
+from collections import deque
+
+"""물체 감지를 별도 스레드에서 실행하는 작업자 (항상 가장 최신 프레임만 감지)"""
+
+
+class DetectionResult:
+    """감지 작업자가 발행한 결과"""
+    def __init__(self, index, detections, submitted_at, finished_at):
+        self.index = index              # 감지한 원본 프레임 번호 (모르면 None)
+        self.detections = detections    # DETECTION_DTYPE 구조 배열
+        self.submitted_at = submitted_at
+        self.finished_at = finished_at
+
+
+class DetectionWorker:
+    """
+    물체 감지 작업자
+    - submit()은 프레임을 한 칸짜리 슬롯에 넣기만 하고 바로 반환 (추론을 기다리지 않음)
+    - 추론 중에 들어온 프레임은 더 새 프레임이 오면 덮어써서 버림
+    - 화면 쪽은 latest()로 가장 최근 결과를 가져와 그리기만 함
+    스레드는 처음 submit() 할 때 시작합니다.
+    """
+    def __init__(self, detector, window=30):
+        self.detector = detector
+        # 감지 결과를 프레임 번호로 저장할 DetectionCache (선택)
+        self.cache = None
+        self.condition = threading.Condition()
+        self.pending = None
+        self.result = None
+        self.running = False
+        self.thread = None
+        # 결과를 버려야 하는지 판단하기 위한 세대 번호 (clear() 할 때마다 증가)
+        self.generation = 0
+        self.last_submitted = None
+        self.last_submitted_at = None
+        self.skipped = 0
+        self.finished_times = deque(maxlen=window)
+        self.inference_times = deque(maxlen=window)
+        _workers.add(self)
+
+    def start(self):
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        # 추론 중인 네트워크를 쥔 채로 종료되지 않도록 대기
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2.0)
+        self.thread = None
+
+    def clear(self):
+        """대기 중인 프레임과 결과를 버림 (다른 비디오를 열었을 때)"""
+        with self.condition:
+            self.generation += 1
+            self.pending = None
+            self.result = None
+            self.last_submitted = None
+            self.last_submitted_at = None
+            self.skipped = 0
+            self.finished_times.clear()
+            self.inference_times.clear()
+
+    def submit(self, frame, index=None):
+        """
+        감지할 프레임을 넘깁니다. (BGR, 작업자가 읽는 동안 수정하면 안 됨)
+        같은 프레임의 결과가 이미 있으면 다시 감지하지 않습니다.
+        """
+        if not self.running:
+            self.start()
+        now = time.perf_counter()
+        with self.condition:
+            self.last_submitted = index
+            if index is not None and self.result is not None and self.result.index == index:
+                self.last_submitted_at = self.result.submitted_at
+                return
+            self.last_submitted_at = now
+            if self.pending is not None:
+                self.skipped += 1
+            self.pending = (frame, index, now, self.generation)
+            self.condition.notify()
+
+    def latest(self):
+        """가장 최근 감지 결과 (없으면 None)"""
+        return self.result
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.running and self.pending is None:
+                    self.condition.wait()
+                if not self.running:
+                    break
+                frame, index, submitted_at, generation = self.pending
+                self.pending = None
+
+            start = time.perf_counter()
+            try:
+                detections = self.detector.detect(frame)
+            except Exception as e:
+                print(f"물체 감지 실패: {e}")
+                continue
+            finished_at = time.perf_counter()
+
+            with self.condition:
+                if generation != self.generation:
+                    continue
+                self.result = DetectionResult(index, detections, submitted_at, finished_at)
+                self.inference_times.append(finished_at - start)
+                self.finished_times.append(finished_at)
+                cache = self.cache
+            if cache is not None and index is not None:
+                cache.put(index, detections)
+
+    def stats(self):
+        """
+        추론 속도와 결과가 얼마나 늦었는지
+        - inference_fps: 최근 결과가 나온 간격 기준 초당 결과 수
+        - inference_ms: 최근 추론 한 번의 평균 시간
+        - age_frames: 마지막으로 넘긴 프레임과 결과의 원본 프레임 번호 차이
+        - age_ms: 결과의 원본 프레임과 마지막으로 넘긴 프레임 사이의 시간
+        - latency_ms: 프레임을 넘긴 뒤 결과가 나올 때까지 걸린 시간
+        """
+        with self.condition:
+            finished = list(self.finished_times)
+            inference = list(self.inference_times)
+            result = self.result
+            last_submitted = self.last_submitted
+            last_submitted_at = self.last_submitted_at
+            skipped = self.skipped
+
+        fps = 0.0
+        if len(finished) >= 2 and finished[-1] > finished[0]:
+            fps = (len(finished) - 1) / (finished[-1] - finished[0])
+        age_frames = None
+        age_ms = None
+        latency_ms = None
+        if result is not None:
+            age_ms = (last_submitted_at - result.submitted_at) * 1000
+            latency_ms = (result.finished_at - result.submitted_at) * 1000
+            if result.index is not None and last_submitted is not None:
+                age_frames = last_submitted - result.index
+        return {
+            'inference_fps': fps,
+            'inference_ms': sum(inference) / len(inference) * 1000 if inference else 0.0,
+            'age_frames': age_frames,
+            'age_ms': age_ms,
+            'latency_ms': latency_ms,
+            'skipped': skipped,
+        }
+
+    def summary(self):
+        """상태 표시줄용 한 줄 요약"""
+        stats = self.stats()
+        if stats['age_ms'] is None:
+            return "감지 대기 중"
+        age = f"{stats['age_frames']}프레임, " if stats['age_frames'] is not None else ""
+        return (f"감지 {stats['inference_fps']:.1f} fps ({stats['inference_ms']:.0f} ms) | "
+                f"결과 지연 {age}{stats['age_ms']:.0f} ms | 건너뜀 {stats['skipped']}")
+
+
+# 프로그램 종료 시 추론 중인 스레드를 정리
+_workers = weakref.WeakSet()
+
+
+@atexit.register
+def _stop_workers():
+    for worker in list(_workers):
+        worker.stop()
@@ -0,0 +1,211 @@
+import atexit
+import bisect
+import weakref
+import threading
+import cv2
+
+"""디코딩된 프레임 캐시 (키프레임 색인, 재생 위치 주변 링 버퍼, 재생 방향 미리 읽기)"""
+
+
+class KeyframeIndex:
+    """
+    키프레임 위치 색인
+    FFmpeg 백엔드의 raw 모드(CAP_PROP_FORMAT=-1)로 디코딩 없이 패킷만 읽어서
+    백그라운드에서 한 번 만듭니다. 지원하지 않는 백엔드면 keyframes는 빈 목록이 됩니다.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.keyframes = []
+        self.frame_count = None
+        self.ready = threading.Event()
+        threading.Thread(target=self.build, daemon=True).start()
+
+    def build(self):
+        keyframes = []
+        count = 0
+        cap = cv2.VideoCapture(self.path, cv2.CAP_FFMPEG)
+        try:
+            if cap.isOpened() and cap.set(cv2.CAP_PROP_FORMAT, -1):
+                while True:
+                    ok, _ = cap.read()
+                    if not ok:
+                        break
+                    if cap.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                        keyframes.append(count)
+                    count += 1
+        except cv2.error as e:
+            print(f"키프레임 색인 생성 실패: {e}")
+            keyframes = []
+        finally:
+            cap.release()
+        if keyframes:
+            self.keyframes = keyframes
+            self.frame_count = count
+        self.ready.set()
+
+    def keyframe_before(self, index):
+        """index 이하에서 가장 가까운 키프레임 (색인이 없으면 None)"""
+        if not self.keyframes:
+            return None
+        pos = bisect.bisect_right(self.keyframes, index) - 1
+        return self.keyframes[pos] if pos >= 0 else 0
+
+
+class FrameRingCache:
+    """
+    재생 위치 주변의 디코딩된 프레임을 보관하는 메모리 제한 캐시
+    예산을 넘으면 재생 위치에서 가장 먼 프레임부터 제거합니다.
+    """
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.frames = {}
+        self.current_bytes = 0
+        self.frame_bytes = None
+        self.playhead = 0
+        self.lock = threading.Lock()
+
+    def get(self, index):
+        with self.lock:
+            return self.frames.get(index)
+
+    def __contains__(self, index):
+        with self.lock:
+            return index in self.frames
+
+    def put(self, index, frame):
+        with self.lock:
+            old = self.frames.pop(index, None)
+            if old is not None:
+                self.current_bytes -= old.nbytes
+            self.frames[index] = frame
+            self.current_bytes += frame.nbytes
+            self.frame_bytes = frame.nbytes
+            while self.current_bytes > self.max_bytes and len(self.frames) > 1:
+                farthest = max(self.frames, key=lambda i: abs(i - self.playhead))
+                self.current_bytes -= self.frames.pop(farthest).nbytes
+
+    def set_playhead(self, index):
+        self.playhead = index
+
+    def capacity_frames(self):
+        """지금까지 저장한 프레임 크기 기준으로 보관할 수 있는 프레임 수"""
+        if not self.frame_bytes:
+            return 1
+        return max(1, self.max_bytes // self.frame_bytes)
+
+    def clear(self):
+        with self.lock:
+            self.frames.clear()
+            self.current_bytes = 0
+
+
+def decode_range(cap, start, end, cache, index, cancelled=None):
+    """
+    start~end 프레임을 디코딩하여 캐시에 저장합니다.
+    start 이전의 키프레임으로 이동한 뒤 순서대로 읽으므로 GOP를 한 번만 디코딩합니다.
+    디코딩을 마친 뒤 cap의 다음 프레임 번호를 반환합니다. (실패하거나 취소되면 None)
+    """
+    keyframe = index.keyframe_before(start) if index is not None else None
+    position = keyframe if keyframe is not None else start
+    cap.set(cv2.CAP_PROP_POS_FRAMES, position)
+    # 키프레임부터 start 직전까지는 디코딩 결과가 필요 없으므로 grab()만 호출
+    while position < start:
+        if (cancelled and cancelled()) or not cap.grab():
+            return None
+        position += 1
+    while position <= end:
+        if cancelled and cancelled():
+            return None
+        ok, frame = cap.read()
+        if not ok:
+            return None
+        cache.put(position, frame)
+        position += 1
+    return position
+
+
+class FramePrefetcher:
+    """
+    재생 방향으로 프레임을 미리 디코딩하는 백그라운드 스레드
+    - 순방향: 재생 위치 다음 프레임들을 이어서 읽음
+    - 역방향: 재생 위치 앞쪽 구간을 GOP 단위로 한 번에 디코딩
+    UI 스레드의 캡처 객체와 충돌하지 않도록 별도의 캡처 객체를 사용합니다.
+    """
+    def __init__(self, path, cache, index, ahead=30):
+        self.path = path
+        self.cache = cache
+        self.index = index
+        self.ahead = ahead
+        self.request = None
+        self.running = True
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        _prefetchers.add(self)
+
+    def prefetch(self, playhead, direction):
+        """가장 최근 요청만 처리 (이전 요청은 버림)"""
+        with self.condition:
+            self.request = (playhead, direction)
+            self.condition.notify()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        # 디코딩 중인 캡처 객체가 해제될 때까지 대기
+        if self.thread is not threading.current_thread():
+            self.thread.join(timeout=2.0)
+
+    def run(self):
+        cap = cv2.VideoCapture(self.path)
+        next_index = None
+        try:
+            while True:
+                with self.condition:
+                    while self.running and self.request is None:
+                        self.condition.wait()
+                    if not self.running:
+                        break
+                    playhead, direction = self.request
+                    self.request = None
+
+                if direction >= 0:
+                    missing = [i for i in range(playhead + 1, playhead + 1 + self.ahead) if i not in self.cache]
+                else:
+                    # 역방향은 GOP를 다시 디코딩하는 횟수를 줄이도록 캐시 절반까지 한 번에 채움
+                    window = max(self.ahead, self.cache.capacity_frames() // 2)
+                    missing = [i for i in range(max(0, playhead - window), playhead) if i not in self.cache]
+                if not missing:
+                    continue
+                start, end = missing[0], missing[-1]
+                if direction >= 0 and next_index is not None and 0 <= start - next_index <= self.ahead:
+                    # 이전에 읽던 위치에서 이어서 읽음
+                    while next_index < start:
+                        if not cap.grab():
+                            # 건너뛰기에 실패하면 위치를 알 수 없으므로 다음 요청은 처음부터 찾아감
+                            next_index = None
+                            break
+                        next_index += 1
+                    while next_index is not None and next_index <= end and self.request is None and self.running:
+                        ok, frame = cap.read()
+                        if not ok:
+                            next_index = None
+                            break
+                        self.cache.put(next_index, frame)
+                        next_index += 1
+                else:
+                    next_index = decode_range(cap, start, end, self.cache, self.index,
+                                              cancelled=lambda: not self.running)
+        finally:
+            cap.release()
+
+
+# 프로그램 종료 시 디코딩 중인 스레드가 OpenCV 객체를 쥔 채 강제 종료되지 않도록 정리
+_prefetchers = weakref.WeakSet()
+
+
+@atexit.register
+def _stop_prefetchers():
+    for prefetcher in list(_prefetchers):
+        prefetcher.stop()
@@ -0,0 +1,220 @@
+import time
+import numpy as np
+import cv2
+from .object_detector import DETECTION_DTYPE
+
+"""N 프레임마다 물체를 감지하고 그 사이 프레임은 광학 흐름으로 상자를 옮기는 감지기"""
+
+
+class IntervalDetector:
+    """
+    감지 + 광학 흐름 추적 혼합 방식
+    - 감지한 프레임에서 상자마다 안쪽의 특징점을 골라 둠
+    - 다음 프레임부터는 LK 광학 흐름으로 특징점을 옮기고, 상자는 점들의 중앙값 이동/크기 변화만큼 옮김
+    - interval 프레임이 지났거나, 앞뒤 방향 추적이 어긋나 살아남은 점의 비율이
+      min_confidence 아래로 떨어지거나, 프레임이 이어지지 않으면 다시 감지
+    - interval은 감지/추적 평균 시간으로 프레임당 평균 비용이 budget_ms 안에 들도록 조절
+    프레임 순서대로 한 스레드에서만 호출해야 합니다.
+    """
+    def __init__(self, detector, budget_ms=33.0, max_interval=15, min_confidence=0.5, points_per_box=20):
+        self.detector = detector
+        # 감지 결과를 프레임 번호로 저장할 DetectionCache (선택)
+        self.cache = None
+        self.budget_ms = budget_ms
+        self.max_interval = max_interval
+        self.min_confidence = min_confidence
+        self.points_per_box = points_per_box
+        self.lk_params = dict(winSize=(15, 15), maxLevel=2,
+                              criteria=(cv2.TERM_CRITERIA_COUNT | cv2.TERM_CRITERIA_EPS, 10, 0.03))
+        # 앞뒤 방향 추적 결과가 이 픽셀 수 이상 어긋나면 잃어버린 점으로 봄
+        # (카메라가 움직이는 영상은 1픽셀 안팎의 오차가 흔함)
+        self.max_fb_error = 2.0
+        # 재생이 밀려 버려진 프레임이 이 수 이하면 이어진 프레임으로 보고 추적
+        self.max_gap = 3
+
+        self.interval = 1
+        # 감지 한 번, 추적 한 프레임에 걸린 시간의 이동 평균 (ms)
+        self.detect_ms = None
+        self.propagate_ms = None
+        self.detect_count = 0
+        self.propagate_count = 0
+        self.reset()
+
+    def reset(self):
+        """추적 상태를 버림 (다음 프레임은 반드시 감지)"""
+        self.prev_gray = None
+        self.prev_index = None
+        self.points = None
+        self.owners = None
+        self.seed_counts = None
+        self.boxes = None
+        self.detections = np.empty(0, dtype=DETECTION_DTYPE)
+        self.confidence = 1.0
+        self.since_detection = 0
+
+    def process(self, frame, frame_idx=None):
+        """BGR 프레임의 감지 결과 (DETECTION_DTYPE 구조 배열)"""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        # 이미 감지한 프레임이면 추론 없이 저장된 결과로 다시 시작
+        cached = self.cache.get(frame_idx) if self.cache is not None and frame_idx is not None else None
+        if cached is not None:
+            self.seed(gray, cached)
+            self.since_detection = 1
+            self.prev_gray = gray
+            self.prev_index = frame_idx
+            return self.detections.copy()
+
+        continuous = (self.prev_gray is not None and self.prev_gray.shape == gray.shape
+                      and (frame_idx is None or self.prev_index is None
+                           or 0 < frame_idx - self.prev_index <= self.max_gap + 1))
+
+        if continuous and self.since_detection < self.interval:
+            start = time.perf_counter()
+            confidence = self.propagate(gray)
+            self.propagate_ms = self.average(self.propagate_ms, (time.perf_counter() - start) * 1000)
+            self.propagate_count += 1
+            if confidence >= self.min_confidence:
+                self.since_detection += 1
+                self.prev_gray = gray
+                self.prev_index = frame_idx
+                return self.detections.copy()
+
+        start = time.perf_counter()
+        detections = self.detector.detect(frame)
+        self.detect_ms = self.average(self.detect_ms, (time.perf_counter() - start) * 1000)
+        self.detect_count += 1
+        if self.cache is not None and frame_idx is not None and self.detector.net is not None:
+            self.cache.put(frame_idx, detections)
+        self.seed(gray, detections)
+        self.since_detection = 1
+        self.prev_gray = gray
+        self.prev_index = frame_idx
+        self.adapt_interval()
+        return self.detections.copy()
+
+    @staticmethod
+    def average(current, value, alpha=0.2):
+        return value if current is None else current + alpha * (value - current)
+
+    def adapt_interval(self):
+        """
+        interval 프레임 동안의 평균 비용 (감지 1번 + 추적 interval-1번) / interval 이
+        예산 안에 드는 가장 작은 interval
+        """
+        if self.detect_ms is None:
+            return
+        propagate_ms = self.propagate_ms or 0.0
+        if self.detect_ms <= self.budget_ms:
+            interval = 1
+        elif propagate_ms >= self.budget_ms:
+            interval = self.max_interval
+        else:
+            interval = int(np.ceil((self.detect_ms - propagate_ms) / (self.budget_ms - propagate_ms)))
+        self.interval = int(np.clip(interval, 1, self.max_interval))
+
+    def seed(self, gray, detections):
+        """상자마다 안쪽의 특징점을 골라 추적을 시작"""
+        self.detections = detections.copy()
+        self.boxes = np.stack([detections['x'], detections['y'],
+                               detections['w'], detections['h']], axis=1).astype(np.float32)
+        self.confidence = 1.0
+        height, width = gray.shape
+        points = []
+        owners = []
+        for i, (x, y, w, h) in enumerate(detections[['x', 'y', 'w', 'h']].tolist()):
+            x0, y0 = max(0, x), max(0, y)
+            x1, y1 = min(width, x + w), min(height, y + h)
+            if x1 - x0 < 2 or y1 - y0 < 2:
+                continue
+            corners = cv2.goodFeaturesToTrack(gray[y0:y1, x0:x1], self.points_per_box, 0.01, 3)
+            if corners is None:
+                # 특징점이 없는 밋밋한 상자는 추적하지 않고 다음 감지까지 제자리에 둠
+                continue
+            corners = corners.reshape(-1, 2) + (x0, y0)
+            points.append(corners)
+            owners.append(np.full(len(corners), i))
+
+        if points:
+            self.points = np.concatenate(points).astype(np.float32).reshape(-1, 1, 2)
+            self.owners = np.concatenate(owners)
+        else:
+            self.points = None
+            self.owners = None
+        self.seed_counts = np.bincount(self.owners, minlength=len(detections)) if self.owners is not None \
+            else np.zeros(len(detections), dtype=np.intp)
+
+    def propagate(self, gray):
+        """
+        특징점을 다음 프레임으로 옮기고 상자를 갱신합니다.
+        반환값은 상자들 중 가장 낮은 점 생존 비율 (상자가 없으면 1.0)
+        """
+        if len(self.detections) == 0:
+            return 1.0
+        if self.points is None:
+            # 점을 전부 잃었으면 다시 감지 (처음부터 점이 없던 상자뿐이면 그대로 둠)
+            self.confidence = 0.0 if self.seed_counts.any() else 1.0
+            return self.confidence
+
+        next_points, status, _ = cv2.calcOpticalFlowPyrLK(self.prev_gray, gray, self.points, None, **self.lk_params)
+        back_points, back_status, _ = cv2.calcOpticalFlowPyrLK(gray, self.prev_gray, next_points, None, **self.lk_params)
+        fb_error = np.linalg.norm((self.points - back_points).reshape(-1, 2), axis=1)
+        good = (status.ravel() == 1) & (back_status.ravel() == 1) & (fb_error < self.max_fb_error)
+
+        old = self.points.reshape(-1, 2)
+        new = next_points.reshape(-1, 2)
+        for i in range(len(self.detections)):
+            mine = good & (self.owners == i)
+            if not mine.any():
+                continue
+            before, after = old[mine], new[mine]
+            shift = np.median(after - before, axis=0)
+            scale = 1.0
+            if len(before) >= 3:
+                spread_before = np.linalg.norm(before - np.median(before, axis=0), axis=1)
+                spread_after = np.linalg.norm(after - np.median(after, axis=0), axis=1)
+                valid = spread_before > 1e-3
+                if valid.any():
+                    scale = float(np.median(spread_after[valid] / spread_before[valid]))
+            x, y, w, h = self.boxes[i]
+            center = np.array([x + w / 2, y + h / 2]) + shift
+            w, h = w * scale, h * scale
+            self.boxes[i] = (center[0] - w / 2, center[1] - h / 2, w, h)
+
+        # 중심이 화면 밖으로 나간 상자는 추적을 끝냄 (물체가 나간 것이므로 다시 감지할 필요 없음)
+        height, width = gray.shape
+        centers = self.boxes[:, :2] + self.boxes[:, 2:] / 2
+        inside = (centers[:, 0] >= 0) & (centers[:, 0] < width) & (centers[:, 1] >= 0) & (centers[:, 1] < height)
+        if not inside.all():
+            good &= inside[self.owners]
+            self.keep_boxes(inside)
+
+        self.points = next_points[good]
+        self.owners = self.owners[good]
+        self.detections['x'] = self.boxes[:, 0]
+        self.detections['y'] = self.boxes[:, 1]
+        self.detections['w'] = self.boxes[:, 2]
+        self.detections['h'] = self.boxes[:, 3]
+
+        seeded = self.seed_counts > 0
+        alive = np.bincount(self.owners, minlength=len(self.detections))
+        self.confidence = float((alive[seeded] / self.seed_counts[seeded]).min()) if seeded.any() else 1.0
+        if len(self.points) == 0:
+            self.points = None
+        return self.confidence
+
+    def keep_boxes(self, keep):
+        """keep이 True인 상자만 남기고 점의 상자 번호를 다시 매김"""
+        remap = np.cumsum(keep) - 1
+        self.owners = remap[self.owners]
+        self.boxes = self.boxes[keep]
+        self.detections = self.detections[keep]
+        self.seed_counts = self.seed_counts[keep]
+
+    def summary(self):
+        """상태 표시줄용 한 줄 요약"""
+        if self.detect_ms is None:
+            return "간격 감지 대기 중"
+        propagate = f"{self.propagate_ms:.1f}" if self.propagate_ms is not None else "-"
+        return (f"간격 감지 N={self.interval} | 감지 {self.detect_ms:.0f} ms / 추적 {propagate} ms "
+                f"(예산 {self.budget_ms:.0f} ms) | 점 생존 {self.confidence:.0%}")
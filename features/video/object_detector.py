@@ -1,93 +1,165 @@
 import cv2
 import numpy as np
 import os
+import hashlib
+import threading
+
+# 감지 결과 한 개 (왼쪽 위 좌표, 크기, 클래스, 신뢰도)
+DETECTION_DTYPE = np.dtype([
+    ('x', np.int32), ('y', np.int32), ('w', np.int32), ('h', np.int32),
+    ('class_id', np.int32), ('confidence', np.float32),
+])
 
 class ObjectDetector:
-    def __init__(self):
+    def __init__(self, confidence_threshold=0.5, nms_threshold=0.4):
+        self.confidence_threshold = confidence_threshold
+        self.nms_threshold = nms_threshold
+        # 마지막으로 감지한 결과 (다시 추론하지 않고 재사용할 수 있음)
+        self.last_detections = np.empty(0, dtype=DETECTION_DTYPE)
+        # 감지 작업자와 간격 감지가 네트워크를 동시에 실행하지 않도록 보호
+        self.lock = threading.Lock()
+
+        self.is_detecting = False
+
         # 현재 디렉토리 기준으로 models 폴더 경로 설정
-        models_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'models')
-        
+        self.models_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'models')
+        # YOLO Tiny 모델 설정
+        self.weights_path = os.path.join(self.models_dir, 'yolov3-tiny.weights')
+        self.cfg_path = os.path.join(self.models_dir, 'yolov3-tiny.cfg')
+        self.names_path = os.path.join(self.models_dir, 'coco.names')
+        self.input_size = 416
+
+        # 모델은 처음 사용할 때 load()에서 불러옴 (프로그램 시작을 늦추지 않도록)
+        self.net = None
+        self.classes = []
+        self.output_layers = []
+        self.colors = None
+        self.loaded = False
+        self.load_lock = threading.Lock()
+
+    def load(self):
+        """모델을 불러옵니다. 이미 불러왔으면 바로 반환 (실패해도 다시 시도하지 않음)"""
+        if self.loaded:
+            return self.net is not None
+        with self.load_lock:
+            if not self.loaded:
+                self.load_model()
+                self.loaded = True
+        return self.net is not None
+
+    def load_model(self):
         try:
-            # YOLO Tiny 모델 설정
-            weights_path = os.path.join(models_dir, 'yolov3-tiny.weights')
-            cfg_path = os.path.join(models_dir, 'yolov3-tiny.cfg')
-            names_path = os.path.join(models_dir, 'coco.names')
-            
-            self.net = cv2.dnn.readNet(weights_path, cfg_path)
+            net = cv2.dnn.readNet(self.weights_path, self.cfg_path)
             
             # COCO 데이터셋의 클래스 이름 로드
-            with open(names_path, "r") as f:
+            with open(self.names_path, "r") as f:
                 self.classes = [line.strip() for line in f.readlines()]
                 
-            self.layer_names = self.net.getLayerNames()
-            self.output_layers = [self.layer_names[i - 1] for i in self.net.getUnconnectedOutLayers()]
+            self.layer_names = net.getLayerNames()
+            self.output_layers = [self.layer_names[i - 1] for i in net.getUnconnectedOutLayers()]
             self.colors = np.random.uniform(0, 255, size=(len(self.classes), 3))
-            
-            self.is_detecting = False
+            self.net = net
             
         except Exception as e:
             print(f"모델 로드 실패: {e}")
             print(f"현재 경로: {os.getcwd()}")
-            print(f"모델 경로: {models_dir}")
+            print(f"모델 경로: {self.models_dir}")
             self.net = None
-            self.is_detecting = False
-        
+
+    def warm_up(self):
+        """모델을 불러오고 빈 프레임으로 한 번 추론하여 첫 감지가 느리지 않게 합니다."""
+        if self.load():
+            self.detect(np.zeros((self.input_size, self.input_size, 3), dtype=np.uint8))
+
+    def model_key(self):
+        """모델 파일(이름, 크기, 수정 시각)과 입력 크기/임계값으로 만든 키 (감지 결과 캐시용)"""
+        parts = []
+        for path in (self.cfg_path, self.weights_path):
+            try:
+                stat = os.stat(path)
+                parts.append(f"{os.path.basename(path)}:{stat.st_size}:{int(stat.st_mtime)}")
+            except OSError:
+                parts.append(f"{os.path.basename(path)}:missing")
+        parts.append(f"{self.input_size}:{self.confidence_threshold}:{self.nms_threshold}")
+        return hashlib.sha1('|'.join(parts).encode(), usedforsecurity=False).hexdigest()[:16]
+
     def detect_objects(self, frame):
-        if not self.is_detecting or self.net is None:
+        """감지를 실행하고 결과를 프레임에 그립니다. (결과는 last_detections에 보관)"""
+        if not self.is_detecting or not self.load():
             return frame
-            
-        height, width, _ = frame.shape
-        
+
+        self.last_detections = self.detect(frame)
+        return self.draw(frame, self.last_detections)
+
+    def detect(self, frame):
+        """프레임에서 객체를 감지하여 DETECTION_DTYPE 구조 배열로 반환합니다. (그리지 않음)"""
+        if not self.load():
+            return np.empty(0, dtype=DETECTION_DTYPE)
+
+        height, width = frame.shape[:2]
+
         # 이미지 전처리
-        blob = cv2.dnn.blobFromImage(frame, 0.00392, (416, 416), (0, 0, 0), True, crop=False)
-        self.net.setInput(blob)
-        outs = self.net.forward(self.output_layers)
-        
-        # 감지된 객체 정보
-        class_ids = []
-        confidences = []
-        boxes = []
-        
-        # 감지된 객체 표시
-        for out in outs:
-            for detection in out:
-                scores = detection[5:]
-                class_id = np.argmax(scores)
-                confidence = scores[class_id]
-                
-                if confidence > 0.5:  # 신뢰도 임계값
-                    # 객체 좌표 계산
-                    center_x = int(detection[0] * width)
-                    center_y = int(detection[1] * height)
-                    w = int(detection[2] * width)
-                    h = int(detection[3] * height)
-                    
-                    # 사각형 좌표
-                    x = int(center_x - w / 2)
-                    y = int(center_y - h / 2)
-                    
-                    boxes.append([x, y, w, h])
-                    confidences.append(float(confidence))
-                    class_ids.append(class_id)
-        
-        # 노이즈 제거
-        indexes = cv2.dnn.NMSBoxes(boxes, confidences, 0.5, 0.4)
-        
-        # 결과 표시
-        for i in range(len(boxes)):
-            if i in indexes:
-                x, y, w, h = boxes[i]
-                label = str(self.classes[class_ids[i]])
-                confidence = confidences[i]
-                color = self.colors[class_ids[i]]
-                
-                cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
-                cv2.putText(frame, f"{label} {confidence:.2f}", 
-                          (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 
-                          0.5, color, 2)
-        
+        blob = cv2.dnn.blobFromImage(frame, 0.00392, (self.input_size, self.input_size), (0, 0, 0), True, crop=False)
+        with self.lock:
+            self.net.setInput(blob)
+            outs = self.net.forward(self.output_layers)
+        return self.decode(outs, width, height)
+
+    def decode(self, outs, width, height):
+        """
+        YOLO 출력 전체를 한 번에 처리합니다.
+        신뢰도 마스크 → 클래스별 argmax → 좌표 일괄 변환 → 클래스별 NMS 한 번
+        """
+        rows = np.concatenate([out.reshape(-1, out.shape[-1]) for out in outs])
+        scores = rows[:, 5:]
+        class_ids = scores.argmax(axis=1)
+        confidences = scores[np.arange(len(rows)), class_ids]
+
+        mask = confidences > self.confidence_threshold
+        if not mask.any():
+            return np.empty(0, dtype=DETECTION_DTYPE)
+        rows = rows[mask]
+        class_ids = class_ids[mask]
+        confidences = confidences[mask]
+
+        # 중심/크기(0~1) → 왼쪽 위 좌표/크기(픽셀)
+        center_x = (rows[:, 0] * width).astype(np.int32)
+        center_y = (rows[:, 1] * height).astype(np.int32)
+        w = (rows[:, 2] * width).astype(np.int32)
+        h = (rows[:, 3] * height).astype(np.int32)
+        x = (center_x - w / 2).astype(np.int32)
+        y = (center_y - h / 2).astype(np.int32)
+        boxes = np.stack([x, y, w, h], axis=1)
+
+        # 클래스가 다른 상자끼리는 겹쳐도 제거하지 않음
+        keep = cv2.dnn.NMSBoxesBatched(boxes.tolist(), confidences.tolist(), class_ids.tolist(),
+                                       self.confidence_threshold, self.nms_threshold)
+        keep = np.asarray(keep, dtype=np.intp).reshape(-1)
+
+        detections = np.empty(len(keep), dtype=DETECTION_DTYPE)
+        detections['x'] = x[keep]
+        detections['y'] = y[keep]
+        detections['w'] = w[keep]
+        detections['h'] = h[keep]
+        detections['class_id'] = class_ids[keep]
+        detections['confidence'] = confidences[keep]
+        return detections
+
+    def draw(self, frame, detections):
+        """감지 결과를 프레임에 그립니다."""
+        for x, y, w, h, class_id, confidence in detections.tolist():
+            label = str(self.classes[class_id])
+            color = self.colors[class_id]
+
+            cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
+            cv2.putText(frame, f"{label} {confidence:.2f}",
+                      (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX,
+                      0.5, color, 2)
         return frame
         
     def toggle_detection(self):
+        # 처음 켤 때 모델을 불러옴 (미리 불러오기가 끝났으면 바로 반환), 불러오지 못하면 켜지 않음
+        if not self.is_detecting and not self.load():
+            return False
         self.is_detecting = not self.is_detecting
         return self.is_detecting 
\ No newline at end of file
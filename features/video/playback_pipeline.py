@@ -0,0 +1,293 @@
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+from features.profiler import profiler
+
+"""디코딩 → 분석(추적/감지) → 필터 → 화면 전달로 나누어 여러 스레드에서 실행하는 비디오 재생 파이프라인"""
+
+
+class StageCounter:
+    """파이프라인 단계 하나의 처리 시간 통계"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        with self.lock:
+            self.count += 1
+            self.total += seconds
+            self.last = seconds
+            self.max = max(self.max, seconds)
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'count': self.count,
+                'last_ms': self.last * 1000,
+                'avg_ms': self.total / self.count * 1000 if self.count else 0.0,
+                'max_ms': self.max * 1000,
+            }
+
+
+class PlaybackResult:
+    """화면에 표시할 준비가 끝난 프레임"""
+    def __init__(self, sequence, index, image, display, decoded_at):
+        self.sequence = sequence  # 재생을 시작한 뒤 몇 번째 프레임인지 (반복 재생해도 계속 증가)
+        self.index = index
+        self.image = image        # 원본 해상도 (필터 적용 후 RGB)
+        self.display = display    # 화면 표시 크기로 줄인 이미지
+        self.decoded_at = decoded_at
+
+
+class PlaybackPipeline:
+    """
+    비디오 재생 파이프라인
+    - 디코더 스레드: 프레임을 순서대로 읽음. 이미 재생 시각이 지난 프레임은 grab()으로 건너뜀
+    - 분석 스레드: 추적/감지 (이전 프레임 상태를 사용하므로 순서대로 한 스레드에서 실행)
+    - 처리 스레드 풀: 필터 체인 적용과 화면 크기 축소 (OpenCV가 GIL을 놓으므로 병렬 실행)
+    - 화면 전달: UI 스레드의 타이머가 take_ready()로 재생 시각이 된 가장 최신 프레임만 가져감
+    단계 사이는 크기가 제한된 큐로 연결되어 있어 처리가 밀려도 메모리가 늘지 않고,
+    늦어진 프레임은 버려서 재생 속도를 유지합니다.
+    """
+    def __init__(self, video_processor, chain_func=None, display_scale_func=None,
+                 workers=2, queue_size=3):
+        self.video_processor = video_processor
+        # 프레임마다 호출하여 현재 적용된 필터 체인을 가져옴
+        self.chain_func = chain_func
+        # 화면 확대/축소 배율 (None 이면 축소하지 않음)
+        self.display_scale_func = display_scale_func
+        self.workers = workers
+        self.queue_size = queue_size
+        self.loop = True
+
+        self.fps = video_processor.fps or 30.0
+        self.speed = 1.0
+        self.running = False
+        self.finished = False
+        self.threads = []
+        self.pool = None
+        self.head = None
+
+        # total: 디코딩 시작부터 화면 전달까지 (표시 시각을 기다리며 버퍼에 머문 시간 포함)
+        self.counters = {name: StageCounter() for name in ('decode', 'analyze', 'filter', 'total')}
+        self.dropped = {'decode': 0, 'analyze': 0, 'display': 0}
+
+    # ---- 재생 시각 ----
+
+    def reset_clock(self):
+        self.clock_sequence = 0
+        self.clock_start = time.perf_counter()
+
+    def due_time(self, sequence):
+        """재생 시작 후 sequence 번째 프레임이 화면에 표시되어야 하는 시각"""
+        return self.clock_start + (sequence - self.clock_sequence) / (self.fps * self.speed)
+
+    def frame_interval(self):
+        return 1.0 / (self.fps * self.speed)
+
+    def is_late(self, sequence):
+        """재생 시각이 한 프레임 이상 지난 프레임"""
+        return time.perf_counter() > self.due_time(sequence) + self.frame_interval()
+
+    def set_speed(self, speed):
+        # 지금 재생 중인 위치를 기준으로 시계를 다시 맞춤
+        now = time.perf_counter()
+        if self.running:
+            self.clock_sequence += (now - self.clock_start) * self.fps * self.speed
+            self.clock_start = now
+        self.speed = speed
+
+    # ---- 시작/정지 ----
+
+    def start(self, start_index=0):
+        self.stop()
+        self.running = True
+        self.finished = False
+        self.head = None
+        self.decoded_queue = queue.Queue(self.queue_size)
+        self.output_queue = queue.Queue(self.queue_size)
+        self.pool = ThreadPoolExecutor(max_workers=self.workers)
+        self.reset_clock()
+        self.threads = [
+            threading.Thread(target=self.decode_loop, args=(start_index,), daemon=True),
+            threading.Thread(target=self.analyze_loop, daemon=True),
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        self.pool = None
+        self.head = None
+
+    def put(self, target_queue, item):
+        """큐가 가득 차 있으면 공간이 생기거나 정지될 때까지 대기"""
+        while self.running:
+            try:
+                target_queue.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(self, source_queue):
+        while self.running:
+            try:
+                return source_queue.get(timeout=0.05)
+            except queue.Empty:
+                continue
+        return None
+
+    # ---- 단계별 작업 ----
+
+    def record_stage(self, stage, start):
+        """단계 처리 시간 기록 (성능 측정을 켜면 프로파일러에도 'video' 분류로 기록)"""
+        elapsed = time.perf_counter() - start
+        self.counters[stage].add(elapsed)
+        if profiler.enabled:
+            profiler.record(f"PlaybackPipeline.{stage}", 'video', int(start * 1e9), int(elapsed * 1e9))
+
+    def decode_loop(self, start_index):
+        # UI 스레드가 사용하는 캡처 객체와 충돌하지 않도록 별도로 열어서 사용
+        cap = cv2.VideoCapture(self.video_processor.file_path)
+        try:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start_index)
+            index = start_index
+            sequence = 0
+            while self.running:
+                start = time.perf_counter()
+                if self.is_late(sequence):
+                    # 이미 늦은 프레임은 디코딩 결과를 꺼내지 않고 건너뜀
+                    ok = cap.grab()
+                    if ok:
+                        self.dropped['decode'] += 1
+                        index += 1
+                        sequence += 1
+                        continue
+                else:
+                    ok, frame = cap.read()
+                    if ok:
+                        self.record_stage('decode', start)
+                        if not self.put(self.decoded_queue, (sequence, index, frame, start)):
+                            break
+                        index += 1
+                        sequence += 1
+                        continue
+
+                # 영상 끝
+                if not self.loop or index == 0:
+                    self.put(self.decoded_queue, None)
+                    break
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                index = 0
+        finally:
+            cap.release()
+
+    def analyze_loop(self):
+        while self.running:
+            item = self.get(self.decoded_queue)
+            if item is None:
+                self.put(self.output_queue, None)
+                break
+            sequence, index, frame, decoded_at = item
+            # 처리가 밀려 늦어졌고 뒤에 더 새 프레임이 있으면 버림
+            if self.is_late(sequence) and not self.decoded_queue.empty():
+                self.dropped['analyze'] += 1
+                continue
+
+            start = time.perf_counter()
+            try:
+                frame = self.video_processor.process_frame(frame, index)
+            except Exception as e:
+                print(f"프레임 분석 실패: {e}")
+                continue
+            self.record_stage('analyze', start)
+
+            chain = self.chain_func() if self.chain_func else None
+            future = self.pool.submit(self.filter_frame, sequence, index, frame, chain, decoded_at)
+            if not self.put(self.output_queue, future):
+                break
+
+    def filter_frame(self, sequence, index, frame, chain, decoded_at):
+        start = time.perf_counter()
+        if chain is not None:
+            frame = chain.apply(frame)
+        display = frame
+        scale = self.display_scale_func() if self.display_scale_func else 1.0
+        if scale != 1.0:
+            height, width = frame.shape[:2]
+            size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+            display = cv2.resize(frame, size, interpolation=interpolation)
+        self.record_stage('filter', start)
+        return PlaybackResult(sequence, index, frame, display, decoded_at)
+
+    # ---- 화면 전달 (UI 스레드) ----
+
+    def take_ready(self):
+        """
+        재생 시각이 된 프레임 중 가장 최신 프레임을 반환합니다. (없으면 None)
+        그보다 오래된 완성 프레임은 표시하지 않고 버립니다.
+        영상이 끝났으면 (loop=False) False를 반환합니다.
+        """
+        if self.finished:
+            return False
+        if not self.running:
+            return None
+        chosen = None
+        now = time.perf_counter()
+        while True:
+            if self.head is None:
+                try:
+                    self.head = self.output_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if self.head is None:
+                    # 마지막 프레임을 먼저 표시하고 다음 호출에서 False 반환 (정리는 stop()에서)
+                    self.finished = True
+                    return chosen if chosen is not None else False
+            if not self.head.done():
+                break
+            try:
+                result = self.head.result()
+            except Exception as e:
+                print(f"프레임 처리 실패: {e}")
+                self.head = None
+                continue
+            # 아직 표시할 시각이 아니면 다음 호출까지 보관
+            if self.due_time(result.sequence) > now + self.frame_interval() / 2:
+                break
+            if chosen is not None:
+                self.dropped['display'] += 1
+            chosen = result
+            self.head = None
+
+        if chosen is not None:
+            self.counters['total'].add(time.perf_counter() - chosen.decoded_at)
+        return chosen
+
+    def stats(self):
+        """단계별 처리 시간(ms), 버린 프레임 수, 큐 길이"""
+        stats = {name: counter.snapshot() for name, counter in self.counters.items()}
+        stats['dropped'] = dict(self.dropped)
+        if self.running:
+            stats['queued'] = {'decoded': self.decoded_queue.qsize(), 'output': self.output_queue.qsize()}
+        return stats
+
+    def summary(self):
+        """상태 표시줄용 한 줄 요약"""
+        stats = self.stats()
+        stages = ' / '.join(f"{name} {stats[name]['avg_ms']:.1f}"
+                            for name in ('decode', 'analyze', 'filter', 'total'))
+        return f"재생 {stages} ms | 버림 {sum(self.dropped.values())}"
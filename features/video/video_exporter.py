@@ -0,0 +1,224 @@
+import os
+import time
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import cv2
+import numpy as np
+from features.filters import FilterChain
+from .object_detector import ObjectDetector
+
+"""처리된 비디오를 파일로 내보내기 (필터, 물체 추적, 물체 감지 포함)"""
+
+# 작업 프로세스마다 한 번만 만드는 필터 체인과 감지기
+worker_chain = None
+worker_detector = None
+
+
+def init_worker(filters, detect, confidence_threshold, nms_threshold, colors):
+    global worker_chain, worker_detector
+    # 프로세스 여러 개가 각자 OpenCV 스레드를 늘리지 않도록 제한
+    cv2.setNumThreads(1)
+    worker_chain = None
+    if filters:
+        worker_chain = FilterChain(filters)
+        worker_chain.compile()
+    worker_detector = None
+    if detect:
+        worker_detector = ObjectDetector(confidence_threshold, nms_threshold)
+        worker_detector.load()
+        # 청크마다 상자 색이 달라지지 않도록 화면과 같은 색 사용
+        if colors is not None:
+            worker_detector.colors = colors
+
+
+def render_chunk(items):
+    """
+    작업 프로세스에서 실행: 프레임 묶음에 감지 → 표시 → 필터를 적용
+    items: (프레임 번호, 원본 BGR, 추적선을 그린 BGR 또는 None, 저장된 감지 결과 또는 None)
+    반환: (프레임 번호, 출력 BGR, 새로 감지한 결과 또는 None) 목록
+    """
+    results = []
+    for index, raw, tracked, detections in items:
+        computed = None
+        if worker_detector is not None and detections is None:
+            detections = worker_detector.detect(raw)
+            if worker_detector.net is not None:
+                computed = detections
+
+        # 화면 표시와 같은 순서: 추적선 → RGB 변환 → 감지 상자 → 필터
+        frame = cv2.cvtColor(tracked if tracked is not None else raw, cv2.COLOR_BGR2RGB)
+        if worker_detector is not None and detections is not None and worker_detector.classes:
+            worker_detector.draw(frame, detections)
+        if worker_chain is not None:
+            frame = worker_chain.apply(frame)
+        if frame.ndim == 2:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+        else:
+            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        results.append((index, frame, computed))
+    return results
+
+
+def writer_fourcc(path):
+    ext = os.path.splitext(path)[1].lower()
+    return cv2.VideoWriter_fourcc(*('XVID' if ext == '.avi' else 'mp4v'))
+
+
+class VideoExporter:
+    """
+    비디오(또는 구간)를 화면과 같은 처리 결과로 파일에 저장
+    - 메인 스레드: 처음부터 순서대로 디코딩하고 추적(이전 프레임 상태가 필요)을 적용
+    - 프로세스 풀: 프레임 묶음(chunk_size)마다 감지, 상자 그리기, 필터 적용 (상태가 없는 단계)
+    - 결과는 프레임 번호 순서대로 다시 맞춰서 기록하므로 프레임이 빠지거나 바뀌지 않음
+    run()은 끝날 때까지 반환하지 않으므로 별도 스레드에서 호출하고,
+    progress()로 진행 상황을 확인하고 cancel()로 중단합니다.
+    완료되기 전까지는 임시 파일에 쓰고 끝난 뒤 이름을 바꾸므로 중단해도 반쯤 쓰인 파일이 남지 않습니다.
+    """
+    def __init__(self, video_processor, output_path, filters=(), start=None, end=None,
+                 track=False, detect=False, workers=None, chunk_size=8):
+        self.video_processor = video_processor
+        self.output_path = output_path
+        self.filters = list(filters)
+        frame_count = video_processor.get_frame_count()
+        self.start = max(0, start if start is not None else 0)
+        self.end = min(frame_count - 1, end if end is not None else frame_count - 1)
+        self.track = track
+        self.detect = detect
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.chunk_size = chunk_size
+
+        self.total = max(0, self.end - self.start + 1)
+        self.done = 0
+        self.started_at = None
+        self.finished = False
+        self.error = None
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def progress(self):
+        """(기록한 프레임 수, 전체 프레임 수, 남은 예상 시간(초) 또는 None)"""
+        done, total = self.done, self.total
+        eta = None
+        if self.started_at is not None and done > 0:
+            elapsed = time.perf_counter() - self.started_at
+            eta = elapsed / done * (total - done)
+        return done, total, eta
+
+    def open_capture(self):
+        """start 프레임부터 읽도록 준비된 캡처 객체 (키프레임부터 디코딩하여 정확한 위치로 이동)"""
+        cap = cv2.VideoCapture(self.video_processor.file_path)
+        index = self.video_processor.keyframe_index
+        keyframe = None
+        if index is not None and index.ready.is_set():
+            keyframe = index.keyframe_before(self.start)
+        position = keyframe if keyframe is not None else self.start
+        cap.set(cv2.CAP_PROP_POS_FRAMES, position)
+        while position < self.start and cap.grab():
+            position += 1
+        return cap
+
+    def make_tracker(self):
+        """화면의 추적 상태와 섞이지 않도록 내보내기 전용 추적기 사용"""
+        from .video_processor import VideoProcessor
+        tracker = VideoProcessor()
+        tracker.tracking_enabled = True
+        tracker.colors = (self.video_processor.colors if self.video_processor.colors is not None
+                          else np.random.randint(0, 255, (200, 3)))
+        return tracker
+
+    def run(self):
+        """내보내기를 실행합니다. 성공하면 True"""
+        self.started_at = time.perf_counter()
+        temp_path = '.part'.join(os.path.splitext(self.output_path))
+        detector = self.video_processor.object_detector
+        cache = self.video_processor.detection_cache if self.detect else None
+        if self.detect:
+            detector.load()
+
+        cap = self.open_capture()
+        writer = None
+        tracker = self.make_tracker() if self.track else None
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            # Qt가 올라와 있는 프로세스를 fork 하지 않도록 새 프로세스로 시작
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=init_worker,
+            initargs=(self.filters, self.detect, detector.confidence_threshold,
+                      detector.nms_threshold, detector.colors))
+        in_flight = set()
+        ready = {}
+        next_index = self.start
+
+        def collect(block):
+            nonlocal writer, next_index
+            if not in_flight:
+                return
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED) if block else (
+                {future for future in in_flight if future.done()}, None)
+            for future in done:
+                in_flight.discard(future)
+                for index, frame, computed in future.result():
+                    ready[index] = frame
+                    if computed is not None and cache is not None:
+                        cache.put(index, computed)
+            # 프레임 번호 순서대로 기록
+            while next_index in ready:
+                frame = ready.pop(next_index)
+                if writer is None:
+                    height, width = frame.shape[:2]
+                    writer = cv2.VideoWriter(temp_path, writer_fourcc(self.output_path),
+                                             self.video_processor.fps, (width, height))
+                    if not writer.isOpened():
+                        raise OSError(f"비디오 파일을 만들 수 없습니다: {self.output_path}")
+                writer.write(frame)
+                next_index += 1
+                self.done += 1
+
+        try:
+            chunk = []
+            for index in range(self.start, self.end + 1):
+                if self.cancelled.is_set():
+                    break
+                ok, raw = cap.read()
+                if not ok:
+                    # 메타데이터의 프레임 수보다 실제 프레임이 적은 경우
+                    self.total = index - self.start
+                    break
+                tracked = tracker.track_objects(raw) if tracker is not None else None
+                cached = cache.get(index) if cache is not None else None
+                # 추적선을 그린 프레임만 있으면 되는 경우 원본은 보내지 않음 (프로세스 간 복사 줄이기)
+                if tracked is not None and (not self.detect or cached is not None):
+                    raw = None
+                chunk.append((index, raw, tracked, cached))
+                if len(chunk) == self.chunk_size:
+                    in_flight.add(pool.submit(render_chunk, chunk))
+                    chunk = []
+                    # 처리가 밀려도 메모리가 늘지 않도록 진행 중인 묶음 수 제한
+                    while len(in_flight) >= self.workers * 2:
+                        collect(block=True)
+                    collect(block=False)
+            if chunk and not self.cancelled.is_set():
+                in_flight.add(pool.submit(render_chunk, chunk))
+            while in_flight and not self.cancelled.is_set():
+                collect(block=True)
+        except Exception as e:
+            print(f"비디오 내보내기 실패: {e}")
+            self.error = str(e)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            cap.release()
+            if writer is not None:
+                writer.release()
+            if cache is not None:
+                cache.flush()
+
+        success = self.error is None and not self.cancelled.is_set() and self.done > 0
+        if success:
+            os.replace(temp_path, self.output_path)
+        elif os.path.exists(temp_path):
+            os.remove(temp_path)
+        self.finished = True
+        return success
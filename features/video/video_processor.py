@@ -1,11 +1,27 @@
 import cv2
 import numpy as np
 from .object_detector import ObjectDetector
+from .detection_worker import DetectionWorker
+from .interval_detector import IntervalDetector
+from .detection_cache import DetectionCache
+from .frame_cache import KeyframeIndex, FrameRingCache, FramePrefetcher, decode_range
+from features.profiler import profiler
 
 class VideoProcessor:
     def __init__(self):
         self.cap = None
+        self.file_path = None
         self.frame_count = 0
+        self.fps = 30.0
+        # 다음 read()가 돌려줄 프레임 번호 (알 수 없으면 None)
+        self.next_index = None
+        # 마지막으로 디코딩한 프레임 (같은 프레임을 다시 요청하면 재사용)
+        self.last_index = None
+        self.last_frame = None
+        # 탐색/역방향 이동용 프레임 캐시 (비디오를 열 때 생성)
+        self.keyframe_index = None
+        self.frame_cache = None
+        self.prefetcher = None
         self.current_frame = None
         self.tracking_enabled = False
         
@@ -17,12 +33,39 @@ class VideoProcessor:
         self.term_criteria = (cv2.TERM_CRITERIA_COUNT | cv2.TERM_CRITERIA_EPS, 10, 0.03)
 
         self.object_detector = ObjectDetector()
+        # 감지는 작업자 스레드에서 실행하고 화면에는 가장 최근 결과만 그림
+        self.detection_worker = DetectionWorker(self.object_detector)
+        # 마지막으로 그린 감지 결과의 원본 프레임 번호
+        self.drawn_detection_index = None
+        # 프레임별 감지 결과 캐시 (비디오를 열 때 생성)
+        self.detection_cache = None
+        # 'async': 작업자 스레드에서 최신 프레임만 감지
+        # 'interval': N 프레임마다 감지하고 사이 프레임은 광학 흐름으로 상자 이동
+        self.detection_mode = 'async'
+        self.interval_detector = IntervalDetector(self.object_detector)
 
     def load_video(self, file_path):
         """비디오 파일을 로드합니다."""
+        self.release()
         self.cap = cv2.VideoCapture(file_path)
         if self.cap.isOpened():
+            self.file_path = file_path
             self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+            self.next_index = 0
+            self.last_index = None
+            self.last_frame = None
+            self.keyframe_index = KeyframeIndex(file_path)
+            self.frame_cache = FrameRingCache()
+            self.prefetcher = FramePrefetcher(file_path, self.frame_cache, self.keyframe_index)
+            self.detection_worker.clear()
+            self.drawn_detection_index = None
+            self.interval_detector.reset()
+            self.detection_cache = DetectionCache(file_path, self.frame_count, self.object_detector.model_key())
+            self.detection_worker.cache = self.detection_cache
+            self.interval_detector.cache = self.detection_cache
+            # 간격 감지의 프레임당 예산은 영상의 프레임 간격
+            self.interval_detector.budget_ms = 1000.0 / self.fps
             # 추적을 위한 변수 초기화
             self.tracking_lines = None
             self.colors = np.random.randint(0, 255, (200, 3))
@@ -41,21 +84,122 @@ class VideoProcessor:
 
     def get_frame(self, frame_idx):
         """지정된 프레임을 가져오고 물체 추적과 감지를 수행합니다."""
+        frame = self.read_frame(frame_idx)
+        if frame is None:
+            return None
+        return self.process_frame(frame, frame_idx)
+
+    # 이 프레임 수 이내로 앞쪽이면 탐색(seek) 대신 grab()으로 건너뜀
+    MAX_GRAB_SKIP = 12
+
+    def read_frame(self, frame_idx):
+        """
+        지정된 프레임을 디코딩합니다. (BGR, 추적/감지 없음)
+        순방향 재생처럼 바로 다음 프레임이거나 조금 앞의 프레임이면 탐색하지 않고 이어서 읽습니다.
+        탐색은 키프레임부터 다시 디코딩해야 하므로 실제로 위치가 크게 바뀔 때만 사용합니다.
+        """
         if not self.is_loaded():
             return None
 
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+        if frame_idx == self.last_index and self.last_frame is not None:
+            return self.last_frame.copy()
+
+        direction = -1 if self.last_index is not None and frame_idx < self.last_index else 1
+        # 이어서 읽을 수 있는 위치면 디코더가 이미 준비되어 있으므로 미리 읽기가 필요 없음
+        sequential = self.next_index is not None and 0 <= frame_idx - self.next_index <= self.MAX_GRAB_SKIP
+        frame = self.frame_cache.get(frame_idx) if self.frame_cache is not None else None
+        if frame is None:
+            frame = self.decode_frame(frame_idx, direction)
+            if frame is None:
+                # 위치를 알 수 없으므로 다음 요청은 탐색부터 시작
+                self.next_index = None
+                self.last_index = None
+                self.last_frame = None
+                return None
+
+        self.last_index = frame_idx
+        self.last_frame = frame
+        if self.frame_cache is not None:
+            self.frame_cache.set_playhead(frame_idx)
+            if not sequential:
+                self.prefetcher.prefetch(frame_idx, direction)
+        return frame.copy()
+
+    def decode_frame(self, frame_idx, direction):
+        """캐시에 없는 프레임을 디코딩합니다."""
+        if direction < 0 and self.frame_cache is not None:
+            # 역방향: 앞쪽 구간을 GOP 단위로 한 번에 디코딩하여 캐시에 저장
+            window = max(1, self.frame_cache.capacity_frames() // 2)
+            self.next_index = decode_range(self.cap, max(0, frame_idx - window + 1), frame_idx,
+                                           self.frame_cache, self.keyframe_index)
+            return self.frame_cache.get(frame_idx)
+
+        skip = frame_idx - self.next_index if self.next_index is not None else -1
+        keyframe = self.keyframe_index.keyframe_before(frame_idx) if self.keyframe_index else None
+        # 같은 GOP 안에서 앞쪽으로 이동하면 탐색해도 키프레임부터 다시 디코딩하므로 이어서 읽는 편이 빠름
+        same_gop = keyframe is not None and skip >= 0 and keyframe <= self.next_index
+        if 0 <= skip <= self.MAX_GRAB_SKIP or same_gop:
+            for _ in range(skip):
+                if not self.cap.grab():
+                    break
+        else:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+
         ret, frame = self.cap.read()
         if not ret:
             return None
+        self.next_index = frame_idx + 1
+        if self.frame_cache is not None:
+            self.frame_cache.put(frame_idx, frame)
+        return frame
+
+    # 이 프레임 수보다 오래된 감지 결과는 그리지 않음 (먼 위치로 이동한 경우)
+    MAX_DETECTION_AGE = 30
+
+    def process_frame(self, frame, frame_idx=None):
+        """
+        디코딩된 BGR 프레임에 물체 추적과 감지를 적용하고 RGB로 변환합니다.
+        추적 상태를 이어서 사용하므로 프레임 순서대로 한 스레드에서만 호출해야 합니다.
+        감지는 기다리지 않고 작업자에 넘긴 뒤 가장 최근 결과를 그립니다.
+        (이미 감지한 프레임은 캐시된 결과를 바로 그림)
+        """
+        detecting = self.object_detector.is_detecting
+        # 이미 감지한 프레임은 추론 없이 저장된 결과를 그림
+        detections = None
+        if detecting and self.detection_cache is not None and frame_idx is not None:
+            detections = self.detection_cache.get(frame_idx)
+        source_index = frame_idx
+
+        if detecting and self.object_detector.net is not None:
+            if self.detection_mode == 'interval':
+                detections = self.interval_detector.process(frame, frame_idx)
+            elif detections is None:
+                # 작업자가 읽는 동안 원본이 바뀌지 않도록 아래에서는 새 배열에만 그림
+                self.detection_worker.submit(frame, frame_idx)
 
         if self.tracking_enabled:
             frame = self.track_objects(frame)
-        
-        # 물체 감지 적용
-        frame = self.object_detector.detect_objects(frame)
-        
-        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        # 물체 감지 결과 표시
+        self.drawn_detection_index = None
+        if detecting and detections is None and self.detection_mode == 'async':
+            result = self.detection_worker.latest()
+            if result is not None and self.is_recent(result, frame_idx):
+                detections = result.detections
+                source_index = result.index
+        # 모델(클래스 이름/색상)을 불러오지 못했으면 캐시된 결과도 그리지 않음
+        if detections is not None and self.object_detector.classes:
+            self.object_detector.draw(frame, detections)
+            self.drawn_detection_index = source_index
+        return frame
+
+    def is_recent(self, result, frame_idx):
+        """감지 결과가 현재 프레임에 그려도 될 만큼 가까운지"""
+        if frame_idx is None or result.index is None:
+            return True
+        return 0 <= frame_idx - result.index <= self.MAX_DETECTION_AGE
 
     def track_objects(self, frame):
         """프레임에서 물체를 추적합니다."""
@@ -100,8 +244,7 @@ class VideoProcessor:
 
     def __del__(self):
         """소멸자: 비디오 캡처 객체를 해제합니다."""
-        if self.cap is not None:
-            self.cap.release()
+        self.release()
         
     def apply_filter(self, filter_func):
         """현재 프레임에 필터를 적용합니다."""
@@ -113,7 +256,32 @@ class VideoProcessor:
         """비디오 캡처 객체 해제합니다."""
         if self.cap is not None:
             self.cap.release()
+        if self.prefetcher is not None:
+            self.prefetcher.stop()
+            self.prefetcher = None
+        self.frame_cache = None
+        if self.detection_cache is not None:
+            self.detection_worker.cache = None
+            self.interval_detector.cache = None
+            self.detection_cache.close()
+            self.detection_cache = None
 
     def toggle_detection(self):
         """물체 감지 켜기/끄기"""
-        return self.object_detector.toggle_detection()
\ No newline at end of file
+        return self.object_detector.toggle_detection()
+
+    def toggle_interval_detection(self):
+        """간격 감지(감지 + 광학 흐름)와 작업자 스레드 감지 사이 전환"""
+        self.detection_mode = 'async' if self.detection_mode == 'interval' else 'interval'
+        self.interval_detector.reset()
+        return self.detection_mode == 'interval'
+
+    def detection_summary(self):
+        """현재 감지 방식의 상태 표시줄용 요약"""
+        if self.detection_mode == 'interval':
+            return self.interval_detector.summary()
+        return self.detection_worker.summary()
+
+
+# 성능 측정을 켜면 프레임 읽기/처리 시간을 기록 (재생 중에는 PlaybackPipeline이 단계별로 기록)
+profiler.register(VideoProcessor, ['get_frame'], 'video')
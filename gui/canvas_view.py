@@ -0,0 +1,320 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QPoint, QPointF, QRect, QRectF, QSize, QTimer
+from PyQt5.QtGui import QImage, QPainter, QColor, QFont, QPen, QPolygonF, QRegion, QTransform
+import cv2
+import numpy as np
+
+"""캔버스 표시: 축소용 밉 피라미드 + 보이는 영역만 그리기 + 도구 미리보기 overlay"""
+
+
+class MipPyramid:
+    """
+    원본 이미지를 1/2씩 줄인 이미지 목록 (단계는 필요할 때 만듦)
+    - levels[0]은 원본 이미지 자체 (복사하지 않음)
+    - invalidate()로 바뀐 영역만 표시해 두면 다음에 그 단계를 쓸 때 해당 영역만 다시 계산
+      (한 단계의 픽셀은 아래 단계의 2x2 픽셀 평균이므로 영역별 계산 결과가 전체 계산과 같음)
+    """
+    def __init__(self, image=None):
+        self.reset(image)
+
+    def reset(self, image):
+        """다른 이미지로 교체 (만들어 둔 단계는 모두 버림)"""
+        self.levels = [image]
+        # 단계마다 다시 계산해야 할 영역 (x0, y0, x1, y1)
+        self.dirty = [None]
+
+    def invalidate(self, x, y, w, h):
+        """원본 좌표의 (x, y, w, h) 영역이 바뀌었음을 표시"""
+        x0, y0, x1, y1 = x, y, x + w, y + h
+        for k in range(1, len(self.levels)):
+            # 홀수 경계가 걸친 픽셀까지 포함하도록 바깥쪽으로 반올림
+            x0, y0 = x0 // 2, y0 // 2
+            x1, y1 = (x1 + 1) // 2, (y1 + 1) // 2
+            if self.levels[k] is None:
+                continue
+            height, width = self.levels[k].shape[:2]
+            rect = (max(0, x0), max(0, y0), min(width, x1), min(height, y1))
+            if rect[0] >= rect[2] or rect[1] >= rect[3]:
+                continue
+            old = self.dirty[k]
+            if old is not None:
+                # 흩어진 영역은 감싸는 사각형 하나로 합침
+                rect = (min(old[0], rect[0]), min(old[1], rect[1]), max(old[2], rect[2]), max(old[3], rect[3]))
+            self.dirty[k] = rect
+
+    def level(self, k):
+        """k번째 단계 이미지 (원본 크기의 약 1/2^k, 너무 작아지면 가장 작은 단계)"""
+        for i in range(1, k + 1):
+            if i == len(self.levels):
+                height, width = self.levels[i - 1].shape[:2]
+                if width < 2 or height < 2:
+                    return self.levels[i - 1]
+                self.levels.append(None)
+                self.dirty.append(None)
+            if self.levels[i] is None:
+                self.levels[i] = self.downsample(self.levels[i - 1])
+                self.dirty[i] = None
+            elif self.dirty[i] is not None:
+                x0, y0, x1, y1 = self.dirty[i]
+                source = self.levels[i - 1][2 * y0:2 * y1, 2 * x0:2 * x1]
+                self.levels[i][y0:y1, x0:x1] = cv2.resize(source, (x1 - x0, y1 - y0), interpolation=cv2.INTER_AREA)
+                self.dirty[i] = None
+        return self.levels[k]
+
+    @staticmethod
+    def downsample(image):
+        height, width = image.shape[:2]
+        width, height = width // 2, height // 2
+        return cv2.resize(image[:2 * height, :2 * width], (width, height), interpolation=cv2.INTER_AREA)
+
+
+class CanvasView(QWidget):
+    """
+    이미지를 zoom 배율로 표시하는 위젯 (스크롤 영역 안에서 사용)
+    - 위젯 크기는 표시 크기만큼 커지지만 paintEvent에서 다시 그려야 하는 영역(화면에 보이는 부분)만 계산
+    - 1배 이상 확대는 최근접 샘플링, 축소는 밉 피라미드의 가까운 단계에서 영역 평균(INTER_AREA)
+    - 도구의 미리보기(Overlay)는 이미지 위에 QPainter로 그리고, 바뀐 영역만 다시 그림
+    그래서 다시 그리는 비용이 이미지 크기가 아니라 창 크기에 비례합니다.
+    """
+    # overlay 영역 바깥으로 더 다시 그릴 화면 픽셀 수 (화면 크기로 그리는 핸들/점선 포함)
+    OVERLAY_MARGIN = 6
+    HANDLE_SIZE = 4
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.image = None
+        self.zoom = 1.0
+        self.pyramid = MipPyramid()
+        # 카메라 녹화 중 표시
+        self.show_rec = False
+        self.background = QColor('#2d2d2d')
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.overlay = None
+        # 선택 영역 점선이 있으면 점선을 조금씩 움직임
+        self.ants_offset = 0
+        self.ants_timer = QTimer(self)
+        self.ants_timer.setInterval(120)
+        self.ants_timer.timeout.connect(self.march_ants)
+
+    def set_image(self, image, zoom=None, dirty=None):
+        """
+        표시할 이미지를 바꿉니다.
+        dirty: 이전 이미지와 달라진 영역 (x, y, w, h). 주면 그 영역만 피라미드를 다시 계산하고 다시 그림
+        """
+        if image.ndim == 3 and image.shape[2] == 4:
+            image = cv2.cvtColor(image, cv2.COLOR_RGBA2RGB)
+        partial = dirty is not None and self.image is not None and image.shape == self.image.shape
+        if partial:
+            self.pyramid.levels[0] = image
+            self.pyramid.invalidate(*dirty)
+        else:
+            self.pyramid.reset(image)
+        self.image = image
+
+        old_size = self.minimumSize()
+        if zoom is not None:
+            self.zoom = zoom
+        size = QSize(*self.content_size())
+        if size != old_size:
+            self.setMinimumSize(size)
+            self.update()
+        elif partial:
+            self.update(self.widget_rect(*dirty))
+        else:
+            self.update()
+
+    def content_size(self):
+        if self.image is None:
+            return 0, 0
+        height, width = self.image.shape[:2]
+        return max(1, int(width * self.zoom)), max(1, int(height * self.zoom))
+
+    def offset(self):
+        """위젯이 이미지보다 크면 가운데 정렬"""
+        width, height = self.content_size()
+        return max(0, (self.width() - width) // 2), max(0, (self.height() - height) // 2)
+
+    def map_to_image(self, pos, clamp=False):
+        """위젯 좌표를 이미지 좌표 QPoint로 변환 (이미지 밖이면 None, clamp면 가장 가까운 가장자리)"""
+        if self.image is None:
+            return None
+        offset_x, offset_y = self.offset()
+        width, height = self.content_size()
+        x, y = pos.x() - offset_x, pos.y() - offset_y
+        if clamp:
+            x, y = min(max(x, 0), width - 1), min(max(y, 0), height - 1)
+        if 0 <= x < width and 0 <= y < height:
+            image_height, image_width = self.image.shape[:2]
+            return QPoint(min(image_width - 1, int(x / self.zoom)), min(image_height - 1, int(y / self.zoom)))
+        return None
+
+    def widget_rect(self, x, y, w, h):
+        """이미지 좌표 영역을 덮는 위젯 좌표 영역"""
+        offset_x, offset_y = self.offset()
+        x0, y0 = int(np.floor(x * self.zoom)), int(np.floor(y * self.zoom))
+        x1, y1 = int(np.ceil((x + w) * self.zoom)), int(np.ceil((y + h) * self.zoom))
+        return QRect(offset_x + x0 - 1, offset_y + y0 - 1, x1 - x0 + 2, y1 - y0 + 2)
+
+    def overlay_rect(self, rect):
+        """overlay 영역 (이미지 좌표)을 덮는 위젯 좌표 영역"""
+        margin = self.OVERLAY_MARGIN
+        return self.widget_rect(*rect).adjusted(-margin, -margin, margin, margin)
+
+    def set_overlay(self, overlay):
+        """표시할 도구 미리보기 (None이면 표시하지 않음)"""
+        self.overlay = overlay
+        if overlay is not None:
+            overlay.take_changed()
+        self.update()
+        self.update_ants_timer()
+
+    def update_overlay(self):
+        """overlay에서 바뀐 영역만 다시 그림"""
+        if self.overlay is None:
+            return
+        changed = self.overlay.take_changed()
+        if changed is not None and self.image is not None:
+            self.update(self.overlay_rect(changed))
+        self.update_ants_timer()
+
+    def update_ants_timer(self):
+        if self.overlay is not None and self.overlay.has_ants():
+            if not self.ants_timer.isActive():
+                self.ants_timer.start()
+        elif self.ants_timer.isActive():
+            self.ants_timer.stop()
+
+    def march_ants(self):
+        """점선 테두리 부분만 다시 그림 (안쪽은 그대로)"""
+        if self.overlay is None or self.image is None:
+            return
+        self.ants_offset = (self.ants_offset + 1) % 8
+        band = 2 * self.OVERLAY_MARGIN
+        region = QRegion()
+        for kind, bounds, _ in self.overlay.items:
+            if kind == 'ants':
+                rect = self.overlay_rect(bounds)
+                region += QRect(rect.left(), rect.top(), rect.width(), band)
+                region += QRect(rect.left(), rect.bottom() - band + 1, rect.width(), band)
+                region += QRect(rect.left(), rect.top(), band, rect.height())
+                region += QRect(rect.right() - band + 1, rect.top(), band, rect.height())
+        if not region.isEmpty():
+            self.update(region)
+
+    def render(self, x, y, w, h):
+        """표시 좌표 (x, y, w, h) 영역의 RGB 이미지"""
+        if self.zoom == 1.0:
+            region = self.image[y:y + h, x:x + w]
+        elif self.zoom > 1.0:
+            # 최근접: 표시 픽셀마다 원본 픽셀 하나를 고름
+            height, width = self.image.shape[:2]
+            xs = np.minimum((np.arange(x, x + w) / self.zoom).astype(np.intp), width - 1)
+            ys = np.minimum((np.arange(y, y + h) / self.zoom).astype(np.intp), height - 1)
+            region = self.image.take(ys, axis=0).take(xs, axis=1)
+        else:
+            # 배율 이상인 가장 작은 단계를 골라 (단계 배율 / zoom 이 1 ~ 2) 영역 평균으로 줄임
+            k = int(np.floor(np.log2(1.0 / self.zoom) + 1e-9))
+            level = self.pyramid.level(k)
+            # 표시 좌표 → 단계 좌표 비율 (가로/세로 따로 계산해야 반올림 오차가 생기지 않음)
+            width, height = self.content_size()
+            ratio_x, ratio_y = level.shape[1] / width, level.shape[0] / height
+            x0, y0 = int(x * ratio_x), int(y * ratio_y)
+            x1 = min(level.shape[1], max(x0 + 1, int(np.ceil((x + w) * ratio_x - 1e-9))))
+            y1 = min(level.shape[0], max(y0 + 1, int(np.ceil((y + h) * ratio_y - 1e-9))))
+            region = level[y0:y1, x0:x1]
+            if region.shape[1] != w or region.shape[0] != h:
+                region = cv2.resize(region, (w, h), interpolation=cv2.INTER_AREA)
+        if region.ndim == 2:
+            region = cv2.cvtColor(region, cv2.COLOR_GRAY2RGB)
+        return np.ascontiguousarray(region)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = event.rect()
+        painter.fillRect(rect, self.background)
+        if self.image is None:
+            return
+        offset_x, offset_y = self.offset()
+        width, height = self.content_size()
+        visible = rect & QRect(offset_x, offset_y, width, height)
+        if not visible.isEmpty():
+            region = self.render(visible.x() - offset_x, visible.y() - offset_y, visible.width(), visible.height())
+            image = QImage(region.data, region.shape[1], region.shape[0], region.strides[0], QImage.Format_RGB888)
+            painter.drawImage(visible.topLeft(), image)
+        if self.overlay is not None and self.overlay.items:
+            self.paint_overlay(painter, rect)
+
+        if self.show_rec:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(255, 0, 0))
+            painter.drawEllipse(QPoint(offset_x + 30, offset_y + 30), 10, 10)
+            painter.setPen(QColor(255, 0, 0))
+            painter.setFont(QFont('Arial', 10, QFont.Bold))
+            painter.drawText(offset_x + 45, offset_y + 35, "REC")
+
+    def paint_overlay(self, painter, rect):
+        """다시 그리는 영역 rect에 걸친 overlay 항목만 그림"""
+        offset_x, offset_y = self.offset()
+        # 이미지 좌표 → 위젯 좌표 (픽셀 (x, y)의 중심이 x + 0.5, y + 0.5)
+        transform = QTransform().translate(offset_x, offset_y).scale(self.zoom, self.zoom).translate(0.5, 0.5)
+        painter.save()
+        painter.setClipRect(rect)
+        for kind, bounds, args in self.overlay.items:
+            if not self.overlay_rect(bounds).intersects(rect):
+                continue
+            painter.setTransform(transform)
+            painter.setBrush(Qt.NoBrush)
+            if kind == 'rect':
+                (x0, y0, x1, y1), color, thickness = args
+                self.set_shape_pen(painter, color, thickness)
+                painter.drawRect(QRectF(QPointF(min(x0, x1), min(y0, y1)), QPointF(max(x0, x1), max(y0, y1))))
+            elif kind == 'circle':
+                center_x, center_y, radius, color, thickness = args
+                self.set_shape_pen(painter, color, thickness)
+                painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
+            elif kind == 'polygon':
+                points, color, thickness = args
+                self.set_shape_pen(painter, color, thickness)
+                painter.drawPolygon(QPolygonF([QPointF(x, y) for x, y in points]))
+            elif kind == 'fill':
+                x, y, w, h, color = args
+                painter.fillRect(QRectF(x - 0.5, y - 0.5, w, h), QColor(*color))
+            elif kind == 'image':
+                x, y, content = args
+                height, width = content.shape[:2]
+                if content.ndim == 2:
+                    image = QImage(content.data, width, height, content.strides[0], QImage.Format_Grayscale8)
+                elif content.shape[2] == 4:
+                    image = QImage(content.data, width, height, content.strides[0], QImage.Format_RGBA8888)
+                else:
+                    image = QImage(content.data, width, height, content.strides[0], QImage.Format_RGB888)
+                painter.drawImage(QRectF(x - 0.5, y - 0.5, width, height), image)
+            elif kind == 'ants':
+                # 흰 실선 위에 검은 점선 (점선 간격은 화면 픽셀 기준)
+                x, y, w, h = args
+                painter.setPen(QPen(Qt.white, 0))
+                painter.drawRect(QRectF(x, y, w, h))
+                pen = QPen(Qt.black, 0)
+                pen.setDashPattern([4, 4])
+                pen.setDashOffset(self.ants_offset)
+                painter.setPen(pen)
+                painter.drawRect(QRectF(x, y, w, h))
+            elif kind == 'handles':
+                points, = args
+                size = self.HANDLE_SIZE
+                painter.resetTransform()
+                painter.setPen(QPen(Qt.black, 0))
+                painter.setBrush(Qt.white)
+                for x, y in points:
+                    center = transform.map(QPointF(x, y))
+                    painter.drawRect(QRectF(center.x() - size, center.y() - size, 2 * size, 2 * size))
+        painter.restore()
+
+    @staticmethod
+    def set_shape_pen(painter, color, thickness):
+        """cv2 도형과 같은 두께 (이미지 픽셀 단위, 음수면 채우기)"""
+        color = QColor(*[int(c) for c in color[:3]])
+        if thickness < 0:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+        else:
+            painter.setPen(QPen(color, max(1, thickness)))
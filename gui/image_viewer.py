@@ -1,8 +1,6 @@
-from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QScrollArea
-from PyQt5.QtCore import Qt, QPoint
-from PyQt5.QtGui import QImage, QPixmap
-import cv2
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QScrollArea
 import numpy as np
+from gui.canvas_view import CanvasView
 
 class ImageViewer(QWidget):
     def __init__(self, parent=None):
@@ -13,19 +11,12 @@ class ImageViewer(QWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         
-        # 이미지를 표시할 QLabel
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #2d2d2d;
-                border: 1px solid #333333;
-            }
-        """)
+        # 이미지를 표시할 캔버스 (화면에 보이는 부분만 그림)
+        self.canvas_view = CanvasView()
         
         # 스크롤 영역 설정
         self.scroll_area = QScrollArea()
-        self.scroll_area.setWidget(self.image_label)
+        self.scroll_area.setWidget(self.canvas_view)
         self.scroll_area.setWidgetResizable(True)
         
         self.layout.addWidget(self.scroll_area)
@@ -35,41 +26,15 @@ class ImageViewer(QWidget):
         self.zoom_level = 1.0
         self.update_display()
         
-    def update_display(self, image=None):
-        """이미지 디스플레이 업데이트"""
+    def update_display(self, image=None, dirty=None):
+        """
+        이미지 디스플레이 업데이트
+        dirty: 바뀐 영역 (x, y, w, h)을 알면 그 영역만 다시 그림
+        """
         if image is not None:
             self.current_image = image
-            
-        height, width = self.current_image.shape[:2]
-        new_width = int(width * self.zoom_level)
-        new_height = int(height * self.zoom_level)
-        
-        resized = cv2.resize(self.current_image, (new_width, new_height))
-        bytes_per_line = 3 * new_width
-        
-        q_img = QImage(
-            resized.data,
-            new_width,
-            new_height,
-            bytes_per_line,
-            QImage.Format_RGB888
-        )
-        pixmap = QPixmap.fromImage(q_img)
-        self.image_label.setPixmap(pixmap)
+        self.canvas_view.set_image(self.current_image, self.zoom_level, dirty)
         
     def get_image_position(self, pos):
         """위젯 좌표를 이미지 좌표로 변환"""
-        if self.image_label.pixmap():
-            rect = self.image_label.geometry()
-            scaled_rect = self.image_label.pixmap().rect()
-            
-            x_offset = (rect.width() - scaled_rect.width()) // 2
-            y_offset = (rect.height() - scaled_rect.height()) // 2
-            
-            x = pos.x() - x_offset
-            y = pos.y() - y_offset
-            
-            if (0 <= x < scaled_rect.width() and 
-                0 <= y < scaled_rect.height()):
-                return QPoint(x, y)
-        return None 
\ No newline at end of file
+        return self.canvas_view.map_to_image(pos)
@@ -1,13 +1,15 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                           QPushButton, QLabel, QSlider, QFileDialog, QColorDialog, QFrame, QScrollArea, QComboBox, QMenu, QAction, QInputDialog, QDialog, QTabWidget, QToolBox, QDockWidget, QMessageBox, QShortcut)
-from PyQt5.QtCore import Qt, QPoint, QSize, QTimer
+                           QPushButton, QLabel, QSlider, QFileDialog, QColorDialog, QFrame, QScrollArea, QComboBox, QMenu, QAction, QInputDialog, QDialog, QTabWidget, QToolBox, QDockWidget, QMessageBox, QShortcut, QProgressDialog, QActionGroup)
+from PyQt5.QtCore import Qt, QPoint, QSize, QTimer, QSettings
 from PyQt5.QtGui import QFont, QKeySequence
+import threading
 import cv2
 import numpy as np
-from features.tools import PenTool, EraserTool, RectangleTool, CircleTool, TextTool, SelectTool, PolygonTool
+from features.tools import PenTool, EraserTool, RectangleTool, CircleTool, TextTool, SelectTool, PolygonTool, union_rect
 from features.history_manager import HistoryManager
 from features.filters import (
-    GrayscaleFilter, BlurFilter, MosaicFilter, SharpenFilter, EdgeFilter, BrightnessFilter, ContrastFilter, SepiaFilter, CartoonFilter, SketchFilter, MorphologyFilter
+    GrayscaleFilter, BlurFilter, MosaicFilter, SharpenFilter, EdgeFilter, BrightnessFilter, ContrastFilter, SepiaFilter, CartoonFilter, SketchFilter, MorphologyFilter,
+    FilterChain, TiledExecutor, FilterResultCache
 )
 from features.camera import CameraDialog  # 상단에 import 추가
 from features.selection_tools import SelectionTool
@@ -19,10 +21,14 @@ from features.chromakey_tool import ChromakeyDialog, ChromakeyTool
 from features.seamless_clone_tool import SeamlessCloneDialog, SeamlessCloneTool
 from features.background_removal_tool import BackgroundRemovalTool
 from features.video.video_processor import VideoProcessor  # 수정된 import 경로
+from features.video.playback_pipeline import PlaybackPipeline
+from features.video.video_exporter import VideoExporter
 from features.panorama_tool import PanoramaTool
 from features.panorama_dialog import PanoramaDialog
 from gui.preview_menu import PreviewMenu  # 추가된 import 문
-from features.screen_recorder import ScreenRecorder
+from gui.canvas_view import CanvasView
+from features.screen_recorder import ScreenRecorder, BLOCK, DROP_OLDEST, DROP_NEWEST
+from features.profiler import profiler
 from datetime import datetime
 
 class MainWindow(QMainWindow):
@@ -108,8 +114,13 @@ class MainWindow(QMainWindow):
             'bg_removal': BackgroundRemovalTool()
         }
         
-        # 파노라마 도구 초기화
+        # 파노라마 도구 초기화 (SIFT 검출기는 처음 사용할 때 생성)
         self.panorama_tool = PanoramaTool()
+        # 켜 두면 창을 띄운 뒤 백그라운드에서 모델을 미리 불러와 첫 감지/파노라마가 느리지 않게 함
+        # (기본은 꺼짐 - 사용할 때 불러옴, 선택은 다음 실행에도 유지)
+        self.settings = QSettings('OpenCV', 'ImageEditor')
+        self.warm_up_models = self.settings.value('warm_up_models', False, type=bool)
+        self.warm_up_started = False
         
         # 필터 초기화 가
         self.filters = {
@@ -128,8 +139,15 @@ class MainWindow(QMainWindow):
             '모폴로지-열기': MorphologyFilter('opening'),
             '모폴로지-닫기': MorphologyFilter('closing')
         }
+        # 큰 이미지는 필터를 타일로 나누어 여러 스레드에서 적용
+        self.tiled_executor = TiledExecutor()
+        # 같은 이미지에 같은 필터를 다시 적용할 때 재계산하지 않도록 결과 캐시
+        self.filter_cache = FilterResultCache()
         
         self.current_tool = self.tools['pen']
+        # 도구 드래그 한 번(누름~놓음) 동안 바뀐 영역과 제자리 편집 횟수
+        self.stroke_rect = None
+        self.edit_count = 0
         
         # 레이어 
         self.layers = []  # 레이어 리스트
@@ -138,6 +156,18 @@ class MainWindow(QMainWindow):
         # 비디오 처리 관련 속성은 유
         self.video_processor = VideoProcessor()
         self.current_frame_idx = 0
+        # 재생 중에만 사용하는 디코딩/분석/필터 파이프라인
+        self.playback_pipeline = None
+        self.is_playing = False
+        # 비디오 내보내기 (백그라운드 스레드에서 실행하고 타이머로 진행 상황 표시)
+        self.video_exporter = None
+        self.export_dialog = None
+        self.export_timer = QTimer()
+        self.export_timer.timeout.connect(self.update_export_progress)
+        # 카메라 번호 (웹캠이 없으면 비디오 파일 경로로 바꿔서 사용)
+        self.camera_source = 0
+        # 카메라 녹화 (인코딩은 녹화 중에만 도는 별도 스레드에서 처리)
+        self.screen_recorder = ScreenRecorder(self)
         
         # GUI 설정
         self.setup_gui()
@@ -147,8 +177,18 @@ class MainWindow(QMainWindow):
         
         # 단축키 설정
         self.setup_shortcuts()
-        
-        self.screen_recorder = ScreenRecorder(self)
+
+        # 성능 측정 결과 표시 (측정을 켰을 때만 갱신)
+        self.profile_label = QLabel()
+        self.statusBar().addPermanentWidget(self.profile_label)
+        self.profile_timer = QTimer()
+        self.profile_timer.timeout.connect(self.update_profile_status)
+
+        # 물체 감지 속도/지연 표시 (감지를 켰을 때만 갱신)
+        self.detection_label = QLabel()
+        self.statusBar().addPermanentWidget(self.detection_label)
+        self.detection_timer = QTimer()
+        self.detection_timer.timeout.connect(self.update_detection_status)
 
     def setup_shortcuts(self):
         """키보드 단축키 설정"""
@@ -186,23 +226,17 @@ class MainWindow(QMainWindow):
         tool_widget.setLayout(self.tool_layout)
         tool_widget.setFixedWidth(170)
         
-        # 이미지 표시 영역
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setStyleSheet("""
-            QLabel {
-                background-color: #2d2d2d;
-                border: 1px solid #333333;
-            }
-        """)
-        self.image_label.setMouseTracking(True)
-        self.image_label.mousePressEvent = self.mouse_press
-        self.image_label.mouseReleaseEvent = self.mouse_release
-        self.image_label.mouseMoveEvent = self.mouse_move
+        # 이미지 표시 영역 (화면에 보이는 부분만 그림)
+        self.canvas_view = CanvasView()
+        self.canvas_view.setMouseTracking(True)
+        self.canvas_view.mousePressEvent = self.mouse_press
+        self.canvas_view.mouseReleaseEvent = self.mouse_release
+        self.canvas_view.mouseMoveEvent = self.mouse_move
+        self.canvas_view.set_overlay(self.current_tool.overlay)
         
         # 스크롤 영역 추가
         scroll_area = QScrollArea()
-        scroll_area.setWidget(self.image_label)
+        scroll_area.setWidget(self.canvas_view)
         scroll_area.setWidgetResizable(True)
         
         # 레에 위젯 가
@@ -336,6 +370,31 @@ class MainWindow(QMainWindow):
             morph_menu.addAction(f"{icon} {name}", lambda n=name: self.apply_filter_from_menu(n))
         morph_button.clicked.connect(lambda: morph_menu.exec_(morph_button.mapToGlobal(morph_button.rect().bottomLeft())))
 
+        # 성능 측정 메뉴
+        profile_button = QPushButton("⏱️ 성능")
+        profile_menu = QMenu(self)
+        profile_action = profile_menu.addAction("측정 켜기")
+        profile_action.setCheckable(True)
+        profile_action.toggled.connect(self.toggle_profiling)
+        profile_menu.addAction("트레이스 내보내기", self.export_profile_trace)
+        profile_menu.addAction("기록 지우기", profiler.clear)
+        profile_menu.addAction("필터 캐시 통계", self.show_filter_cache_stats)
+        profile_menu.addSeparator()
+        warm_up_action = profile_menu.addAction("모델 미리 불러오기")
+        warm_up_action.setCheckable(True)
+        warm_up_action.setChecked(self.warm_up_models)
+        warm_up_action.toggled.connect(self.set_warm_up_models)
+        # 카메라 녹화 인코딩이 밀릴 때의 처리 방식
+        record_menu = profile_menu.addMenu("녹화 큐가 가득 차면")
+        record_group = QActionGroup(self)
+        for policy, label in ((BLOCK, "기다리기"), (DROP_OLDEST, "오래된 프레임 버리기"),
+                              (DROP_NEWEST, "새 프레임 버리기")):
+            action = record_menu.addAction(label, lambda p=policy: self.set_record_policy(p))
+            action.setCheckable(True)
+            action.setChecked(policy == self.screen_recorder.policy)
+            record_group.addAction(action)
+        profile_button.clicked.connect(lambda: profile_menu.exec_(profile_button.mapToGlobal(profile_button.rect().bottomLeft())))
+
         # 레이아웃에 추가
         toolbar_layout.addWidget(file_button)
         toolbar_layout.addWidget(edit_button)
@@ -344,6 +403,7 @@ class MainWindow(QMainWindow):
         toolbar_layout.addWidget(filter_button)
         toolbar_layout.addWidget(edge_button)
         toolbar_layout.addWidget(morph_button)
+        toolbar_layout.addWidget(profile_button)
         toolbar_layout.addStretch()
 
         layout.addWidget(toolbar_widget)
@@ -374,7 +434,7 @@ class MainWindow(QMainWindow):
                     if panorama is not None:
                         self.current_image = panorama
                         self.update_image_display()
-                        self.history_manager.add(self.current_image.copy())
+                        self.history_manager.add(self.current_image)
                         self.statusBar().showMessage("파노라마 생성되었습니다.")
                     else:
                         QMessageBox.warning(self, "오류", "파노라마 생성에 실패했습다.")
@@ -391,7 +451,8 @@ class MainWindow(QMainWindow):
                 if not hasattr(self, 'original_image') or self.original_image is None:
                     self.original_image = self.current_image.copy()
                 
-                self.current_image = self.filters[filter_name].apply(self.current_image.copy())
+                self.current_image = self.filter_cache.apply(
+                    self.filters[filter_name], self.current_image, executor=self.tiled_executor)
                 self.filters[filter_name].is_applied = True
             else:
                 # 필터 해제
@@ -400,7 +461,7 @@ class MainWindow(QMainWindow):
                 self.filters[filter_name].is_applied = False
             
             self.update_image_display()
-            self.history_manager.add(self.current_image.copy())
+            self.history_manager.add(self.current_image)
 
     def create_toolbar_button(self, icon_text, tooltip):
         button = QPushButton(icon_text)
@@ -517,6 +578,8 @@ class MainWindow(QMainWindow):
             ("⏯️ 재생/일시정지", "비디오 재생 또는 일시정지", self.toggle_play),
             ("👁️ 물체 추적", "물체 추적 켜기/끄기", self.toggle_tracking),
             ("🎯 물체 감지", "물체 감지 켜기/끄기", self.toggle_detection),  # 추가
+            ("⚡ 간격 감지", "N 프레임마다 감지하고 사이 프레임은 광학 흐름으로 상자 이동", self.toggle_interval_detection),
+            ("💾 비디오 내보내기", "필터/추적/감지를 적용한 비디오 저장 (구간을 설정했으면 그 구간만)", self.export_video),
         ]
         
         for text, tooltip, callback in video_tools:
@@ -525,6 +588,14 @@ class MainWindow(QMainWindow):
             button.setToolTip(tooltip)
             button.clicked.connect(callback)
             video_layout.addWidget(button)
+
+        loop_button = QPushButton("🔁 반복 재생")
+        loop_button.setStyleSheet(self.button_style)
+        loop_button.setToolTip("영상 끝에서 처음부터 다시 재생 (끄면 마지막 프레임에서 멈춤)")
+        loop_button.setCheckable(True)
+        loop_button.setChecked(getattr(self, 'loop_enabled', True))
+        loop_button.clicked.connect(self.toggle_loop)
+        video_layout.addWidget(loop_button)
         
         # 프레임 이동 슬라이더
         frame_label = QLabel("프레임 이동")
@@ -564,7 +635,7 @@ class MainWindow(QMainWindow):
                     if panorama is not None:
                         self.current_image = panorama
                         self.update_image_display()
-                        self.history_manager.add(self.current_image.copy())
+                        self.history_manager.add(self.current_image)
                         self.statusBar().showMessage("파노라마가 생성되었습니다.")
                     else:
                         QMessageBox.warning(self, "오류", "파노라마 생성에 실패했습니다.")
@@ -576,6 +647,7 @@ class MainWindow(QMainWindow):
 
         # 다른 도구들 처리
         self.current_tool = self.tools[tool_name]
+        self.canvas_view.set_overlay(getattr(self.current_tool, 'overlay', None))
         
         if tool_name == 'chromakey':
             dialog = ChromakeyDialog(self)
@@ -584,7 +656,7 @@ class MainWindow(QMainWindow):
                 if result is not None:
                     self.current_image = result
                     self.update_image_display()
-                    self.history_manager.add(self.current_image.copy())
+                    self.history_manager.add(self.current_image)
         elif tool_name == 'seamless':
             dialog = SeamlessCloneDialog(self)
             if dialog.exec_() == QDialog.Accepted:
@@ -592,13 +664,13 @@ class MainWindow(QMainWindow):
                 if result is not None:
                     self.current_image = result
                     self.update_image_display()
-                    self.history_manager.add(self.current_image.copy())
+                    self.history_manager.add(self.current_image)
         elif tool_name == 'bg_removal':
             result = self.current_tool.remove_background(self.current_image.copy())
             if result is not None:
                 self.current_image = result
                 self.update_image_display()
-                self.history_manager.add(self.current_image.copy())
+                self.history_manager.add(self.current_image)
         else:
             # 합 도구가 선택된 경우
             if tool_name == 'blend':
@@ -640,8 +712,10 @@ class MainWindow(QMainWindow):
             pos = self.get_image_position(event.pos())
             if pos:
                 self.is_drawing = True
-                self.current_image = self.current_tool.on_press(self.current_image.copy(), pos)
-                self.update_image_display()
+                # 이미지를 제자리에서 바꾸므로 그 전에 기록 기준을 맞춤
+                self.history_manager.begin(self.current_image)
+                self.stroke_rect = None
+                self.apply_tool('on_press', pos)
         elif event.button() == Qt.RightButton and isinstance(self.current_tool, SelectionTool):
             # 택 도구에 대한 컨텍스트 메
             menu = QMenu(self)
@@ -665,7 +739,7 @@ class MainWindow(QMainWindow):
         if isinstance(self.current_tool, SelectionTool):
             self.clipboard_content = self.current_tool.copy_selection(self.current_image)
             if self.clipboard_content is not None:
-                self.history_manager.add(self.current_image.copy())
+                self.history_manager.add(self.current_image)
 
     def paste_selection(self, pos):
         if isinstance(self.current_tool, SelectionTool) and hasattr(self, 'clipboard_content'):
@@ -674,81 +748,91 @@ class MainWindow(QMainWindow):
                 self.current_image = self.current_tool.paste_selection(
                     self.current_image.copy(), pos)
                 self.update_image_display()
-                self.history_manager.add(self.current_image.copy())
+                self.canvas_view.update_overlay()
+                self.history_manager.add(self.current_image)
 
     def delete_selection(self):
         if isinstance(self.current_tool, SelectionTool):
             self.current_image = self.current_tool.delete_selection(self.current_image.copy())
             self.update_image_display()
-            self.history_manager.add(self.current_image.copy())
+            self.canvas_view.update_overlay()
+            self.history_manager.add(self.current_image)
 
     def mouse_move(self, event):
         pos = self.get_image_position(event.pos())
         if pos and hasattr(self, 'is_drawing') and self.is_drawing:
-            self.current_image = self.current_tool.on_move(self.current_image.copy(), pos)
-            self.update_image_display()
+            self.apply_tool('on_move', pos)
 
     def mouse_release(self, event):
         if event.button() == Qt.LeftButton and hasattr(self, 'is_drawing'):
+            # 드래그 중이었다면 이미지 밖에서 놓아도 미리보기를 이미지에 반영하도록 가장자리로 맞춤
+            pos = self.get_image_position(event.pos(), clamp=self.is_drawing)
             self.is_drawing = False
-            pos = self.get_image_position(event.pos())
             if pos:
-                self.current_image = self.current_tool.on_release(self.current_image.copy(), pos)
-                self.history_manager.add(self.current_image.copy())
-                self.update_image_display()
+                self.apply_tool('on_release', pos)
+                # 누른 뒤로 바뀐 영역만 기록
+                if self.stroke_rect is not None:
+                    self.history_manager.add(self.current_image, self.stroke_rect)
 
-    def get_image_position(self, pos):
-        """위젯 좌표를 미지 좌표로 변환"""
-        if self.image_label.pixmap():
-            rect = self.image_label.geometry()
-            scaled_rect = self.image_label.pixmap().rect()
-            
-            x_offset = (rect.width() - scaled_rect.width()) // 2
-            y_offset = (rect.height() - scaled_rect.height()) // 2
-            
-            x = pos.x() - x_offset
-            y = pos.y() - y_offset
-            
-            if (0 <= x < scaled_rect.width() and 
-                0 <= y < scaled_rect.height()):
-                return QPoint(x, y)
-        return None
+    def apply_tool(self, method, pos):
+        """
+        현재 도구의 마우스 이벤트 처리 (current_image를 복사하지 않고 그대로 넘김)
+        도구가 알려 준 영역만 화면에 다시 그리고 이번 드래그의 변경 영역에 더합니다.
+        """
+        tool = self.current_tool
+        tool.dirty_rect = None
+        image = self.current_image
+        result = getattr(tool, method)(image, pos)
+        if result is not image:
+            # 새 배열을 돌려준 도구는 이미지 전체가 바뀐 것으로 봄
+            self.current_image = result
+            dirty = (0, 0, result.shape[1], result.shape[0])
+        else:
+            dirty = tool.changed_region(result)
+        if dirty is not None:
+            self.stroke_rect = union_rect(self.stroke_rect, dirty)
+            self.edit_count += 1
+            self.update_image_display(dirty)
+        # 미리보기는 이미지와 따로 바뀐 영역만 다시 그림
+        self.canvas_view.update_overlay()
 
-    def update_image_display(self):
-        """이미지 업데이트"""
+    def get_image_position(self, pos, clamp=False):
+        """위젯 좌표를 이미지 좌표로 변환 (확대/축소 배율 반영)"""
+        return self.canvas_view.map_to_image(pos, clamp)
+
+    def update_image_display(self, dirty=None):
+        """
+        이미지 업데이트
+        dirty: 바뀐 영역 (x, y, w, h)을 알면 그 영역만 다시 계산해서 그림
+        """
+        self.display_image(self.current_image, dirty)
+
+    def display_size(self):
+        """현재 이미지가 화면에 표시되는 크기 (너비, 높이)"""
         height, width = self.current_image.shape[:2]
-        new_width = int(width * self.zoom_level)
-        new_height = int(height * self.zoom_level)
-        
-        resized = cv2.resize(self.current_image, (new_width, new_height))
-        
+        return int(width * self.zoom_level), int(height * self.zoom_level)
+
+    def display_image(self, image, dirty=None):
+        """
+        주어진 이미지를 현재 이미지의 화면 크기로 표시합니다.
+        current_image는 바꾸지 않으므로 축소본 미리보기 표시에도 사용됩니다.
+        """
+        new_width, _ = self.display_size()
         # 카메라 녹화 중일 때만 REC 표시
-        if hasattr(self, 'screen_recorder') and self.screen_recorder.recording:
-            # 녹화 표시 추가
-            preview_frame = resized.copy()
-            cv2.circle(preview_frame, (30, 30), 10, (0, 0, 255), -1)
-            cv2.putText(preview_frame, "REC", (45, 35), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 2)
-            resized = preview_frame
-        
-        bytes_per_line = 3 * new_width
-        from PyQt5.QtGui import QImage, QPixmap
-        
-        q_img = QImage(
-            resized.data,
-            new_width,
-            new_height,
-            bytes_per_line,
-            QImage.Format_RGB888
-        )
-        pixmap = QPixmap.fromImage(q_img)
-        self.image_label.setPixmap(pixmap)
+        self.canvas_view.show_rec = hasattr(self, 'screen_recorder') and self.screen_recorder.recording
+        self.canvas_view.set_image(image, new_width / image.shape[1], dirty)
 
     def toggle_filter(self, filter_obj, action):
         """필터 토글"""
-        self.current_image = filter_obj.toggle(self.current_image.copy())
+        if not filter_obj.is_applied:
+            # 메뉴에서 적용할 때와 같이 캐시를 거침 (결과는 새 배열이므로 복사하지 않음)
+            self.current_image = self.filter_cache.apply(
+                filter_obj, self.current_image, executor=self.tiled_executor)
+            filter_obj.is_applied = True
+        else:
+            filter_obj.is_applied = False
         self.update_image_display()
-        self.history_manager.add(self.current_image.copy())
+        self.history_manager.add(self.current_image)
         
         # 다른 필터들 체크 상태 해제
         menu = action.parent()
@@ -762,12 +846,14 @@ class MainWindow(QMainWindow):
     def undo(self):
         """행 취소"""
         self.current_image = self.history_manager.undo(self.current_image)
-        self.update_image_display()
+        self.edit_count += 1
+        self.update_image_display(self.history_manager.last_rect)
 
     def redo(self):
         """시 실행"""
         self.current_image = self.history_manager.redo(self.current_image)
-        self.update_image_display()
+        self.edit_count += 1
+        self.update_image_display(self.history_manager.last_rect)
 
     def save_image(self):
         """이미지 저장"""
@@ -787,7 +873,7 @@ class MainWindow(QMainWindow):
             if image is not None:
                 self.current_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
                 self.update_image_display()
-                self.history_manager.add(self.current_image.copy())
+                self.history_manager.add(self.current_image)
         
     def zoom_in(self):
         self.zoom_level *= 1.2
@@ -799,14 +885,14 @@ class MainWindow(QMainWindow):
         
     def open_camera(self):
         """카메라 다이얼로그 열기"""
-        dialog = CameraDialog(self)
+        dialog = CameraDialog(self, self.camera_source)
         dialog.exec_()
     
     def set_current_image(self, image):
         """카메라로 찍은 이미지 설정"""
         self.current_image = image
         self.update_image_display()
-        self.history_manager.add(self.current_image.copy())
+        self.history_manager.add(self.current_image)
         
     def create_separator(self):
         """구분선 생성"""
@@ -886,6 +972,7 @@ class MainWindow(QMainWindow):
         )
         
         if file_path:
+            self.stop_playback()
             if self.video_processor.load_video(file_path):
                 # 비디오가 로드되면 슬라이더 설정
                 self.frame_slider.setEnabled(True)
@@ -905,49 +992,84 @@ class MainWindow(QMainWindow):
         if not hasattr(self, 'play_timer'):
             self.play_timer = QTimer()
             self.play_timer.timeout.connect(self.play_next_frame)
-            self.is_playing = False
         
         if self.is_playing:
-            self.play_timer.stop()
-            self.is_playing = False
+            self.stop_playback()
         else:
             if self.video_processor.is_loaded():
-                self.play_timer.start(1000 // 30)  # 30 FPS
-                self.is_playing = True
+                self.start_playback(self.current_frame_idx + 1)
+
+    def start_playback(self, start_index):
+        """디코딩/처리는 작업 스레드에서 하고 UI 스레드는 완성된 프레임만 표시"""
+        if self.playback_pipeline is None or self.playback_pipeline.video_processor.file_path != self.video_processor.file_path:
+            self.playback_pipeline = PlaybackPipeline(
+                self.video_processor,
+                chain_func=self.applied_filter_chain,
+                # 확대는 화면에서 보이는 부분만 하므로 축소할 때만 미리 줄임
+                display_scale_func=lambda: min(1.0, self.zoom_level))
+        self.playback_pipeline.fps = self.video_processor.fps
+        # 반복 재생을 끄면 마지막 프레임 뒤에 재생을 멈춤 (기본은 처음부터 다시 재생)
+        self.playback_pipeline.loop = getattr(self, 'loop_enabled', True)
+        self.playback_pipeline.set_speed(self.speed_slider.value() / 100.0 if hasattr(self, 'speed_slider') else 1.0)
+        if start_index >= self.video_processor.get_frame_count():
+            start_index = 0
+        self.playback_pipeline.start(start_index)
+        # 프레임 간격의 절반마다 확인하여 표시 시각을 놓치지 않도록 함
+        self.play_timer.start(max(5, int(500 / (self.video_processor.fps * self.playback_pipeline.speed))))
+        self.is_playing = True
+
+    def stop_playback(self):
+        if hasattr(self, 'play_timer'):
+            self.play_timer.stop()
+        if self.playback_pipeline is not None:
+            self.playback_pipeline.stop()
+        self.is_playing = False
+
+    def applied_filter_chain(self):
+        """현재 적용된 필터들을 하나의 체인으로 묶음 (재생 파이프라인에서 프레임마다 호출)"""
+        chain = FilterChain(
+            filter_obj for filter_obj in list(self.filters.values())
+            if getattr(filter_obj, 'is_applied', False)
+        )
+        return chain if chain.filters else None
     
     def play_next_frame(self):
-        """다 프레임을 재생합니다."""
-        if self.video_processor.is_loaded():
-            self.current_frame_idx += 1
-            if self.current_frame_idx >= self.video_processor.get_frame_count():
-                self.current_frame_idx = 0
-            
-            # 프레임 가져오기
-            frame = self.video_processor.get_frame(self.current_frame_idx)
-            if frame is not None:
-                # 현재 적용된 필터들을 프레임에 적용
-                for filter_name, filter_obj in self.filters.items():
-                    if hasattr(filter_obj, 'is_applied') and filter_obj.is_applied:
-                        frame = filter_obj.apply(frame)
-                
-                self.current_image = frame
-                self.update_image_display()
-            
-            if hasattr(self, 'frame_slider'):
-                self.frame_slider.setValue(self.current_frame_idx)
+        """파이프라인에서 표시할 시각이 된 프레임을 가져와 표시합니다."""
+        result = self.playback_pipeline.take_ready()
+        if result is False:
+            # 영상 끝 (반복 재생하지 않는 경우)
+            self.stop_playback()
+            return
+        if result is None:
+            return
+
+        self.current_frame_idx = result.index
+        self.current_image = result.image
+        self.display_image(result.display)
+
+        if hasattr(self, 'frame_slider'):
+            # 슬라이더 이동으로 frame_changed가 다시 디코딩하지 않도록 시그널 차단
+            self.frame_slider.blockSignals(True)
+            self.frame_slider.setValue(self.current_frame_idx)
+            self.frame_slider.blockSignals(False)
     
     def frame_changed(self, value):
         """프레임 슬레이더 값이 변경 되었을 때 호출됩니."""
         if self.video_processor.is_loaded():
             self.current_frame_idx = value
-            self.show_frame(value)
+            if self.is_playing:
+                # 재생 중에 위치를 옮기면 새 위치부터 파이프라인을 다시 시작
+                self.start_playback(value)
+            else:
+                self.show_frame(value)
     
     def toggle_tracking(self):
         """물체 추적 기능을 켭니다."""
         if self.video_processor.is_loaded():
             is_tracking = self.video_processor.toggle_tracking()
-            # 현 프레임을 다시 표시하여 변경사항 반영
-            self.show_frame(self.current_frame_idx)
+            # 현 프레임을 다시 표시하여 변경사항 반영 (재생 중이면 파이프라인이 반영)
+            if not self.is_playing:
+                self.show_frame(self.current_frame_idx)
             
             # 버튼 상태 업데이트 (선택사)
             sender = self.sender()
@@ -993,9 +1115,10 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "오류", "카메라를 시작할 수 없습니다.")
         else:
             # 카메라 녹화 중지
+            summary = self.screen_recorder.summary()
             self.screen_recorder.stop_camera_recording()
             sender.setText("📹 카메라 녹화")
-            self.statusBar().showMessage("카메라 녹화가 저장되었습니다.")
+            self.statusBar().showMessage(f"카메라 녹화가 저장되었습니다. ({summary})")
             if hasattr(self, 'camera_timer'):
                 self.camera_timer.stop()
 
@@ -1005,6 +1128,12 @@ class MainWindow(QMainWindow):
         if frame is not None:
             self.current_image = frame
             self.update_image_display()
+            if self.screen_recorder.recording:
+                self.statusBar().showMessage(self.screen_recorder.summary())
+
+    def set_record_policy(self, policy):
+        """다음 카메라 녹화부터 적용"""
+        self.screen_recorder.policy = policy
 
     def capture_frame(self):
         """현재 프레임을 이미지로 저장"""
@@ -1033,9 +1162,10 @@ class MainWindow(QMainWindow):
 
     def toggle_loop(self):
         """반복 재생 설정"""
-        if not hasattr(self, 'loop_enabled'):
-            self.loop_enabled = False
-        self.loop_enabled = not self.loop_enabled
+        self.loop_enabled = not getattr(self, 'loop_enabled', True)
+        if self.playback_pipeline is not None:
+            # 재생 중이면 디코딩 스레드가 영상 끝에서 바로 반영
+            self.playback_pipeline.loop = self.loop_enabled
         sender = self.sender()
         if sender:
             sender.setChecked(self.loop_enabled)
@@ -1058,9 +1188,9 @@ class MainWindow(QMainWindow):
         """재생 속도 업데이트"""
         if hasattr(self, 'play_timer'):
             speed = value / 100.0  # 1.0이 정상 속도
-            interval = int(1000 / (30 * speed))  # 30 FPS 기준
             if self.is_playing:
-                self.play_timer.setInterval(interval)
+                self.playback_pipeline.set_speed(speed)
+                self.play_timer.setInterval(max(5, int(500 / (self.video_processor.fps * speed))))
             self.statusBar().showMessage(f"재생 속도: {speed:.2f}x")
 
     def setup_video_tools(self):
@@ -1070,6 +1200,8 @@ class MainWindow(QMainWindow):
             ("⏯️ 재생/일시정지", "비디오 재생 또는 일시정지", self.toggle_play),
             ("👁️ 물체 추적", "물체 추적 켜기/끄기", self.toggle_tracking),
             ("🎯 물체 감지", "물체 감지 켜기/끄기", self.toggle_detection),  # 추가
+            ("⚡ 간격 감지", "N 프레임마다 감지하고 사이 프레임은 광학 흐름으로 상자 이동", self.toggle_interval_detection),
+            ("💾 비디오 내보내기", "필터/추적/감지를 적용한 비디오 저장 (구간을 설정했으면 그 구간만)", self.export_video),
         ]
         
         for text, tooltip, callback in video_tools:
@@ -1095,6 +1227,60 @@ class MainWindow(QMainWindow):
         
         self.tool_layout.addLayout(repeat_layout)
 
+    def export_video(self):
+        """필터/추적/감지를 적용한 비디오를 파일로 저장 (구간을 설정했으면 그 구간만)"""
+        if not self.video_processor.is_loaded():
+            return
+        if self.video_exporter is not None and not self.video_exporter.finished:
+            self.statusBar().showMessage("이미 내보내는 중입니다.")
+            return
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "비디오 내보내기", f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4",
+            "MP4 (*.mp4);;AVI (*.avi)")
+        if not file_path:
+            return
+
+        start = getattr(self, 'start_point', None)
+        end = getattr(self, 'end_point', None)
+        if start is not None and end is not None and start > end:
+            start, end = end, start
+        filters = [filter_obj for filter_obj in self.filters.values() if getattr(filter_obj, 'is_applied', False)]
+        self.video_exporter = VideoExporter(
+            self.video_processor, file_path, filters, start, end,
+            track=self.video_processor.tracking_enabled,
+            detect=self.video_processor.object_detector.is_detecting)
+
+        self.export_dialog = QProgressDialog("비디오 내보내는 중...", "취소", 0, self.video_exporter.total, self)
+        self.export_dialog.setWindowTitle("비디오 내보내기")
+        self.export_dialog.setWindowModality(Qt.WindowModal)
+        self.export_dialog.setAutoClose(False)
+        self.export_dialog.setAutoReset(False)
+        self.export_dialog.canceled.connect(self.video_exporter.cancel)
+        self.export_dialog.show()
+        threading.Thread(target=self.video_exporter.run, daemon=True).start()
+        self.export_timer.start(200)
+
+    def update_export_progress(self):
+        exporter = self.video_exporter
+        done, total, eta = exporter.progress()
+        self.export_dialog.setMaximum(max(1, total))
+        self.export_dialog.setValue(done)
+        eta_text = f" | 남은 시간 약 {int(eta) // 60}분 {int(eta) % 60}초" if eta is not None else ""
+        self.export_dialog.setLabelText(f"비디오 내보내는 중... {done}/{total} 프레임{eta_text}")
+        if not exporter.finished:
+            return
+
+        self.export_timer.stop()
+        self.export_dialog.canceled.disconnect()
+        self.export_dialog.close()
+        self.export_dialog = None
+        if exporter.error:
+            QMessageBox.warning(self, "오류", f"비디오 내보내기 실패: {exporter.error}")
+        elif exporter.cancelled.is_set():
+            self.statusBar().showMessage("비디오 내보내기를 취소했습니다.")
+        else:
+            self.statusBar().showMessage(f"{done}프레임을 저장했습니다: {exporter.output_path}")
+
     def set_repeat_start(self):
         """구간 반복 시작점 설정"""
         self.start_point = self.current_frame_idx
@@ -1115,10 +1301,102 @@ class MainWindow(QMainWindow):
         """물체 감지 기능을 켭니다."""
         if self.video_processor.is_loaded():
             is_detecting = self.video_processor.toggle_detection()
-            # 현재 프레임을 다시 표시하여 변경사항 반영
-            self.show_frame(self.current_frame_idx)
+            if not is_detecting and self.video_processor.object_detector.net is None:
+                self.statusBar().showMessage("물체 감지 모델을 불러오지 못했습니다.")
+            # 현재 프레임을 다시 표시하여 변경사항 반영 (재생 중이면 파이프라인이 반영)
+            if not self.is_playing:
+                self.show_frame(self.current_frame_idx)
             
+            if is_detecting:
+                self.detection_timer.start(250)
+            else:
+                self.detection_timer.stop()
+                self.detection_label.clear()
+
             # 버튼 상태 업데이트
             sender = self.sender()
             if sender:
-                sender.setChecked(is_detecting)
\ No newline at end of file
+                sender.setChecked(is_detecting)
+
+    def toggle_interval_detection(self):
+        """간격 감지 방식 켜기/끄기"""
+        is_interval = self.video_processor.toggle_interval_detection()
+        if self.video_processor.is_loaded() and not self.is_playing:
+            self.show_frame(self.current_frame_idx)
+        self.statusBar().showMessage(f"간격 감지: {'켜짐' if is_interval else '꺼짐'}")
+
+    def update_detection_status(self):
+        self.detection_label.setText(self.video_processor.detection_summary())
+        # 일시정지 중에는 현재 프레임의 감지가 끝나면 결과를 그려서 다시 표시
+        result = self.video_processor.detection_worker.latest()
+        if (self.video_processor.detection_mode == 'async' and not self.is_playing
+                and result is not None and result.index == self.current_frame_idx
+                and self.video_processor.drawn_detection_index != self.current_frame_idx):
+            self.show_frame(self.current_frame_idx)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 첫 화면을 그린 뒤에 시작하도록 이벤트 루프로 넘김
+        if self.warm_up_models and not self.warm_up_started:
+            QTimer.singleShot(0, self.start_model_warm_up)
+
+    def set_warm_up_models(self, enabled):
+        self.warm_up_models = enabled
+        self.settings.setValue('warm_up_models', enabled)
+        if enabled and self.isVisible():
+            self.start_model_warm_up()
+
+    def start_model_warm_up(self):
+        """물체 감지 모델과 SIFT 검출기를 백그라운드 스레드에서 미리 준비"""
+        if self.warm_up_started:
+            return
+        self.warm_up_started = True
+        threading.Thread(target=self.warm_up_task, daemon=True).start()
+
+    def warm_up_task(self):
+        try:
+            self.video_processor.object_detector.warm_up()
+            self.panorama_tool.load()
+        except Exception as e:
+            print(f"모델 미리 불러오기 실패: {e}")
+
+    def toggle_profiling(self, enabled):
+        """필터/도구/화면 갱신/비디오 프레임 처리 시간 측정 켜기/끄기"""
+        if enabled:
+            profiler.enable()
+            self.profile_timer.start(500)
+            self.profile_label.setText("측정 중")
+        else:
+            profiler.disable()
+            self.profile_timer.stop()
+            self.profile_label.clear()
+
+    def update_profile_status(self):
+        text = profiler.summary()
+        if self.is_playing:
+            text += "  ||  " + self.playback_pipeline.summary()
+        self.profile_label.setText(text)
+
+    def show_filter_cache_stats(self):
+        """필터 결과 캐시의 적중률과 메모리 사용량 표시"""
+        stats = self.filter_cache.stats()
+        self.statusBar().showMessage(
+            f"필터 캐시: 적중 {stats['hits']} (디스크 {stats['disk_hits']}) / 실패 {stats['misses']} "
+            f"({stats['hit_rate'] * 100:.0f}%) | {stats['entries']}개, "
+            f"{stats['bytes'] / 2**20:.0f}/{stats['max_bytes'] / 2**20:.0f} MB | 제거 {stats['evictions']}")
+
+    def export_profile_trace(self):
+        """측정 기록을 Chrome 트레이스(JSON)로 저장"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "트레이스 저장", f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            "Chrome Trace (*.json)")
+        if file_path:
+            try:
+                count = profiler.export_chrome_trace(file_path)
+                self.statusBar().showMessage(f"{count}개 기록을 저장했습니다: {file_path}")
+            except OSError as e:
+                QMessageBox.warning(self, "오류", f"트레이스 저장 실패: {e}")
+
+
+# 성능 측정을 켜면 화면 갱신 시간을 기록
+profiler.register(MainWindow, ['update_image_display'], 'display')
@@ -1,7 +1,23 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import QMenu
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QTimer, QObject, pyqtSignal
+import cv2
+
+class RenderSignals(QObject):
+    """작업 스레드에서 UI 스레드로 렌더링 결과를 전달하는 시그널"""
+    preview_ready = pyqtSignal(int, object)
+    full_ready = pyqtSignal(object, object, object)
+    failed = pyqtSignal(str)
 
 class PreviewMenu(QMenu):
+    """
+    필터 메뉴 미리보기
+    - 마우스를 올리면 화면 표시 크기로 줄인 축소본에 필터를 적용해 미리 보여줌
+    - 항목을 선택(mouseReleaseEvent)했을 때만 원본 해상도로 백그라운드 렌더링 후 교체
+    모든 필터 연산은 작업 스레드에서 실행되므로 UI 스레드를 막지 않습니다.
+    미리보기는 작업자 하나가 가장 최근 요청만 계산합니다. (항목을 빠르게 지나가도 계산이 쌓이지 않음)
+    """
     def __init__(self, parent=None):
         super().__init__(parent)
         self.main_window = parent
@@ -10,44 +26,145 @@ class PreviewMenu(QMenu):
         self.preview_timer.timeout.connect(self.apply_preview)
         self.current_action = None
         self.original_image = None
-        
+        self.proxy_image = None
+        # 가장 최근 미리보기 요청 번호 (이전 요청의 결과는 버림)
+        self.preview_generation = 0
+        self.preview_executor = ThreadPoolExecutor(max_workers=1)
+        # 작업자가 아직 가져가지 않은 미리보기 요청 (새 요청이 오면 덮어씀)
+        self.preview_request = None
+        self.preview_lock = threading.Lock()
+
+        self.signals = RenderSignals()
+        self.signals.preview_ready.connect(self.on_preview_ready)
+        self.signals.full_ready.connect(self.on_full_ready)
+        self.signals.failed.connect(self.main_window.statusBar().showMessage)
+
         # 메뉴 항목에 마우스가 올라갈 때의 이벤트 연결
         self.hovered.connect(self.on_action_hovered)
-        
+
     def on_action_hovered(self, action):
         self.current_action = action
-        # 원본 이미지 저장
+        # 원본 이미지와 화면 크기 축소본 준비 (메뉴가 열려 있는 동안 한 번만)
         if self.original_image is None:
-            self.original_image = self.main_window.current_image.copy()
+            self.original_image = self.main_window.current_image
+            self.proxy_image = self.make_proxy(self.original_image)
         # 미리보기 타이머 재시작
         self.preview_timer.start(100)  # 100ms 후에 미리보기 적용
-    
+
+    def make_proxy(self, image):
+        """화면에 표시되는 크기로 줄인 미리보기용 이미지 (확대 중이면 원본 해상도)"""
+        height, width = image.shape[:2]
+        display_width, display_height = self.main_window.display_size()
+        if display_width >= width or display_height >= height:
+            return image
+        return cv2.resize(image, (max(1, display_width), max(1, display_height)),
+                          interpolation=cv2.INTER_AREA)
+
+    def get_filter(self, action):
+        if action and hasattr(action, 'filter_name'):
+            return self.main_window.filters.get(action.filter_name)
+        return None
+
     def apply_preview(self):
-        if self.current_action and hasattr(self.current_action, 'filter_name'):
-            filter_name = self.current_action.filter_name
-            if filter_name in self.main_window.filters:
-                # ���리보기 적용
-                preview_image = self.main_window.filters[filter_name].toggle(self.original_image.copy())
-                self.main_window.current_image = preview_image
-                self.main_window.update_image_display()
-    
+        filter_obj = self.get_filter(self.current_action)
+        if filter_obj is None or self.proxy_image is None:
+            return
+
+        self.preview_generation += 1
+        with self.preview_lock:
+            queued = self.preview_request is not None
+            self.preview_request = (self.preview_generation, filter_obj, self.proxy_image)
+        # 이미 대기 중인 작업이 있으면 그 작업이 바뀐 요청을 가져감
+        if not queued:
+            self.preview_executor.submit(self.render_preview)
+
+    def render_preview(self):
+        """작업 스레드: 가장 최근 미리보기 요청만 계산"""
+        with self.preview_lock:
+            request, self.preview_request = self.preview_request, None
+        if request is None:
+            return
+        generation, filter_obj, proxy = request
+        # 메뉴가 닫혔거나 항목을 선택했으면 계산하지 않음
+        if generation != self.preview_generation:
+            return
+        try:
+            result = self.cached_apply(filter_obj, proxy)
+        except Exception as e:
+            self.signals.failed.emit(f"미리보기 실패: {e}")
+            return
+        # 계산하는 동안 더 새로운 요청이 들어왔으면 버림
+        if generation == self.preview_generation:
+            self.signals.preview_ready.emit(generation, result)
+
+    def on_preview_ready(self, generation, image):
+        # 메뉴가 닫혔거나 다른 항목으로 이동한 뒤 도착한 결과는 무시
+        if generation != self.preview_generation or self.original_image is None:
+            return
+        self.main_window.display_image(image)
+
     def mouseReleaseEvent(self, event):
         # 메뉴 항목 선택 시
         action = self.activeAction()
-        if action and hasattr(action, 'filter_name'):
-            filter_name = action.filter_name
-            if filter_name in self.main_window.filters:
-                # 필터 적용 및 히스토리에 추가
-                self.main_window.current_image = self.main_window.filters[filter_name].toggle(self.original_image.copy())
+        filter_obj = self.get_filter(action)
+        if filter_obj is not None and self.original_image is not None:
+            # 진행 중인 미리보기 결과는 더 이상 표시하지 않음
+            self.preview_generation += 1
+            if filter_obj.is_applied:
+                # 이미 적용된 필터는 해제만 하면 되므로 바로 처리
+                filter_obj.is_applied = False
                 self.main_window.update_image_display()
-                self.main_window.history_manager.add(self.main_window.current_image.copy())
+            else:
+                self.start_full_render(filter_obj, self.original_image)
         self.original_image = None  # 원본 이미지 참조 제거
+        self.proxy_image = None
         super().mouseReleaseEvent(event)
 
+    def start_full_render(self, filter_obj, source):
+        """원본 해상도 렌더링을 백그라운드에서 시작합니다."""
+        image = source.copy()
+        # 렌더링 중에 이미지를 제자리에서 고쳤는지 확인하기 위한 편집 횟수
+        self.full_render_edit_count = getattr(self.main_window, 'edit_count', 0)
+
+        def render():
+            try:
+                result = self.cached_apply(filter_obj, image)
+            except Exception as e:
+                self.signals.failed.emit(f"필터 적용 실패: {e}")
+                return
+            self.signals.full_ready.emit(filter_obj, source, result)
+
+        threading.Thread(target=render, daemon=True).start()
+        self.main_window.statusBar().showMessage("필터 적용 중...")
+
+    def cached_apply(self, filter_obj, image):
+        """메인 윈도우의 결과 캐시와 타일 실행기를 거쳐 필터 적용"""
+        executor = getattr(self.main_window, 'tiled_executor', None)
+        cache = getattr(self.main_window, 'filter_cache', None)
+        if cache is not None:
+            return cache.apply(filter_obj, image, executor=executor)
+        if executor is not None:
+            return executor.run(filter_obj, image)
+        return filter_obj.apply(image)
+
+    def on_full_ready(self, filter_obj, source, result):
+        # 렌더링 중에 이미지가 바뀌었다면 결과를 버림
+        if (self.main_window.current_image is not source
+                or getattr(self.main_window, 'edit_count', 0) != self.full_render_edit_count):
+            self.main_window.statusBar().showMessage("이미지가 변경되어 필터 결과를 버렸습니다.")
+            return
+        filter_obj.is_applied = True
+        self.main_window.current_image = result
+        self.main_window.update_image_display()
+        self.main_window.history_manager.add(self.main_window.current_image)
+        self.main_window.statusBar().clearMessage()
+
     def hideEvent(self, event):
-        # 메뉴가 닫힐 때 원본 이미지 복원
-        if self.original_image is not None and not self.activeAction():
-            self.main_window.current_image = self.original_image
+        # 메뉴가 닫힐 때 미리보기를 지우고 현재 이미지를 다시 표시
+        self.preview_timer.stop()
+        self.preview_generation += 1
+        if self.original_image is not None:
             self.main_window.update_image_display()
         self.original_image = None
-        super().hideEvent(event) 
\ No newline at end of file
+        self.proxy_image = None
+        super().hideEvent(event)